@@ -0,0 +1,249 @@
+import argparse
+import json
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+import graph_1
+import graph_protocol
+
+
+# Cada representação: (fábrica do adaptador, maior V suportado, maior E suportado).
+# Os limites evitam casos que não terminam em tempo razoável (matriz V² em
+# lista de listas, lista de arestas simples com busca linear por aresta).
+REPRESENTACOES: Dict[str, Tuple[Callable[[], graph_protocol.Graph], int, int]] = {
+    'lista_adjacencia': (lambda: graph_protocol.AdjacencyListGraph(), 10 ** 6, 10 ** 7),
+    'lista_adjacencia_hash': (lambda: graph_protocol.AdjacencyListGraph(graph_1.create_graph(hash_adjacencia=True)), 10 ** 6, 10 ** 7),
+    'matriz_lista': (lambda: graph_protocol.AdjacencyMatrixGraph(formato="lista"), 3000, 10 ** 6),
+    'matriz_compacta': (lambda: graph_protocol.AdjacencyMatrixGraph(formato="compacta"), 10 ** 4, 10 ** 6),
+    'matriz_bits': (lambda: graph_protocol.AdjacencyMatrixGraph(formato="bits"), 3 * 10 ** 4, 10 ** 6),
+    'lista_arestas': (lambda: graph_protocol.EdgeListGraph(indexado=False), 10 ** 6, 2 * 10 ** 4),
+    'lista_arestas_hash': (lambda: graph_protocol.EdgeListGraph(indexado=True), 10 ** 6, 10 ** 7),
+    'lista_arestas_compacta': (lambda: graph_protocol.EdgeListGraph(compacto=True), 10 ** 6, 10 ** 7),
+}
+
+OPERACOES = ['insert_vertex', 'insert_edge', 'edge_exists', 'neighbors', 'vertex_degrees',
+             'valid_path', 'remove_edge', 'remove_vertex']
+
+
+def sparse_graph(num_vertices: int, grau_medio: float, semente: int) -> List[Tuple[str, str]]:
+    """Grafo aleatório esparso (Erdős–Rényi G(n, m)) com ~grau_medio arestas por vértice."""
+    aleatorio = random.Random(semente)
+    num_arestas = int(num_vertices * grau_medio)
+    return [(f"v{aleatorio.randrange(num_vertices)}", f"v{aleatorio.randrange(num_vertices)}")
+            for _ in range(num_arestas)]
+
+
+def dense_graph(num_vertices: int, densidade: float, semente: int) -> List[Tuple[str, str]]:
+    """Grafo aleatório denso (G(n, p)): cada par ordenado é aresta com probabilidade 'densidade'."""
+    aleatorio = random.Random(semente)
+    return [(f"v{i}", f"v{j}") for i in range(num_vertices) for j in range(num_vertices)
+            if aleatorio.random() < densidade]
+
+
+def power_law_graph(num_vertices: int, arestas_por_vertice: int, semente: int) -> List[Tuple[str, str]]:
+    """Grafo com graus em lei de potência (anexação preferencial de Barabási–Albert)."""
+    aleatorio = random.Random(semente)
+    arestas = []
+    alvos: List[int] = list(range(min(arestas_por_vertice, num_vertices)))
+    for v in range(len(alvos), num_vertices):
+        escolhidos = {aleatorio.choice(alvos) for _ in range(arestas_por_vertice)}
+        for u in escolhidos:
+            arestas.append((f"v{v}", f"v{u}"))
+            alvos.append(u)
+        alvos.append(v)
+    return arestas
+
+
+GERADORES = {
+    'esparso': lambda n, semente: sparse_graph(n, 4, semente),
+    'denso': lambda n, semente: dense_graph(n, 0.5, semente),
+    'lei_de_potencia': lambda n, semente: power_law_graph(n, 3, semente),
+}
+
+# Número esperado de arestas de cada gerador para V vértices, usado para
+# pular um caso antes de gerar as arestas (o gerador denso faz V² sorteios).
+ARESTAS_ESPERADAS = {
+    'esparso': lambda n: 4 * n,
+    'denso': lambda n: n * n // 2,
+    'lei_de_potencia': lambda n: 3 * n,
+}
+
+
+def _build(fabrica, num_vertices: int, arestas: List[Tuple[str, str]]) -> graph_protocol.Graph:
+    """Função auxiliar: cria o grafo com todos os vértices e arestas."""
+    grafo = fabrica()
+    for v in range(num_vertices):
+        grafo.insert_vertex(f"v{v}")
+    for origem, destino in arestas:
+        grafo.insert_edge(origem, destino)
+    return grafo
+
+
+def _time(funcao: Callable[[], object], repeticoes: int) -> Dict[str, float]:
+    """Função auxiliar: tempo total e por operação (em microssegundos) de 'repeticoes' chamadas."""
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    total = time.perf_counter() - inicio
+    return {'segundos': total, 'us_por_op': 1e6 * total / max(1, repeticoes), 'operacoes': repeticoes}
+
+
+def _skip_reason(representacao: str, num_vertices: int, num_arestas: int) -> Optional[str]:
+    """Função auxiliar: motivo para pular o caso, ou None se ele cabe nos limites da representação."""
+    _, max_vertices, max_arestas = REPRESENTACOES[representacao]
+    if num_vertices > max_vertices or num_arestas > max_arestas:
+        return f"acima do limite da representação (V <= {max_vertices}, E <= {max_arestas})"
+    return None
+
+
+def run_case(representacao: str, gerador: str, num_vertices: int, semente: int = 42,
+             consultas: int = 1000, arestas: Optional[List[Tuple[str, str]]] = None) -> Dict[str, object]:
+    """
+    Mede uma combinação (representação, gerador, V).
+
+    Passos:
+    1. Pular o caso, sem gerar nada, se V ou o número esperado de arestas
+       passar dos limites da representação.
+    2. Gerar as arestas com a semente fixa (mesma entrada para todas as
+       representações), a menos que já venham prontas em 'arestas'.
+    3. Medir o pico de memória da construção com tracemalloc.
+    4. Construir de novo sem tracemalloc e medir cada operação pública,
+       com 'consultas' chamadas sobre vértices/arestas sorteados com a mesma semente.
+    """
+    fabrica = REPRESENTACOES[representacao][0]
+    resultado: Dict[str, object] = {'representacao': representacao, 'gerador': gerador,
+                                    'vertices': num_vertices}
+    motivo = _skip_reason(representacao, num_vertices, ARESTAS_ESPERADAS[gerador](num_vertices))
+    if motivo is None:
+        if arestas is None:
+            arestas = GERADORES[gerador](num_vertices, semente)
+        resultado['arestas'] = len(arestas)
+        motivo = _skip_reason(representacao, num_vertices, len(arestas))
+    if motivo is not None:
+        resultado['pulado'] = motivo
+        return resultado
+
+    tracemalloc.start()
+    _build(fabrica, num_vertices, arestas)
+    resultado['pico_memoria_bytes'] = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    aleatorio = random.Random(semente)
+    operacoes: Dict[str, Dict[str, float]] = {}
+
+    inicio = time.perf_counter()
+    grafo = _build(fabrica, num_vertices, arestas)
+    operacoes['construcao'] = {'segundos': time.perf_counter() - inicio}
+
+    nomes = [f"v{aleatorio.randrange(num_vertices)}" for _ in range(consultas)]
+    pares = [(f"v{aleatorio.randrange(num_vertices)}", f"v{aleatorio.randrange(num_vertices)}") for _ in range(consultas)]
+    caminhos = [[f"v{aleatorio.randrange(num_vertices)}" for _ in range(4)] for _ in range(consultas)]
+    amostra = aleatorio.sample(arestas, min(consultas, len(arestas)))
+    iteradores = {
+        'nomes': iter(nomes), 'pares': iter(pares), 'caminhos': iter(caminhos), 'amostra': iter(amostra),
+        'novos': iter(f"novo{k}" for k in range(consultas)),
+        'removidos': iter(dict.fromkeys(nomes)),
+    }
+
+    operacoes['insert_vertex'] = _time(lambda: grafo.insert_vertex(next(iteradores['novos'])), consultas)
+    operacoes['insert_edge'] = _time(lambda: grafo.insert_edge(*next(iteradores['pares'])), consultas)
+    operacoes['edge_exists'] = _time(lambda: grafo.edge_exists(*aleatorio.choice(pares)), consultas)
+    operacoes['neighbors'] = _time(lambda: grafo.neighbors(next(iteradores['nomes'])), consultas)
+    operacoes['vertex_degrees'] = _time(grafo.vertex_degrees, 3)
+    operacoes['valid_path'] = _time(lambda: grafo.valid_path(next(iteradores['caminhos'])), consultas)
+    operacoes['remove_edge'] = _time(lambda: grafo.remove_edge(*next(iteradores['amostra'])), len(amostra))
+    removidos = min(len(set(nomes)), max(1, consultas // 10))
+    operacoes['remove_vertex'] = _time(lambda: grafo.remove_vertex(next(iteradores['removidos'])), removidos)
+
+    resultado['operacoes'] = operacoes
+    return resultado
+
+
+def run_suite(tamanhos: List[int], representacoes: Optional[List[str]] = None,
+              geradores: Optional[List[str]] = None, semente: int = 42, consultas: int = 1000,
+              progresso: bool = True) -> Dict[str, object]:
+    """Executa todas as combinações e retorna o relatório (serializável em JSON)."""
+    casos = []
+    for gerador in geradores or list(GERADORES):
+        for num_vertices in tamanhos:
+            escolhidas = representacoes or list(REPRESENTACOES)
+            esperadas = ARESTAS_ESPERADAS[gerador](num_vertices)
+            # as arestas são geradas uma vez por (gerador, V) e reaproveitadas
+            # por todas as representações, e só se alguma delas comportar o caso
+            arestas = None
+            if any(_skip_reason(r, num_vertices, esperadas) is None for r in escolhidas):
+                arestas = GERADORES[gerador](num_vertices, semente)
+            for representacao in escolhidas:
+                if progresso:
+                    print(f"{gerador:>16} V={num_vertices:<8} {representacao}", file=sys.stderr)
+                casos.append(run_case(representacao, gerador, num_vertices, semente, consultas, arestas))
+    return {'semente': semente, 'consultas': consultas, 'python': sys.version.split()[0], 'casos': casos}
+
+
+def compare(relatorio: Dict[str, object], base: Dict[str, object], tolerancia: float = 0.25) -> List[str]:
+    """
+    Compara um relatório com um baseline salvo.
+    Retorna uma linha por operação cujo tempo por operação (ou pico de
+    memória) piorou mais que 'tolerancia' (0.25 = 25%).
+    """
+    def chave(caso):
+        return caso['representacao'], caso['gerador'], caso['vertices']
+
+    anteriores = {chave(caso): caso for caso in base['casos']}
+    regressoes = []
+    for caso in relatorio['casos']:
+        anterior = anteriores.get(chave(caso))
+        if anterior is None or 'operacoes' not in caso or 'operacoes' not in anterior:
+            continue
+        nome = '/'.join(map(str, chave(caso)))
+        for operacao, medida in caso['operacoes'].items():
+            antes = anterior['operacoes'].get(operacao, {}).get('us_por_op')
+            agora = medida.get('us_por_op')
+            if antes and agora and agora > antes * (1 + tolerancia):
+                regressoes.append(f"{nome} {operacao}: {antes:.2f}us -> {agora:.2f}us")
+        antes = anterior.get('pico_memoria_bytes')
+        agora = caso.get('pico_memoria_bytes')
+        if antes and agora and agora > antes * (1 + tolerancia):
+            regressoes.append(f"{nome} memoria: {antes} -> {agora} bytes")
+    return regressoes
+
+
+def main():
+    """
+    Linha de comando:
+        python benchmark.py --tamanhos 100 1000 --saida resultado.json
+        python benchmark.py --base resultado.json     (sai com código 1 se houver regressão)
+    """
+    parser = argparse.ArgumentParser(description="Benchmark das representações de grafo.")
+    parser.add_argument('--tamanhos', type=int, nargs='+', default=[100, 1000])
+    parser.add_argument('--representacoes', nargs='+', choices=list(REPRESENTACOES))
+    parser.add_argument('--geradores', nargs='+', choices=list(GERADORES))
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--consultas', type=int, default=1000)
+    parser.add_argument('--saida', help="arquivo JSON para gravar o relatório")
+    parser.add_argument('--base', help="relatório JSON anterior para detectar regressões")
+    parser.add_argument('--tolerancia', type=float, default=0.25)
+    args = parser.parse_args()
+
+    relatorio = run_suite(args.tamanhos, args.representacoes, args.geradores, args.semente, args.consultas)
+    texto = json.dumps(relatorio, indent=2)
+    if args.saida:
+        with open(args.saida, 'w') as arquivo:
+            arquivo.write(texto)
+    else:
+        print(texto)
+
+    if args.base:
+        with open(args.base) as arquivo:
+            regressoes = compare(relatorio, json.load(arquivo), args.tolerancia)
+        for linha in regressoes:
+            print(f"REGRESSÃO: {linha}", file=sys.stderr)
+        if regressoes:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,48 +1,220 @@
-def create_graph():
+class HashGraph(dict):
+    """
+    Grafo (dict) cujas adjacências são dicts ordenados {vizinho: multiplicidade}.
+    Pertinência e remoção de arestas passam a custar O(1), e a ordem de
+    inserção dos vizinhos é preservada. Com multigrafo=False, arestas
+    repetidas são ignoradas; com multigrafo=True, a multiplicidade é contada.
+    """
+    multigrafo = False
+
+
+def create_graph(hash_adjacencia=False, multigrafo=False):
     """
     Retorna um novo grafo vazio.
     Passos:
     1. Criar um dicionário vazio: {}
+       - se hash_adjacencia=True, criar um HashGraph (adjacência em dicts ordenados)
     2. Retornar o dicionário (representa o grafo)
     """
+    if hash_adjacencia:
+        grafo = HashGraph()
+        grafo.multigrafo = multigrafo
+        return grafo
+
     grafo = dict()
     return grafo
 
 
-def insert_vertex(grafo: dict, vertice: str):
+def _new_adjacency(grafo):
+    """Função auxiliar: cria o contêiner de vizinhos adequado ao tipo do grafo."""
+    if isinstance(grafo, HashGraph):
+        return {}
+    return []
+
+
+def _add_neighbor(adjacencia, vizinho, multiplicidade=True):
+    """
+    Função auxiliar: adiciona 'vizinho' ao contêiner (lista ou dict).
+    Retorna True se uma nova aresta foi registrada.
+    """
+    if isinstance(adjacencia, dict):
+        if vizinho in adjacencia:
+            if not multiplicidade:
+                return False
+            adjacencia[vizinho] += 1
+        else:
+            adjacencia[vizinho] = 1
+        return True
+
+    adjacencia.append(vizinho)
+    return True
+
+
+def _remove_neighbor(adjacencia, vizinho, todas=False):
+    """
+    Função auxiliar: remove uma ocorrência de 'vizinho' do contêiner
+    (ou todas, se todas=True). Retorna quantas foram removidas.
+    """
+    if vizinho not in adjacencia:
+        return 0
+
+    if isinstance(adjacencia, dict):
+        if todas or adjacencia[vizinho] == 1:
+            return adjacencia.pop(vizinho)
+        adjacencia[vizinho] -= 1
+        return 1
+
+    if todas:
+        removidas = adjacencia.count(vizinho)
+        adjacencia[:] = [v for v in adjacencia if v != vizinho]
+        return removidas
+    adjacencia.remove(vizinho)
+    return 1
+
+
+def _remove_neighbors(adjacencia, vizinhos):
+    """
+    Função auxiliar: remove do contêiner todas as arestas para qualquer um
+    dos 'vizinhos' (um set). Retorna quantas foram removidas.
+    """
+    if isinstance(adjacencia, dict):
+        return sum(adjacencia.pop(vizinho) for vizinho in vizinhos & adjacencia.keys())
+
+    mantidos = [vizinho for vizinho in adjacencia if vizinho not in vizinhos]
+    removidas = len(adjacencia) - len(mantidos)
+    adjacencia[:] = mantidos
+    return removidas
+
+
+def _count_neighbor(adjacencia, vizinho):
+    """Função auxiliar: número de arestas para 'vizinho' no contêiner."""
+    if isinstance(adjacencia, dict):
+        return adjacencia.get(vizinho, 0)
+    return adjacencia.count(vizinho)
+
+
+def _adjacency_size(adjacencia):
+    """Função auxiliar: número de arestas (com multiplicidade) no contêiner."""
+    if isinstance(adjacencia, dict):
+        return sum(adjacencia.values())
+    return len(adjacencia)
+
+
+def _adjacency_list(adjacencia):
+    """Função auxiliar: contêiner como lista, repetindo vizinhos com multiplicidade > 1."""
+    if isinstance(adjacencia, dict):
+        return [vizinho for vizinho, n in adjacencia.items() for _ in range(n)]
+    return adjacencia
+
+
+def create_degree_index(grafo: dict):
+    """
+    Constrói um índice de graus {vertice: {'in': x, 'out': y}} para o grafo.
+    O índice é opcional: passado como 'graus' para as funções de inserção e
+    remoção, ele é mantido atualizado a cada operação.
+    Passos:
+    1. Inicializar in = 0 e out = número de arestas que saem de cada vértice.
+    2. Para cada vizinho de cada vértice, somar ao grau de entrada dele.
+    3. Retornar o índice (custo O(V + E)).
+    """
+    graus = {}
+    for vertice in grafo:
+        graus[vertice] = {'in': 0, 'out': _adjacency_size(grafo[vertice])}
+
+    for vertice in grafo:
+        for vizinho in _adjacency_list(grafo[vertice]):
+            if vizinho in graus:
+                graus[vizinho]['in'] += 1
+
+    return graus
+
+
+def create_predecessor_index(grafo: dict):
+    """
+    Constrói o índice reverso {vertice: [predecessores]} do grafo.
+    Cada predecessor aparece uma vez por aresta (como nas listas de vizinhos);
+    em um HashGraph o índice usa dicts {predecessor: multiplicidade}.
+    O índice é opcional: passado como 'predecessores' para as funções de
+    inserção e remoção, ele é mantido junto com as listas de sucessores.
+    Passos:
+    1. Criar um contêiner vazio para cada vértice.
+    2. Para cada aresta u -> v, adicionar u no contêiner de v.
+    3. Retornar o índice (custo O(V + E)).
+    """
+    predecessores = {}
+    for vertice in grafo:
+        predecessores[vertice] = _new_adjacency(grafo)
+
+    for vertice in grafo:
+        for vizinho in _adjacency_list(grafo[vertice]):
+            if vizinho in predecessores:
+                _add_neighbor(predecessores[vizinho], vertice)
+
+    return predecessores
+
+
+def insert_vertex(grafo: dict, vertice: str, graus=None, predecessores=None, componentes=None):
     """
     Insere um vértice no grafo, sem arestas iniciais.
     Passos:
     1. Verificar se 'vertice' já é chave em grafo.
-    2. Se não for, criar entrada grafo[vertice] = []
+    2. Se não for, criar entrada grafo[vertice] = [] (ou {} em um HashGraph)
+       - se houver índice de graus, criar graus[vertice] zerado
+       - se houver índice de predecessores, criar seu contêiner vazio
+       - se houver union-find de componentes, registrar o vértice
     3. Se já existir, não fazer nada (ou avisar)
     """
     if vertice not in grafo:
-        grafo[vertice] = []
+        grafo[vertice] = _new_adjacency(grafo)
+        if graus is not None:
+            graus[vertice] = {'in': 0, 'out': 0}
+        if predecessores is not None:
+            predecessores[vertice] = _new_adjacency(grafo)
+        if componentes is not None:
+            componentes.track_vertex(vertice)
     else:
         print(f"O vértice {vertice} já existe no grafo.")
 
     return grafo
 
 
-def insert_edge(grafo: dict, origem: str, destino: str, nao_direcionado=False):
+def insert_edge(grafo: dict, origem: str, destino: str, nao_direcionado=False, graus=None, predecessores=None, componentes=None):
     """
     Adiciona aresta entre origem e destino.
     Passos:
     1. Garantir que 'origem' e 'destino' existam no grafo (inserir se necessário).
     2. adicionar destino como vizinho de origem (append).
+       - em um HashGraph que não é multigrafo, uma aresta repetida é ignorada
     3. Se for Nâo Direcionado, também:
          - adicionar origem como vizinho de destino
+    4. Se houver índice de graus, atualizar out da origem e in do destino.
+    5. Se houver índice de predecessores, registrar a origem como predecessor
+       do destino (e o inverso, se não direcionado).
+    6. Se houver union-find de componentes, unir origem e destino.
     """
 
     if origem not in grafo:
-        insert_vertex(grafo, origem)
+        insert_vertex(grafo, origem, graus, predecessores, componentes)
     if destino not in grafo:
-        insert_vertex(grafo, destino)
-        
-    grafo[origem].append(destino)
+        insert_vertex(grafo, destino, graus, predecessores, componentes)
+    if componentes is not None:
+        componentes.track_edge(origem, destino)
+
+    multiplicidade = getattr(grafo, 'multigrafo', True)
+
+    if _add_neighbor(grafo[origem], destino, multiplicidade):
+        if graus is not None:
+            graus[origem]['out'] += 1
+            graus[destino]['in'] += 1
+        if predecessores is not None:
+            _add_neighbor(predecessores[destino], origem)
     if nao_direcionado:
-        grafo[destino].append(origem)
+        if _add_neighbor(grafo[destino], origem, multiplicidade):
+            if graus is not None:
+                graus[destino]['out'] += 1
+                graus[origem]['in'] += 1
+            if predecessores is not None:
+                _add_neighbor(predecessores[origem], destino)
 
     return grafo
 
@@ -52,10 +224,13 @@ def neighbors(grafo: dict, vertice: str):
     Retorna a lista de vizinhos de 'vertice'.
     Passos:
     1. Se 'vertice' estiver em grafo, retornar grafo[vertice] (lista).
+       - em um HashGraph, retornar os vizinhos na ordem de inserção
     2. Se não existir, retornar lista vazia ou sinalizar erro.
     """
 
     if vertice in grafo:
+        if isinstance(grafo[vertice], dict):
+            return list(grafo[vertice])
         return grafo[vertice]
     else:
         return []
@@ -84,10 +259,10 @@ def show_graph(grafo: dict):
          - imprimir: vertice -> vizinhos
     """
     for vertice in grafo:
-        print(f"{vertice} -> {grafo[vertice]}")
+        print(f"{vertice} -> {_adjacency_list(grafo[vertice])}")
 
 
-def remove_edge(grafo: dict, origem: str, destino: str, nao_direcionado=False):
+def remove_edge(grafo: dict, origem: str, destino: str, nao_direcionado=False, graus=None, predecessores=None, componentes=None):
     """
     Remove a aresta entre origem e destino.
     Passos:
@@ -95,77 +270,205 @@ def remove_edge(grafo: dict, origem: str, destino: str, nao_direcionado=False):
     2. Se destino estiver em grafo[origem], remover essa ocorrência.
     3. Se for não direcionado, também:
          - verificar se 'destino' existe e remover 'origem' de grafo[destino] se presente.
+    4. Se houver índices de graus/predecessores, descontar cada aresta
+       efetivamente removida.
+    5. Se houver union-find de componentes, invalidá-lo se alguma aresta
+       foi removida (ele é reconstruído na próxima consulta).
     """
     
     if origem not in grafo:
         return grafo
 
     else:
-        if destino in grafo[origem]:
-            grafo[origem].remove(destino)
+        if _remove_neighbor(grafo[origem], destino):
+            if componentes is not None:
+                componentes.invalidate()
+            if graus is not None:
+                graus[origem]['out'] -= 1
+                if destino in graus:
+                    graus[destino]['in'] -= 1
+            if predecessores is not None and destino in predecessores:
+                _remove_neighbor(predecessores[destino], origem)
     if nao_direcionado:
         if destino in grafo:
-            if origem in grafo[destino]:
-                grafo[destino].remove(origem)
+            if _remove_neighbor(grafo[destino], origem):
+                if componentes is not None:
+                    componentes.invalidate()
+                if graus is not None:
+                    graus[destino]['out'] -= 1
+                    graus[origem]['in'] -= 1
+                if predecessores is not None:
+                    _remove_neighbor(predecessores[origem], destino)
 
     return grafo
 
 
-def remove_vertex(grafo, vertice, nao_direcionado=True):
+def remove_vertex(grafo, vertice, nao_direcionado=True, graus=None, predecessores=None, componentes=None):
     """
     Remove um vértice e todas as arestas que o tocam.
     Passos:
     1. Verificar se 'vertice' existe em grafo; se não, terminar.
-    2. Para cada outro vertice no grafo:
-         - se 'vertice' estiver na lista de vizinhos, remover essa aresta.
-    3. Remover o vertice do grafo
-    4. Opcional: retornar confirmação/erro.
+    2. Para cada outro vertice no grafo (ou apenas para os predecessores de
+       'vertice', se houver índice de predecessores):
+         - se 'vertice' estiver na lista de vizinhos, remover essa aresta
+           (todas as arestas paralelas de uma vez).
+    3. Se houver índice de graus, descontar o grau de entrada dos vizinhos
+       de 'vertice' e remover sua entrada do índice.
+    4. Se houver índice de predecessores, retirar 'vertice' da lista de
+       predecessores de cada vizinho e remover sua entrada do índice.
+    5. Remover o vertice do grafo
+       - se houver union-find de componentes, invalidá-lo
+    6. Opcional: retornar confirmação/erro.
     """
     if vertice in grafo:
-        for v in list(grafo.keys()):
-            if vertice in grafo[v]:
-                grafo[v].remove(vertice)
+        if predecessores is not None:
+            origens = list(dict.fromkeys(predecessores[vertice]))
+        else:
+            origens = list(grafo.keys())
+
+        for v in origens:
+            removidas = _remove_neighbor(grafo[v], vertice, todas=True)
+            if removidas and graus is not None:
+                graus[v]['out'] -= removidas
+        if graus is not None:
+            for vizinho in _adjacency_list(grafo[vertice]):
+                if vizinho in graus:
+                    graus[vizinho]['in'] -= 1
+            del graus[vertice]
+        if predecessores is not None:
+            for vizinho in _adjacency_list(grafo[vertice]):
+                if vizinho in predecessores:
+                    _remove_neighbor(predecessores[vizinho], vertice)
+            del predecessores[vertice]
         del grafo[vertice]
+        if componentes is not None:
+            componentes.invalidate()
     else:
         print(f"O vértice {vertice} não existe no grafo.")
 
     return grafo
 
 
+def remove_vertices(grafo, removidos, graus=None, predecessores=None, componentes=None):
+    """
+    Remove vários vértices e todas as arestas que os tocam, com uma única
+    passada pelas listas de vizinhos (remove_vertex chamado k vezes percorre
+    todas as listas k vezes).
+    Passos:
+    1. Separar os vértices que existem no grafo; se nenhum, terminar.
+    2. Para cada vértice que fica (ou apenas para os predecessores dos
+       removidos, se houver índice de predecessores), retirar de uma vez
+       todas as arestas para vértices removidos.
+    3. Se houver índice de graus, descontar o grau de entrada dos vizinhos
+       que ficam e remover as entradas dos removidos.
+    4. Se houver índice de predecessores, retirar os removidos das listas
+       de predecessores dos vizinhos que ficam e remover suas entradas.
+    5. Remover os vértices do grafo
+       - se houver union-find de componentes, invalidá-lo
+    """
+    presentes = [vertice for vertice in dict.fromkeys(removidos) if vertice in grafo]
+    if not presentes:
+        return grafo
+    conjunto = set(presentes)
+
+    if predecessores is not None:
+        origens = dict.fromkeys(p for vertice in presentes for p in _adjacency_list(predecessores[vertice]))
+    else:
+        origens = grafo.keys()
+
+    for v in [v for v in origens if v not in conjunto]:
+        removidas = _remove_neighbors(grafo[v], conjunto)
+        if removidas and graus is not None:
+            graus[v]['out'] -= removidas
+
+    for vertice in presentes:
+        vizinhos = [vizinho for vizinho in _adjacency_list(grafo[vertice]) if vizinho not in conjunto]
+        if graus is not None:
+            for vizinho in vizinhos:
+                if vizinho in graus:
+                    graus[vizinho]['in'] -= 1
+            del graus[vertice]
+        if predecessores is not None:
+            for vizinho in vizinhos:
+                if vizinho in predecessores:
+                    _remove_neighbor(predecessores[vizinho], vertice)
+            del predecessores[vertice]
+
+    for vertice in presentes:
+        del grafo[vertice]
+    if componentes is not None:
+        componentes.invalidate()
+
+    return grafo
+
+
+def predecessors(grafo, vertice, predecessores=None):
+    """
+    Retorna a lista de predecessores de 'vertice' (origens das arestas que chegam nele).
+    Passos:
+    1. Se 'vertice' não estiver em grafo, retornar lista vazia.
+    2. Se houver índice de predecessores, retornar predecessores[vertice] (O(grau de entrada)).
+    3. Caso contrário, percorrer todos os vértices e coletar aqueles que
+       possuem 'vertice' na lista de vizinhos.
+    """
+    if vertice not in grafo:
+        return []
+
+    if predecessores is not None:
+        return _adjacency_list(predecessores[vertice])
+
+    lista = []
+    for v in grafo:
+        for vizinho in _adjacency_list(grafo[v]):
+            if vizinho == vertice:
+                lista.append(v)
+    return lista
+
+
 def edge_exists(grafo, origem, destino):
     """
     Verifica se existe aresta direta origem -> destino.
     Passos:
     1. Verificar se 'origem' é chave no grafo.
     2. Retornar True se 'destino' estiver em grafo[origem], caso contrário False.
+       (O(1) em um HashGraph.)
     """
     if origem in grafo:
         return destino in grafo[origem]
     return False
 
 
-def vertex_degrees(grafo):
+def vertex_degrees(grafo, graus=None):
     """
     Calcula e retorna o grau (out, in, total) de cada vértice.
+    Se um índice de graus for informado, apenas copia seus valores (O(V)).
     Passos:
-    1. Inicializar um dict de graus vazia
-    2. Para cada vertice, colocar no dict uma estrutura com in, out e total zerado
-    3. Para cada u em grafo:
+    1. Se houver índice de graus, montar o resultado a partir dele e retornar.
+    2. Inicializar um dict de graus vazia
+    3. Para cada vertice, colocar no dict uma estrutura com in, out e total zerado
+    4. Para cada u em grafo:
          - out_degree[u] = tamanho de vizinhos
-         - para cada v em grafo:
-            - verificar se u está na lista de vizinho de v,
-            - caso esteja, adicionar +1 para o grau de entrada de u
-    4. Calcular o grau total somando entrada + saida
-    5. Retornar uma estrutura contendo out,in,total por vértice (ex: dict de tuplas).
+         - para cada vizinho v de u, adicionar +1 ao grau de entrada de v
+           (uma única passada O(V + E); arestas paralelas contam uma vez
+           cada, como no índice de graus)
+    5. Calcular o grau total somando entrada + saida
+    6. Retornar uma estrutura contendo out,in,total por vértice (ex: dict de tuplas).
     """
+    if graus is not None:
+        resultado = {}
+        for vertice in grafo:
+            grau = graus[vertice]
+            resultado[vertice] = {'in': grau['in'], 'out': grau['out'], 'total': grau['in'] + grau['out']}
+        return resultado
+
     graus = {}
     for vertice in grafo:
-        graus[vertice] = {'in': 0, 'out': len(grafo[vertice]), 'total': 0}
+        graus[vertice] = {'in': 0, 'out': _adjacency_size(grafo[vertice]), 'total': 0}
 
     for u in grafo:
-        for v in grafo:
-            if u in grafo[v]:
-                graus[u]['in'] += 1
+        for v in _adjacency_list(grafo[u]):
+            if v in graus:
+                graus[v]['in'] += 1
 
     for vertice in graus:
         graus[vertice]['total'] = graus[vertice]['in'] + graus[vertice]['out']
@@ -173,6 +476,30 @@ def vertex_degrees(grafo):
     return graus
 
 
+def vertex_degree(grafo, vertice, graus=None):
+    """
+    Retorna o grau {'in', 'out', 'total'} de um único vértice.
+    Passos:
+    1. Se 'vertice' não existir no grafo, retornar None.
+    2. Se houver índice de graus, ler os valores diretamente (O(1)).
+    3. Caso contrário, out = tamanho dos vizinhos e in = ocorrências de
+       'vertice' nas listas de vizinhos de todos os vértices.
+    """
+    if vertice not in grafo:
+        return None
+
+    if graus is not None:
+        grau_entrada = graus[vertice]['in']
+        grau_saida = graus[vertice]['out']
+    else:
+        grau_saida = _adjacency_size(grafo[vertice])
+        grau_entrada = 0
+        for v in grafo:
+            grau_entrada += _count_neighbor(grafo[v], vertice)
+
+    return {'in': grau_entrada, 'out': grau_saida, 'total': grau_entrada + grau_saida}
+
+
 def valid_path(grafo, caminho):
     """
     Verifica se uma sequência específica de vértices (caminho) é válida:
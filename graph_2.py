@@ -1,102 +1,565 @@
-from typing import List, Tuple, Dict, Any
+from typing import List, Tuple, Dict, Any, Optional
+from bisect import bisect_left
+from operator import itemgetter
 import json
 
-def create_graph() -> Tuple[List[List[int]], List[str]]:
+
+class CompactMatrix:
+    """
+    Matriz de adjacência armazenada em um único bytearray contíguo
+    (capacidade x capacidade), no lugar de uma lista de listas.
+
+    - A capacidade cresce geometricamente (dobra), então inserir N vértices
+      custa O(N²) bytes copiados no total, e não N realocações de cada linha.
+    - Remover um vértice apenas zera sua linha/coluna e marca o slot físico
+      como removido; a compactação acontece de uma vez quando os slots
+      removidos passam a ser maioria.
+    - Somas de linha/coluna e a verificação de simetria usam fatias do
+      bytearray (bytes.count / comparação), sem laços em Python por célula.
+
+    As posições lógicas (as mesmas de 'vertices') são mapeadas para slots
+    físicos crescentes em 'slots'.
+    """
+
+    def __init__(self, capacidade: int = 8):
+        self.capacidade = max(1, capacidade)
+        self.dados = bytearray(self.capacidade * self.capacidade)
+        self.slots: List[int] = []
+        self.proximo_slot = 0
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def __getitem__(self, i: int) -> List[int]:
+        return self.row(i)
+
+    def _grow(self, nova_capacidade: int):
+        antiga = self.capacidade
+        novos = bytearray(nova_capacidade * nova_capacidade)
+        for s in range(self.proximo_slot):
+            novos[s * nova_capacidade:s * nova_capacidade + antiga] = self.dados[s * antiga:(s + 1) * antiga]
+        self.dados = novos
+        self.capacidade = nova_capacidade
+
+    def _compact(self):
+        antiga = self.capacidade
+        n = len(self.slots)
+        nova_capacidade = max(8, 2 * n)
+        novos = bytearray(nova_capacidade * nova_capacidade)
+        if n == 1:
+            s = self.slots[0]
+            novos[0] = self.dados[s * antiga + s]
+        elif n > 1:
+            colunas = itemgetter(*self.slots)
+            for novo, s in enumerate(self.slots):
+                novos[novo * nova_capacidade:novo * nova_capacidade + n] = bytes(colunas(self.dados[s * antiga:(s + 1) * antiga]))
+        self.dados = novos
+        self.capacidade = nova_capacidade
+        self.slots = list(range(n))
+        self.proximo_slot = n
+
+    def append_vertex(self):
+        """Adiciona uma linha/coluna zerada no final (O(1) amortizado)."""
+        if self.proximo_slot == self.capacidade:
+            if len(self.slots) < self.proximo_slot:
+                self._compact()
+            if self.proximo_slot == self.capacidade:
+                self._grow(2 * self.capacidade)
+        self.slots.append(self.proximo_slot)
+        self.proximo_slot += 1
+
+    def pop_vertex(self, i: int):
+        """Remove a posição lógica i, zerando sua linha e coluna físicas."""
+        s = self.slots.pop(i)
+        cap = self.capacidade
+        self.dados[s * cap:(s + 1) * cap] = bytes(cap)
+        self.dados[s::cap] = bytes(cap)
+        if 2 * len(self.slots) < self.proximo_slot:
+            self._compact()
+
+    def pop_vertices(self, posicoes: List[int]):
+        """Remove várias posições lógicas de uma vez, com uma única compactação."""
+        removidas = set(posicoes)
+        self.slots = [s for i, s in enumerate(self.slots) if i not in removidas]
+        self._compact()
+
+    def get(self, i: int, j: int) -> int:
+        return self.dados[self.slots[i] * self.capacidade + self.slots[j]]
+
+    def set(self, i: int, j: int, valor: int):
+        self.dados[self.slots[i] * self.capacidade + self.slots[j]] = valor
+
+    def row(self, i: int) -> List[int]:
+        inicio = self.slots[i] * self.capacidade
+        linha = self.dados[inicio:inicio + self.capacidade]
+        return [linha[s] for s in self.slots]
+
+    def row_sum(self, i: int) -> int:
+        inicio = self.slots[i] * self.capacidade
+        return self.dados.count(1, inicio, inicio + self.capacidade)
+
+    def column_sum(self, j: int) -> int:
+        return self.dados[self.slots[j]::self.capacidade].count(1)
+
+    def row_neighbors(self, i: int) -> List[int]:
+        """Posições lógicas j com matriz[i][j] == 1."""
+        cap = self.capacidade
+        inicio = self.slots[i] * cap
+        resultado = []
+        k = self.dados.find(1, inicio, inicio + cap)
+        while k != -1:
+            resultado.append(bisect_left(self.slots, k - inicio))
+            k = self.dados.find(1, k + 1, inicio + cap)
+        return resultado
+
+    def is_symmetric(self) -> bool:
+        cap = self.capacidade
+        for s in self.slots:
+            if self.dados[s * cap:(s + 1) * cap] != self.dados[s::cap]:
+                return False
+        return True
+
+
+class BitMatrix:
+    """
+    Matriz de adjacência compactada em bits: cada linha é um inteiro Python
+    de precisão arbitrária usado como bitset (bit j da linha i == matriz[i][j]).
+
+    - Cada célula ocupa 1 bit; a lista de listas guarda um ponteiro de
+      8 bytes por célula, ou seja, cerca de 64x menos memória.
+    - Só as linhas são guardadas: o grau de entrada (column_sum) testa o
+      bit j de cada linha, e a simetria testa, para cada bit (i, j) ligado,
+      o bit (j, i) — O(arestas) em vez de O(V²).
+    - Graus de saída usam popcount (int.bit_count) e vizinhos são extraídos
+      bit a bit isolando o bit menos significativo.
+    """
+
+    def __init__(self):
+        self.linhas: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self.linhas)
+
+    def __getitem__(self, i: int) -> List[int]:
+        return self.row(i)
+
+    @staticmethod
+    def _drop_bit(bits: int, i: int) -> int:
+        """Remove o bit i, deslocando os bits mais altos uma posição para baixo."""
+        baixos = bits & ((1 << i) - 1)
+        return baixos | ((bits >> (i + 1)) << i)
+
+    def append_vertex(self):
+        """Adiciona uma linha/coluna zerada no final (O(1))."""
+        self.linhas.append(0)
+
+    def pop_vertex(self, i: int):
+        """Remove a posição i: a linha/coluna i e o bit i de todas as demais."""
+        self.linhas.pop(i)
+        self.linhas = [self._drop_bit(linha, i) for linha in self.linhas]
+
+    def pop_vertices(self, posicoes: List[int]):
+        """Remove várias posições de uma vez, reconstruindo cada linha uma única vez."""
+        removidas = set(posicoes)
+        decrescentes = sorted(removidas, reverse=True)
+
+        def drop_bits(bits: int) -> int:
+            for i in decrescentes:
+                bits = self._drop_bit(bits, i)
+            return bits
+
+        self.linhas = [drop_bits(linha) for i, linha in enumerate(self.linhas) if i not in removidas]
+
+    def get(self, i: int, j: int) -> int:
+        return (self.linhas[i] >> j) & 1
+
+    def set(self, i: int, j: int, valor: int):
+        if valor:
+            self.linhas[i] |= 1 << j
+        else:
+            self.linhas[i] &= ~(1 << j)
+
+    def row(self, i: int) -> List[int]:
+        linha = self.linhas[i]
+        return [(linha >> j) & 1 for j in range(len(self.linhas))]
+
+    def row_sum(self, i: int) -> int:
+        return self.linhas[i].bit_count()
+
+    def column_sum(self, j: int) -> int:
+        return sum((linha >> j) & 1 for linha in self.linhas)
+
+    def row_neighbors(self, i: int) -> List[int]:
+        """Posições j com matriz[i][j] == 1, em ordem crescente."""
+        resultado = []
+        linha = self.linhas[i]
+        while linha:
+            menor = linha & -linha
+            resultado.append(menor.bit_length() - 1)
+            linha ^= menor
+        return resultado
+
+    def is_symmetric(self) -> bool:
+        """Para cada bit (i, j) ligado, o bit (j, i) também precisa estar ligado."""
+        linhas = self.linhas
+        for i, linha in enumerate(linhas):
+            bit_i = 1 << i
+            while linha:
+                menor = linha & -linha
+                if not linhas[menor.bit_length() - 1] & bit_i:
+                    return False
+                linha ^= menor
+        return True
+
+
+class DegreeCache:
+    """
+    Cache de graus mantido junto com a matriz (opcional, passado como 'graus').
+
+    - 'saida' e 'entrada' guardam as somas de linha e de coluna de cada
+      posição, atualizadas a cada célula que muda de valor.
+    - 'assimetricas' conta os pares {i, j} com matriz[i][j] != matriz[j][i];
+      o grafo é não-direcionado exatamente quando esse contador é zero.
+    - 'versao' aumenta a cada mutação; vertex_degree guarda o último
+      resultado e o reaproveita enquanto a versão não mudar.
+    - O fecho transitivo (transitive_closure) é guardado da mesma forma,
+      em 'fecho' / 'versao_fecho'.
+    """
+
+    def __init__(self):
+        self.saida: List[int] = []
+        self.entrada: List[int] = []
+        self.assimetricas = 0
+        self.versao = 0
+        self.resultado: Optional[Dict[str, Any]] = None
+        self.versao_resultado = -1
+        self.fecho: Optional["ReachabilityMatrix"] = None
+        self.versao_fecho = -1
+
+
+class ReachabilityMatrix:
+    """
+    Fecho transitivo da matriz: linhas[i] é um bitset (int) com o bit j
+    ligado se existe um caminho de uma ou mais arestas de i até j.
+    A consulta reachable() custa O(1) (um acesso ao índice e um teste de bit).
+    """
+
+    def __init__(self, linhas: List[int], vertices: List[str]):
+        self.linhas = linhas
+        self.indice = create_index(vertices)
+
+    def reachable(self, origem: str, destino: str) -> bool:
+        i = self.indice.get(origem)
+        j = self.indice.get(destino)
+        if i is None or j is None:
+            return False
+        return bool((self.linhas[i] >> j) & 1)
+
+
+def create_graph(formato: str = "lista") -> Tuple[List[List[int]], List[str]]:
     """
     Cria e retorna uma matriz de adjacência vazia e uma lista de vértices.
 
     Passos:
     1. Criar uma lista vazia chamada matriz (para armazenar as conexões).
+       - formato="compacta": usar uma CompactMatrix (bytearray contíguo).
+       - formato="bits": usar uma BitMatrix (linhas como bitsets de ints).
     2. Criar uma lista vazia chamada vertices (para armazenar os nomes dos vértices).
     3. Retornar (matriz, vertices).
     """
-    matriz: List[List[int]] = []
+    if formato == "lista":
+        matriz: List[List[int]] = []
+    elif formato == "compacta":
+        matriz = CompactMatrix()
+    elif formato == "bits":
+        matriz = BitMatrix()
+    else:
+        raise ValueError(f"Formato de matriz desconhecido: {formato}")
     vertices: List[str] = []
     return (matriz, vertices)
 
 
-def insert_vertex(matriz: List[List[int]], vertices: List[str], vertice: str) -> Tuple[List[List[int]], List[str]]:
+def _append_row(matriz):
+    """Função auxiliar: aumenta a matriz em uma linha e uma coluna zeradas."""
+    if isinstance(matriz, list):
+        for linha in matriz:
+            linha.append(0)
+        matriz.append([0] * (len(matriz) + 1))
+    else:
+        matriz.append_vertex()
+
+
+def _pop_row(matriz, idx: int):
+    """Função auxiliar: remove a linha e a coluna 'idx' da matriz."""
+    if isinstance(matriz, list):
+        matriz.pop(idx)
+        for linha in matriz:
+            linha.pop(idx)
+    else:
+        matriz.pop_vertex(idx)
+
+
+def _pop_rows(matriz, posicoes: List[int]):
+    """Função auxiliar: remove de uma vez as linhas e colunas em 'posicoes'."""
+    if isinstance(matriz, list):
+        removidas = set(posicoes)
+        manter = [i for i in range(len(matriz)) if i not in removidas]
+        if len(manter) == 1:
+            matriz[:] = [[matriz[manter[0]][manter[0]]]]
+        elif manter:
+            colunas = itemgetter(*manter)
+            matriz[:] = [list(colunas(matriz[i])) for i in manter]
+        else:
+            matriz.clear()
+    else:
+        matriz.pop_vertices(posicoes)
+
+
+def _get_cell(matriz, i: int, j: int) -> int:
+    """Função auxiliar: valor de matriz[i][j]."""
+    if isinstance(matriz, list):
+        return matriz[i][j]
+    return matriz.get(i, j)
+
+
+def _set_cell(matriz, i: int, j: int, valor: int, graus: Optional[DegreeCache] = None):
+    """
+    Função auxiliar: atribui matriz[i][j] = valor.
+    Se houver cache de graus e a célula mudar, atualiza as somas de
+    linha/coluna, o contador de pares assimétricos e a versão.
+    """
+    if graus is not None:
+        antigo = _get_cell(matriz, i, j)
+        if antigo == valor:
+            return
+        if i != j:
+            inverso = _get_cell(matriz, j, i)
+            graus.assimetricas += (valor != inverso) - (antigo != inverso)
+        graus.saida[i] += valor - antigo
+        graus.entrada[j] += valor - antigo
+        graus.versao += 1
+
+    if isinstance(matriz, list):
+        matriz[i][j] = valor
+    else:
+        matriz.set(i, j, valor)
+
+
+def create_degree_cache(matriz: List[List[int]], vertices: List[str]) -> DegreeCache:
+    """
+    Cria um cache de graus (DegreeCache) para a matriz atual.
+    O cache é opcional: passado como 'graus' para as funções de inserção e
+    remoção, ele é mantido atualizado, e vertex_degree passa a custar O(V)
+    (ou O(1), se o grafo não mudou desde a última consulta).
+
+    Passos:
+    1. Para cada posição i, guardar a soma da linha i (saída) e da coluna i (entrada).
+    2. Contar os pares i < j com matriz[i][j] != matriz[j][i] (custo O(V²), uma vez).
+    3. Retornar o cache.
+    """
+    graus = DegreeCache()
+    n = len(vertices)
+    for i in range(n):
+        if isinstance(matriz, list):
+            graus.saida.append(sum(matriz[i]))
+            graus.entrada.append(sum(matriz[k][i] for k in range(n)))
+        else:
+            graus.saida.append(matriz.row_sum(i))
+            graus.entrada.append(matriz.column_sum(i))
+
+    for i in range(n):
+        for j in range(i + 1, n):
+            if _get_cell(matriz, i, j) != _get_cell(matriz, j, i):
+                graus.assimetricas += 1
+
+    return graus
+
+
+def create_index(vertices: List[str]) -> Dict[str, int]:
+    """
+    Cria um índice {nome do vértice: posição na matriz} a partir de 'vertices'.
+    O índice é opcional: passado como 'indice' para as demais funções, ele
+    substitui as buscas lineares vertices.index(...) e 'vertice in vertices'
+    por consultas O(1) e é mantido atualizado nas inserções e remoções.
+
+    Passos:
+    1. Percorrer 'vertices' com enumerate.
+    2. Retornar o dicionário {vertice: i}.
+    """
+    return {vertice: i for i, vertice in enumerate(vertices)}
+
+
+def _find_index(vertices: List[str], vertice: str, indice: Optional[Dict[str, int]] = None) -> Optional[int]:
+    """Função auxiliar: posição de 'vertice' na matriz, ou None se não existir."""
+    if indice is not None:
+        return indice.get(vertice)
+    if vertice in vertices:
+        return vertices.index(vertice)
+    return None
+
+
+def insert_vertex(matriz: List[List[int]], vertices: List[str], vertice: str, indice: Optional[Dict[str, int]] = None, graus: Optional[DegreeCache] = None, componentes=None) -> Tuple[List[List[int]], List[str]]:
     """
     Adiciona um novo vértice ao grafo.
 
     Passos:
-    1. Verificar se o vértice já existe em 'vertices'.
+    1. Verificar se o vértice já existe em 'vertices' (ou no índice, se houver).
     2. Caso não exista:
-        - Adicionar o vértice à lista 'vertices'.
+        - Adicionar o vértice à lista 'vertices' (e ao índice, se houver).
         - Aumentar o tamanho da matriz:
             a) Para cada linha existente, adicionar um valor 0 no final (nova coluna).
             b) Adicionar uma nova linha com zeros do tamanho atualizado.
+        - Se houver cache de graus, registrar graus zerados para o vértice.
+        - Se houver union-find de componentes, registrar o vértice.
     """
-    if vertice not in vertices:
+    if _find_index(vertices, vertice, indice) is None:
         vertices.append(vertice)
+        if indice is not None:
+            indice[vertice] = len(vertices) - 1
         
-        for linha in matriz:
-            linha.append(0)
-        
-        nova_linha = [0] * len(vertices)
-        matriz.append(nova_linha)
+        _append_row(matriz)
+
+        if graus is not None:
+            graus.saida.append(0)
+            graus.entrada.append(0)
+            graus.versao += 1
+        if componentes is not None:
+            componentes.track_vertex(vertice)
 
     return (matriz, vertices)
 
 
-def insert_edge(matriz: List[List[int]], vertices: List[str], origem: str, destino: str, nao_direcionado=False) -> Tuple[List[List[int]], List[str]]:
+def insert_edge(matriz: List[List[int]], vertices: List[str], origem: str, destino: str, nao_direcionado=False, indice: Optional[Dict[str, int]] = None, graus: Optional[DegreeCache] = None, componentes=None) -> Tuple[List[List[int]], List[str]]:
     """
     Adiciona uma aresta entre dois vértices.
 
     Passos:
     1. Garantir que 'origem' e 'destino' existam em 'vertices':
         - Se não existirem, chamar 'inserir_vertice' para adicioná-los.
-    2. Localizar o índice da origem (i) e do destino (j).
+    2. Localizar o índice da origem (i) e do destino (j) (O(1) com 'indice').
     3. Marcar a conexão na matriz: matriz[i][j] = 1.
     4. Se nao_direcionado=True, também marcar a conexão inversa matriz[j][i] = 1.
+    5. Se houver cache de graus, ele é atualizado junto com cada célula.
+    6. Se houver union-find de componentes, unir origem e destino.
     """
-    if origem not in vertices:
-        insert_vertex(matriz, vertices, origem)
+    insert_vertex(matriz, vertices, origem, indice, graus, componentes)
+    insert_vertex(matriz, vertices, destino, indice, graus, componentes)
 
-    if destino not in vertices:
-        insert_vertex(matriz, vertices, destino)
-    
-    try:
-        i = vertices.index(origem)
-        j = vertices.index(destino)
-    except ValueError as e:
-        print(f"Erro ao localizar vértices: {e}")
+    i = _find_index(vertices, origem, indice)
+    j = _find_index(vertices, destino, indice)
+    if i is None or j is None:
+        print(f"Erro ao localizar vértices: {origem}, {destino}")
         return (matriz, vertices)
 
-    matriz[i][j] = 1
+    _set_cell(matriz, i, j, 1, graus)
     
     if nao_direcionado:
-        matriz[j][i] = 1
+        _set_cell(matriz, j, i, 1, graus)
+
+    if componentes is not None:
+        componentes.track_edge(origem, destino)
 
     return (matriz, vertices)
 
 
-def remove_vertex(matriz: List[List[int]], vertices: List[str], vertice: str) -> Tuple[List[List[int]], List[str]]:
+def remove_vertex(matriz: List[List[int]], vertices: List[str], vertice: str, indice: Optional[Dict[str, int]] = None, graus: Optional[DegreeCache] = None, componentes=None) -> Tuple[List[List[int]], List[str]]:
     """
     Remove um vértice e todas as arestas associadas.
 
     Passos:
     1. Verificar se o vértice existe em 'vertices'.
     2. Caso exista:
-        - Descobrir o índice correspondente (usando vertices.index(vertice)).
+        - Descobrir o índice correspondente (usando vertices.index(vertice) ou o 'indice').
         - Remover a linha da matriz na posição desse índice.
         - Remover a coluna (mesmo índice) de todas as outras linhas.
         - Remover o vértice da lista 'vertices'.
+        - Se houver 'indice', apagar o vértice e deslocar em -1 as posições
+          de todos os vértices que vinham depois dele.
+        - Se houver cache de graus, descontar as arestas do vértice nos
+          graus dos demais e nos pares assimétricos antes de remover a linha.
+        - Se houver union-find de componentes, invalidá-lo.
     """
-    if vertice in vertices:
-        idx = vertices.index(vertice)
-        
-        matriz.pop(idx)
-        
-        for linha in matriz:
-            linha.pop(idx)
+    idx = _find_index(vertices, vertice, indice)
+    if idx is not None:
+        if graus is not None:
+            for j in range(len(vertices)):
+                if j == idx:
+                    continue
+                saindo = _get_cell(matriz, idx, j)
+                chegando = _get_cell(matriz, j, idx)
+                graus.entrada[j] -= saindo
+                graus.saida[j] -= chegando
+                if saindo != chegando:
+                    graus.assimetricas -= 1
+            graus.saida.pop(idx)
+            graus.entrada.pop(idx)
+            graus.versao += 1
+
+        _pop_row(matriz, idx)
             
         vertices.pop(idx)
+
+        if indice is not None:
+            del indice[vertice]
+            for k in range(idx, len(vertices)):
+                indice[vertices[k]] = k
+
+        if componentes is not None:
+            componentes.invalidate()
         
     return (matriz, vertices)
 
 
-def remove_edge(matriz: List[List[int]], vertices: List[str], origem: str, destino: str, nao_direcionado=False) -> Tuple[List[List[int]], List[str]]:
+def remove_vertices(matriz: List[List[int]], vertices: List[str], removidos: List[str], indice: Optional[Dict[str, int]] = None, graus: Optional[DegreeCache] = None, componentes=None) -> Tuple[List[List[int]], List[str]]:
+    """
+    Remove vários vértices (e suas arestas) de uma vez.
+    Chamar remove_vertex k vezes custa O(k·V²) na lista de listas (cada
+    chamada tira uma coluna de todas as linhas); aqui a matriz é compactada
+    uma única vez, em O(V²).
+
+    Passos:
+    1. Localizar as posições dos vértices que existem (ignorar os demais).
+    2. Se houver cache de graus, descontar as arestas de cada removido nos
+       graus dos vértices que ficam e nos pares assimétricos (cada par
+       contado uma vez, mesmo que as duas pontas sejam removidas).
+    3. Remover todas as linhas e colunas de uma vez (_pop_rows).
+    4. Filtrar 'vertices' e, se houver 'indice', reconstruí-lo em O(V).
+    5. Se houver union-find de componentes, invalidá-lo.
+    """
+    posicoes = sorted({i for i in (_find_index(vertices, v, indice) for v in removidos) if i is not None})
+    if not posicoes:
+        return (matriz, vertices)
+    conjunto = set(posicoes)
+
+    if graus is not None:
+        for idx in posicoes:
+            for j in range(len(vertices)):
+                if j == idx or (j in conjunto and j < idx):
+                    continue
+                saindo = _get_cell(matriz, idx, j)
+                chegando = _get_cell(matriz, j, idx)
+                graus.entrada[j] -= saindo
+                graus.saida[j] -= chegando
+                if saindo != chegando:
+                    graus.assimetricas -= 1
+        graus.saida[:] = [g for i, g in enumerate(graus.saida) if i not in conjunto]
+        graus.entrada[:] = [g for i, g in enumerate(graus.entrada) if i not in conjunto]
+        graus.versao += 1
+
+    _pop_rows(matriz, posicoes)
+    vertices[:] = [v for i, v in enumerate(vertices) if i not in conjunto]
+
+    if indice is not None:
+        indice.clear()
+        indice.update(create_index(vertices))
+
+    if componentes is not None:
+        componentes.invalidate()
+
+    return (matriz, vertices)
+
+
+def remove_edge(matriz: List[List[int]], vertices: List[str], origem: str, destino: str, nao_direcionado=False, indice: Optional[Dict[str, int]] = None, graus: Optional[DegreeCache] = None, componentes=None) -> Tuple[List[List[int]], List[str]]:
     """
     Remove uma aresta entre dois vértices.
 
@@ -105,38 +568,41 @@ def remove_edge(matriz: List[List[int]], vertices: List[str], origem: str, desti
     2. Localizar os índices (i e j).
     3. Remover a aresta: matriz[i][j] = 0.
     4. Se nao_direcionado=True, também remover a inversa: matriz[j][i] = 0.
+    5. Se houver union-find de componentes e alguma aresta existia, invalidá-lo.
     """
-    if origem in vertices and destino in vertices:
-        i = vertices.index(origem)
-        j = vertices.index(destino)
+    i = _find_index(vertices, origem, indice)
+    j = _find_index(vertices, destino, indice)
+    if i is not None and j is not None:
+        if componentes is not None and (_get_cell(matriz, i, j) or (nao_direcionado and _get_cell(matriz, j, i))):
+            componentes.invalidate()
         
-        matriz[i][j] = 0
+        _set_cell(matriz, i, j, 0, graus)
         
         if nao_direcionado:
-            matriz[j][i] = 0
+            _set_cell(matriz, j, i, 0, graus)
             
     return (matriz, vertices)
 
 
-def edge_exists(matriz: List[List[int]], vertices: List[str], origem: str, destino: str) -> bool:
+def edge_exists(matriz: List[List[int]], vertices: List[str], origem: str, destino: str, indice: Optional[Dict[str, int]] = None) -> bool:
     """
     Verifica se existe uma aresta direta entre dois vértices.
 
     Passos:
     1. Verificar se ambos os vértices existem em 'vertices'.
-    2. Obter os índices (i, j).
+    2. Obter os índices (i, j) (O(1) com 'indice').
     3. Retornar True se matriz[i][j] == 1, caso contrário False.
     """
-    if origem in vertices and destino in vertices:
-        i = vertices.index(origem)
-        j = vertices.index(destino)
+    i = _find_index(vertices, origem, indice)
+    j = _find_index(vertices, destino, indice)
+    if i is not None and j is not None:
         
-        return matriz[i][j] == 1
+        return _get_cell(matriz, i, j) == 1
         
     return False
 
 
-def neighbors(matriz: List[List[int]], vertices: List[str], vertice: str) -> List[str]:
+def neighbors(matriz: List[List[int]], vertices: List[str], vertice: str, indice: Optional[Dict[str, int]] = None) -> List[str]:
     """
     Retorna a lista de vizinhos (vértices alcançáveis a partir de 'vertice').
 
@@ -150,9 +616,11 @@ def neighbors(matriz: List[List[int]], vertices: List[str], vertice: str) -> Lis
     """
     lista_vizinhos = []
     
-    if vertice in vertices:
-        i = vertices.index(vertice)
-        
+    i = _find_index(vertices, vertice, indice)
+    if i is not None:
+        if not isinstance(matriz, list):
+            return [vertices[j] for j in matriz.row_neighbors(i)]
+
         linha_do_vertice = matriz[i]
         for j in range(len(linha_do_vertice)):
             if linha_do_vertice[j] == 1:
@@ -163,6 +631,9 @@ def neighbors(matriz: List[List[int]], vertices: List[str], vertice: str) -> Lis
 
 def _is_symmetric(matriz: List[List[int]]) -> bool:
     """Função auxiliar para verificar se a matriz é simétrica (grafo não-direcionado)."""
+    if not isinstance(matriz, list):
+        return matriz.is_symmetric()
+
     n = len(matriz)
     if n == 0:
         return True
@@ -177,10 +648,13 @@ def _is_symmetric(matriz: List[List[int]]) -> bool:
     return True
 
 
-def vertex_degree(matriz: List[List[int]], vertices: List[str]) -> Dict[str, Any]:
+def vertex_degree(matriz: List[List[int]], vertices: List[str], graus: Optional[DegreeCache] = None) -> Dict[str, Any]:
     """
     Calcula o grau de entrada, saída e total de cada vértice.
     Detecta automaticamente se o grafo é direcionado ou não pela simetria da matriz.
+    Com um cache de graus ('graus'), a simetria e as somas já estão prontas:
+    o resultado é montado em O(V) e reaproveitado enquanto a versão do
+    cache não mudar.
 
     Passos:
     1. Verificar se a matriz é simétrica (não-direcionado) ou não (direcionado).
@@ -196,7 +670,11 @@ def vertex_degree(matriz: List[List[int]], vertices: List[str]) -> Dict[str, Any
             - graus[vértice] = {"saida": x, "entrada": y, "total": z}
     4. Retornar 'graus'.
     """
-    nao_direcionado = _is_symmetric(matriz)
+    cache = graus
+    if cache is not None and cache.versao_resultado == cache.versao:
+        return _copy_degrees(cache.resultado)
+
+    nao_direcionado = cache.assimetricas == 0 if cache is not None else _is_symmetric(matriz)
     
     graus: Dict[str, Any] = {}
     num_vertices = len(vertices)
@@ -204,23 +682,85 @@ def vertex_degree(matriz: List[List[int]], vertices: List[str]) -> Dict[str, Any
     for i in range(num_vertices):
         v = vertices[i]
         
-        if nao_direcionado:
-            grau = sum(matriz[i])
-            graus[v] = grau
+        if cache is not None:
+            grau_saida = cache.saida[i]
+            grau_entrada = None if nao_direcionado else cache.entrada[i]
+        elif not isinstance(matriz, list):
+            grau_saida = matriz.row_sum(i)
+            grau_entrada = None if nao_direcionado else matriz.column_sum(i)
         else:
             grau_saida = sum(matriz[i])
-            grau_entrada = sum(matriz[k][i] for k in range(num_vertices))
-            
+            grau_entrada = None if nao_direcionado else sum(matriz[k][i] for k in range(num_vertices))
+
+        if nao_direcionado:
+            graus[v] = grau_saida
+        else:
             graus[v] = {
                 "saida": grau_saida,
                 "entrada": grau_entrada,
                 "total": grau_saida + grau_entrada
             }
+
+    if cache is not None:
+        cache.resultado = graus
+        cache.versao_resultado = cache.versao
+        return _copy_degrees(graus)
             
     return graus
 
 
-def valid_path(matriz: List[List[int]], vertices: List[str], caminho: List[str]) -> bool:
+def _copy_degrees(graus: Dict[str, Any]) -> Dict[str, Any]:
+    """Função auxiliar: cópia do resultado de vertex_degree guardado no cache."""
+    return {v: dict(g) if isinstance(g, dict) else g for v, g in graus.items()}
+
+
+def _row_bits(matriz, i: int) -> int:
+    """Função auxiliar: linha i da matriz como bitset (bit j == matriz[i][j])."""
+    if isinstance(matriz, BitMatrix):
+        return matriz.linhas[i]
+    if isinstance(matriz, list):
+        vizinhos = [j for j, valor in enumerate(matriz[i]) if valor == 1]
+    else:
+        vizinhos = matriz.row_neighbors(i)
+    bits = 0
+    for j in vizinhos:
+        bits |= 1 << j
+    return bits
+
+
+def transitive_closure(matriz: List[List[int]], vertices: List[str], graus: Optional[DegreeCache] = None) -> ReachabilityMatrix:
+    """
+    Calcula o fecho transitivo (alcançabilidade entre todos os pares).
+
+    Passos:
+    1. Se houver cache de graus com um fecho da versão atual, retorná-lo.
+    2. Converter cada linha da matriz em um bitset (int).
+    3. Warshall bit a bit: para cada k, toda linha i que alcança k recebe
+       linhas[i] |= linhas[k] (uma operação sobre a linha inteira, não por célula).
+    4. Guardar o resultado no cache (se houver) com a versão atual; ele só é
+       recalculado depois de uma mutação que altere a matriz.
+    Custo: O(V³ / tamanho da palavra).
+    """
+    if graus is not None and graus.fecho is not None and graus.versao_fecho == graus.versao:
+        return graus.fecho
+
+    n = len(vertices)
+    linhas = [_row_bits(matriz, i) for i in range(n)]
+    for k in range(n):
+        bit_k = 1 << k
+        linha_k = linhas[k]
+        for i in range(n):
+            if linhas[i] & bit_k:
+                linhas[i] |= linha_k
+
+    fecho = ReachabilityMatrix(linhas, vertices)
+    if graus is not None:
+        graus.fecho = fecho
+        graus.versao_fecho = graus.versao
+    return fecho
+
+
+def valid_path(matriz: List[List[int]], vertices: List[str], caminho: List[str], indice: Optional[Dict[str, int]] = None) -> bool:
     """
     Verifica se um percurso (sequência de vértices) é possível no grafo.
 
@@ -238,12 +778,70 @@ def valid_path(matriz: List[List[int]], vertices: List[str], caminho: List[str])
         u = caminho[i]
         v = caminho[i+1]
         
-        if not edge_exists(matriz, vertices, u, v):
+        if not edge_exists(matriz, vertices, u, v, indice):
             return False
             
     return True
 
 
+def insert_edges(matriz: List[List[int]], vertices: List[str], arestas: List[Tuple[str, str]], nao_direcionado=False, indice: Optional[Dict[str, int]] = None, graus: Optional[DegreeCache] = None, componentes=None) -> Tuple[List[List[int]], List[str]]:
+    """
+    Adiciona várias arestas de uma vez (carga em lote).
+
+    Passos:
+    1. Usar o índice informado (ou criar um temporário com create_index).
+    2. Coletar os vértices novos que aparecem nas arestas e registrá-los
+       em 'vertices' e no índice.
+    3. Aumentar a matriz uma única vez:
+        a) Estender cada linha existente com uma coluna de zeros por vértice novo.
+        b) Adicionar as linhas novas com zeros.
+    4. Para cada (origem, destino), marcar matriz[i][j] = 1
+       (e matriz[j][i] = 1 se nao_direcionado=True).
+    5. Se houver cache de graus, registrar os vértices novos e atualizá-lo
+       a cada célula marcada.
+    6. Se houver union-find de componentes, registrar os vértices novos e
+       unir as pontas de cada aresta.
+    """
+    if indice is None:
+        indice = create_index(vertices)
+
+    tamanho_antigo = len(vertices)
+    for origem, destino in arestas:
+        for vertice in (origem, destino):
+            if vertice not in indice:
+                indice[vertice] = len(vertices)
+                vertices.append(vertice)
+
+    novos = len(vertices) - tamanho_antigo
+    if isinstance(matriz, list):
+        for linha in matriz:
+            linha.extend([0] * novos)
+        for _ in range(novos):
+            matriz.append([0] * len(vertices))
+    else:
+        for _ in range(novos):
+            _append_row(matriz)
+
+    if graus is not None and novos:
+        graus.saida.extend([0] * novos)
+        graus.entrada.extend([0] * novos)
+        graus.versao += 1
+    if componentes is not None:
+        for vertice in vertices[tamanho_antigo:]:
+            componentes.track_vertex(vertice)
+
+    for origem, destino in arestas:
+        i = indice[origem]
+        j = indice[destino]
+        _set_cell(matriz, i, j, 1, graus)
+        if nao_direcionado:
+            _set_cell(matriz, j, i, 1, graus)
+        if componentes is not None:
+            componentes.track_edge(origem, destino)
+
+    return (matriz, vertices)
+
+
 def list_neighbors(matriz: List[List[int]], vertices: List[str], vertice: str):
     """
     Exibe (ou retorna) os vizinhos de um vértice.
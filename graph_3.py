@@ -1,33 +1,579 @@
 import sys
+import time
+from array import array
+from bisect import bisect_left
+from collections import Counter, deque
 
-def create_graph():
+
+class HashList:
+    """
+    Coleção ordenada sem repetição, guardada nas chaves de um dict.
+    Substitui as listas 'vertices' e 'arestas': pertinência, inserção e
+    remoção passam a custar O(1), e a iteração continua na ordem de
+    inserção. Arestas são guardadas como tuplas (origem, destino), mas
+    aceitam ser consultadas/inseridas como listas [origem, destino].
+    """
+
+    def __init__(self, itens=()):
+        self.itens = dict.fromkeys(self._key(item) for item in itens)
+
+    @staticmethod
+    def _key(item):
+        return tuple(item) if isinstance(item, list) else item
+
+    def __contains__(self, item):
+        return self._key(item) in self.itens
+
+    def __iter__(self):
+        return iter(self.itens)
+
+    def __len__(self):
+        return len(self.itens)
+
+    def __repr__(self):
+        return repr(list(self.itens))
+
+    def append(self, item):
+        self.itens[self._key(item)] = None
+
+    def extend(self, itens):
+        for item in itens:
+            self.append(item)
+
+    def remove(self, item):
+        del self.itens[self._key(item)]
+
+    def clear(self):
+        self.itens.clear()
+
+
+class CompactEdgeList:
+    """
+    Lista de arestas compacta: dois arrays tipados paralelos ('origens' e
+    'destinos') com ids inteiros de vértices, no lugar de uma lista Python
+    [origem, destino] por aresta (8 bytes por aresta em vez de ~70+).
+
+    - 'nomes'/'ids' formam a tabela de interning nome <-> id denso.
+    - Remover uma aresta apenas marca sua posição com REMOVIDA (tombstone);
+      os arrays são compactados de uma vez quando as posições removidas
+      passam a ser maioria.
+    - 'in' e remove() usam um índice também em arrays, montado na primeira
+      consulta: 'chaves' (a chave inteira de cada aresta, em ordem) e
+      'posicoes' (a posição de cada chave nos arrays), consultado por busca
+      binária. São mais 12 bytes por aresta, contra ~100 de um dict
+      {chave: posição}.
+    - Arestas acrescentadas por append() depois da montagem ficam em um dict
+      'pendentes'; quando ele passa de 1/8 das arestas indexadas, o índice é
+      montado de novo.
+    - extend() só acrescenta aos arrays, sem consultar o índice; as
+      repetições são descartadas de uma vez (deduplicate), antes da próxima
+      leitura. Como em uma HashList, cada aresta aparece uma única vez.
+    - Iterar produz tuplas (origem, destino) com os nomes, na ordem de
+      inserção, como uma HashList.
+    """
+
+    REMOVIDA = -1
+    LIMITE_PENDENTES = 1024
+
+    def __init__(self, itens=()):
+        self.nomes = []
+        self.ids = {}
+        self.origens = array('i')
+        self.destinos = array('i')
+        self.removidas = 0
+        self.chaves = None
+        self.posicoes = None
+        self.pendentes = {}
+        self.repetidas = False
+        self.extend(itens)
+
+    def intern(self, vertice):
+        """Retorna o id denso de 'vertice', criando-o se necessário."""
+        if vertice not in self.ids:
+            self.ids[vertice] = len(self.nomes)
+            self.nomes.append(vertice)
+        return self.ids[vertice]
+
+    def _key(self, item):
+        """Chave inteira da aresta (ou None se algum vértice nunca foi visto)."""
+        origem, destino = item
+        i = self.ids.get(origem)
+        j = self.ids.get(destino)
+        if i is None or j is None:
+            return None
+        return (i << 32) | j
+
+    def _sorted_positions(self):
+        """
+        Função auxiliar: chaves de todas as posições e as posições vivas
+        ordenadas pela chave (ordenação estável: entre chaves iguais, a
+        ocorrência mais antiga vem primeiro). Tombstones têm chave negativa
+        e ficam no início, antes de serem cortados.
+        """
+        chaves = [(i << 32) | j for i, j in zip(self.origens, self.destinos)]
+        ordem = sorted(range(len(chaves)), key=chaves.__getitem__)
+        return chaves, ordem[bisect_left(ordem, 0, key=chaves.__getitem__):]
+
+    def deduplicate(self):
+        """
+        Descarta as repetições acrescentadas por extend(), em uma passada
+        sobre as posições ordenadas pela chave (as repetições ficam
+        adjacentes; só a primeira ocorrência continua viva).
+        Retorna (chaves, posições únicas) para a montagem do índice, ou None
+        se não havia nada a fazer ou se os arrays foram compactados.
+        """
+        if not self.repetidas:
+            return None
+        self.repetidas = False
+        chaves, ordem = self._sorted_positions()
+        unicas = []
+        for k in ordem:
+            if unicas and chaves[k] == chaves[unicas[-1]]:
+                self.origens[k] = self.REMOVIDA
+                self.removidas += 1
+            else:
+                unicas.append(k)
+        if 2 * self.removidas > len(self.origens):
+            self._compact()
+            return None
+        return chaves, unicas
+
+    def _index(self):
+        if self.chaves is None:
+            chaves, ordem = self.deduplicate() or self._sorted_positions()
+            self.chaves = array('q', map(chaves.__getitem__, ordem))
+            self.posicoes = array('i', ordem)
+            self.pendentes = {}
+
+    def _find(self, item):
+        """Função auxiliar: posição viva da aresta nos arrays, ou None."""
+        chave = self._key(item)
+        if chave is None:
+            return None
+        self._index()
+        k = self.pendentes.get(chave)
+        if k is not None:
+            return k
+        p = bisect_left(self.chaves, chave)
+        if p < len(self.chaves) and self.chaves[p] == chave:
+            k = self.posicoes[p]
+            if self.origens[k] != self.REMOVIDA:
+                return k
+        return None
+
+    def _compact(self):
+        origens = array('i')
+        destinos = array('i')
+        for i, j in zip(self.origens, self.destinos):
+            if i != self.REMOVIDA:
+                origens.append(i)
+                destinos.append(j)
+        self.origens = origens
+        self.destinos = destinos
+        self.removidas = 0
+        self.chaves = None
+        self.posicoes = None
+        self.pendentes = {}
+
+    def _tombstone(self, k):
+        self.origens[k] = self.REMOVIDA
+        self.removidas += 1
+        if 2 * self.removidas > len(self.origens):
+            self._compact()
+
+    def __contains__(self, item):
+        return self._find(item) is not None
+
+    def __iter__(self):
+        self.deduplicate()
+        nomes = self.nomes
+        for i, j in zip(self.origens, self.destinos):
+            if i != self.REMOVIDA:
+                yield nomes[i], nomes[j]
+
+    def __len__(self):
+        self.deduplicate()
+        return len(self.origens) - self.removidas
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def append(self, item):
+        """Acrescenta uma aresta (ignorada se já existir), registrando-a em 'pendentes'."""
+        if self._find(item) is not None:
+            return
+        origem, destino = item
+        i = self.intern(origem)
+        j = self.intern(destino)
+        if self.chaves is not None:
+            self.pendentes[(i << 32) | j] = len(self.origens)
+            if len(self.pendentes) > max(self.LIMITE_PENDENTES, len(self.chaves) >> 3):
+                self.chaves = None
+        self.origens.append(i)
+        self.destinos.append(j)
+
+    def extend(self, itens):
+        """Acrescenta em bloco, sem consultar o índice (as repetições são descartadas depois)."""
+        tamanho = len(self.origens)
+        intern = self.intern
+        for origem, destino in itens:
+            self.origens.append(intern(origem))
+            self.destinos.append(intern(destino))
+        if len(self.origens) != tamanho:
+            self.repetidas = True
+            self.chaves = None
+
+    def remove(self, item):
+        k = self._find(item)
+        if k is None:
+            raise KeyError(item)
+        self.pendentes.pop(self._key(item), None)
+        self._tombstone(k)
+
+    def clear(self):
+        self.origens = array('i')
+        self.destinos = array('i')
+        self.removidas = 0
+        self.chaves = None
+        self.posicoes = None
+        self.pendentes = {}
+        self.repetidas = False
+
+    def remove_vertex(self, vertice):
+        """Marca como removidas todas as arestas que tocam 'vertice'."""
+        self.remove_vertices([vertice])
+
+    def remove_vertices(self, vertices):
+        """Marca como removidas, em uma única passada, as arestas que tocam qualquer um de 'vertices'."""
+        removidos = {self.ids[v] for v in vertices if v in self.ids}
+        if not removidos:
+            return
+        for k, (i, j) in enumerate(zip(self.origens, self.destinos)):
+            if i != self.REMOVIDA and (i in removidos or j in removidos):
+                self.origens[k] = self.REMOVIDA
+                self.removidas += 1
+                self.pendentes.pop((i << 32) | j, None)
+        if 2 * self.removidas > len(self.origens):
+            self._compact()
+
+    def degree_counts(self):
+        """Contagens (saída, entrada) por id, feitas pelo Counter em C sobre os arrays."""
+        self.deduplicate()
+        saida = Counter(self.origens)
+        entrada = Counter(self.destinos)
+        if self.removidas:
+            for k, i in enumerate(self.origens):
+                if i == self.REMOVIDA:
+                    entrada[self.destinos[k]] -= 1
+            del saida[self.REMOVIDA]
+        return saida, entrada
+
+
+class TemporalEdgeList:
+    """
+    Lista de arestas com janela deslizante de tempo: só as arestas vistas
+    nos últimos 'janela' segundos (ou unidades do instante informado) valem.
+
+    - Cada ocorrência (origem, destino, instante) vai para um balde de
+      'tamanho_balde' unidades de tempo; os baldes ficam em uma deque, em
+      ordem de tempo. Expirar remove baldes inteiros do início, em
+      O(ocorrências do balde), sem varrer o resto da lista.
+    - 'saida' / 'entrada' ({vertice: {vizinho: None}}) são os índices de
+      vizinhos e de predecessores, mantidos a cada inserção, remoção e
+      expiração; 'ultimo' guarda o instante mais recente de cada aresta.
+    - Uma aresta repetida renova seu instante; ela só sai quando sua última
+      ocorrência expira (ou quando é removida com remove()).
+    - "Agora" depende de como os instantes chegam: se a última inserção
+      usou o relógio (add sem 'instante'), agora é relogio(), e as
+      consultas ('in', len(), iteração, neighbors, degree_counts) também
+      expiram, então arestas antigas somem mesmo sem novas inserções; com
+      instantes informados, agora é o instante mais recente já visto, e a
+      expiração só avança com as inserções (ou com expire(agora)).
+    - A expiração tem a granularidade de um balde; neighbors(v, janela)
+      filtra pelo instante exato de cada aresta.
+    - Instantes fora de ordem entram no balde mais recente.
+    - 'janela' e 'tamanho_balde' (padrão: janela / 16) devem ser positivos.
+    """
+
+    def __init__(self, janela, tamanho_balde=None, relogio=time.monotonic):
+        if janela <= 0:
+            raise ValueError(f"A janela deve ser positiva: {janela}")
+        if tamanho_balde is not None and tamanho_balde <= 0:
+            raise ValueError(f"O tamanho do balde deve ser positivo: {tamanho_balde}")
+        self.janela = janela
+        self.tamanho_balde = tamanho_balde or janela / 16
+        self.relogio = relogio
+        self.clear()
+
+    def clear(self):
+        self.baldes = deque()
+        self.ocorrencias = {}
+        self.ultimo = {}
+        self.saida = {}
+        self.entrada = {}
+        self.corte = {}
+        self.sequencia = 0
+        self.mais_recente = None
+        self.usa_relogio = False
+
+    @staticmethod
+    def _key(item):
+        origem, destino = item
+        return (origem, destino)
+
+    def add(self, origem, destino, instante=None):
+        """
+        Registra uma ocorrência da aresta no 'instante' (padrão: relogio())
+        e expira os baldes antigos. Retorna quantas arestas expiraram.
+        """
+        self.usa_relogio = instante is None
+        instante = self.relogio() if self.usa_relogio else instante
+        chave = int(instante // self.tamanho_balde)
+        if not self.baldes or chave > self.baldes[-1][0]:
+            self.baldes.append([chave, []])
+        self.sequencia += 1
+        self.baldes[-1][1].append((origem, destino, self.sequencia))
+
+        aresta = (origem, destino)
+        if aresta in self.ocorrencias:
+            self.ocorrencias[aresta] += 1
+            self.ultimo[aresta] = max(self.ultimo[aresta], instante)
+        else:
+            self.ocorrencias[aresta] = 1
+            self.ultimo[aresta] = instante
+            self.saida.setdefault(origem, {})[destino] = None
+            self.entrada.setdefault(destino, {})[origem] = None
+
+        if self.mais_recente is None or instante > self.mais_recente:
+            self.mais_recente = instante
+        return self.expire()
+
+    def _drop(self, aresta):
+        """Função auxiliar: tira a aresta (todas as ocorrências) dos índices."""
+        origem, destino = aresta
+        del self.ocorrencias[aresta]
+        del self.ultimo[aresta]
+        del self.saida[origem][destino]
+        if not self.saida[origem]:
+            del self.saida[origem]
+        del self.entrada[destino][origem]
+        if not self.entrada[destino]:
+            del self.entrada[destino]
+
+    def _now(self):
+        """Função auxiliar: o "agora" padrão (relogio() ou o instante mais recente já visto)."""
+        return self.relogio() if self.usa_relogio else self.mais_recente
+
+    def _refresh(self):
+        """Função auxiliar: antes de uma consulta, expira pelo relógio (se é ele quem dá os instantes)."""
+        if self.usa_relogio:
+            self.expire()
+
+    def expire(self, agora=None):
+        """
+        Remove os baldes inteiramente anteriores a agora - janela
+        (padrão: _now()). Retorna quantas arestas deixaram de existir.
+        """
+        agora = self._now() if agora is None else agora
+        if agora is None:
+            return 0
+        limite = agora - self.janela
+        expiradas = 0
+        while self.baldes and (self.baldes[0][0] + 1) * self.tamanho_balde <= limite:
+            _, ocorrencias = self.baldes.popleft()
+            for origem, destino, sequencia in ocorrencias:
+                aresta = (origem, destino)
+                if self.corte.get(aresta, 0) >= sequencia:
+                    continue
+                self.ocorrencias[aresta] -= 1
+                if self.ocorrencias[aresta] == 0:
+                    self._drop(aresta)
+                    expiradas += 1
+            if self.corte:
+                primeira = self.baldes[0][1][0][2] if self.baldes else self.sequencia + 1
+                self.corte = {aresta: s for aresta, s in self.corte.items() if s >= primeira}
+        return expiradas
+
+    def __contains__(self, item):
+        self._refresh()
+        return self._key(item) in self.ocorrencias
+
+    def __iter__(self):
+        self._refresh()
+        return iter(list(self.ocorrencias))
+
+    def __len__(self):
+        self._refresh()
+        return len(self.ocorrencias)
+
+    def __repr__(self):
+        return repr(list(self))
+
+    def append(self, item):
+        origem, destino = item
+        self.add(origem, destino)
+
+    def extend(self, itens):
+        for item in itens:
+            self.append(item)
+
+    def remove(self, item):
+        """Remove a aresta já, ignorando suas ocorrências ainda guardadas nos baldes."""
+        aresta = self._key(item)
+        if aresta not in self.ocorrencias:
+            raise ValueError(f"Aresta inexistente: {aresta}")
+        self.corte[aresta] = self.sequencia
+        self._drop(aresta)
+
+    def remove_vertex(self, vertice):
+        """Remove as arestas que tocam 'vertice', usando os índices (O(grau))."""
+        for destino in list(self.saida.get(vertice, ())):
+            self.remove((vertice, destino))
+        for origem in list(self.entrada.get(vertice, ())):
+            self.remove((origem, vertice))
+
+    def remove_vertices(self, vertices):
+        for vertice in vertices:
+            self.remove_vertex(vertice)
+
+    def neighbors(self, vertice, janela=None, agora=None):
+        """
+        Vizinhos de saída de 'vertice' (O(grau)). Com 'janela', apenas os
+        vistos em [agora - janela, agora] (agora padrão: _now()).
+        """
+        self._refresh()
+        vizinhos = self.saida.get(vertice, {})
+        agora = self._now() if agora is None else agora
+        if janela is None or agora is None:
+            return list(vizinhos)
+        limite = agora - janela
+        return [destino for destino in vizinhos if self.ultimo[(vertice, destino)] >= limite]
+
+    def degree_counts(self):
+        """Graus (saída, entrada) por vértice, lidos dos índices em O(V)."""
+        self._refresh()
+        saida = {v: len(vizinhos) for v, vizinhos in self.saida.items()}
+        entrada = {v: len(origens) for v, origens in self.entrada.items()}
+        return saida, entrada
+
+
+class CSRIndex:
+    """
+    Índice de vizinhos no formato CSR (compressed sparse row), construído
+    sob demanda a partir da lista de arestas.
+
+    - 'nomes' lista os vértices de origem na ordem de 'vertices';
+      'posicoes' mapeia cada nome para sua posição.
+    - Os vizinhos do vértice de posição p são alvos[offsets[p]:offsets[p + 1]],
+      guardados como posições (ints) em um array compacto.
+    - Construir custa O(E); as funções de mutação chamam invalidate() e o
+      índice é reconstruído na próxima consulta.
+    """
+
+    def __init__(self):
+        self.valido = False
+        self.nomes = []
+        self.posicoes = {}
+        self.offsets = array('q', [0])
+        self.alvos = array('q')
+
+    def invalidate(self):
+        self.valido = False
+
+    def _position(self, vertice):
+        if vertice not in self.posicoes:
+            self.posicoes[vertice] = len(self.nomes)
+            self.nomes.append(vertice)
+        return self.posicoes[vertice]
+
+    def build(self, vertices, arestas):
+        """Agrupa as arestas por origem (sem repetir vizinhos) em O(V + E)."""
+        self.nomes = []
+        self.posicoes = {}
+        for vertice in vertices:
+            self._position(vertice)
+
+        grupos = {}
+        for origem, destino in arestas:
+            grupos.setdefault(self._position(origem), {})[self._position(destino)] = None
+
+        self.offsets = array('q', [0])
+        self.alvos = array('q')
+        for p in range(len(self.nomes)):
+            self.alvos.extend(grupos.get(p, ()))
+            self.offsets.append(len(self.alvos))
+        self.valido = True
+
+    def neighbors(self, vertice):
+        p = self.posicoes.get(vertice)
+        if p is None:
+            return []
+        nomes = self.nomes
+        return [nomes[q] for q in self.alvos[self.offsets[p]:self.offsets[p + 1]]]
+
+
+def create_neighbor_index():
+    """
+    Cria um índice CSR de vizinhos vazio.
+    O índice é opcional: passado como 'indice_vizinhos' para neighbors(),
+    ele é construído na primeira consulta (O(E)) e depois responde cada
+    consulta em O(grau de saída). Passado para insert_edge, remove_edge e
+    remove_vertex, ele é invalidado quando as arestas mudam.
+    """
+    return CSRIndex()
+
+
+def _ensure_built(vertices, arestas, indice_vizinhos):
+    """Função auxiliar: (re)constrói o índice CSR se ele estiver inválido."""
+    if not indice_vizinhos.valido:
+        indice_vizinhos.build(vertices, arestas)
+
+
+def create_graph(indexado=False, compacto=False, janela=None, tamanho_balde=None):
     """
     Cria e retorna uma estrutura de grafo com lista de arestas e lista de vértices.
 
     Passos:
     1. Criar uma lista vazia chamada 'vertices'.
     2. Criar uma lista vazia chamada 'arestas', onde cada elemento será uma lista de tamanho 2 (origem, destino)
+       - se indexado=True, usar HashList para as duas (pertinência e remoção O(1))
+       - se compacto=True, usar uma CompactEdgeList (arrays tipados de ids)
+         para as arestas e uma HashList para os vértices
+       - se janela for informada, usar uma TemporalEdgeList (arestas expiram
+         após 'janela' unidades de tempo) e uma HashList para os vértices
     3. Retornar vertices e arestas
     """
+    if janela is not None:
+        return HashList(), TemporalEdgeList(janela, tamanho_balde)
+
+    if compacto:
+        return HashList(), CompactEdgeList()
+
+    if indexado:
+        return HashList(), HashList()
+
     vertices = []
     arestas = []
     return vertices, arestas
 
 
-def insert_vertex(vertices, vertice):
+def insert_vertex(vertices, vertice, componentes=None):
     """
     Adiciona um novo vértice no grafo.
 
     Passos:
     1. Verificar se o vértice já existe em 'vertices'.
     2. Se não existir, adicionar à lista 'vertices'.
+       - se houver union-find de componentes, registrar o vértice
     """
     if vertice not in vertices:
         vertices.append(vertice)
+        if componentes is not None:
+            componentes.track_vertex(vertice)
         return True
     return False
 
-def insert_edge(vertices, arestas, origem, destino, nao_direcionado=False):
+def insert_edge(vertices, arestas, origem, destino, nao_direcionado=False, indice_vizinhos=None, componentes=None, instante=None):
     """
     Adiciona uma aresta entre dois vértices.
 
@@ -36,20 +582,41 @@ def insert_edge(vertices, arestas, origem, destino, nao_direcionado=False):
        - Se não existirem, chamar 'inserir_vertice' para adicioná-los.
     2. Adicionar uma lista [origem, destino] na lista 'arestas'.
     3. Se nao_direcionado=True, adicionar também [destino, origem].
+    (Com um grafo indexado, a verificação de repetição custa O(1).)
+       - em uma TemporalEdgeList, sempre registrar a ocorrência no
+         'instante' (uma aresta repetida tem seu instante renovado)
+    4. Se houver índice de vizinhos, invalidá-lo caso alguma aresta seja nova.
+    5. Se houver union-find de componentes, unir origem e destino.
     """
-    insert_vertex(vertices, origem)
-    insert_vertex(vertices, destino)
+    insert_vertex(vertices, origem, componentes)
+    insert_vertex(vertices, destino, componentes)
+    if componentes is not None:
+        componentes.track_edge(origem, destino)
+
+    if isinstance(arestas, TemporalEdgeList):
+        expiradas = arestas.add(origem, destino, instante)
+        if nao_direcionado:
+            expiradas += arestas.add(destino, origem, instante)
+        if indice_vizinhos is not None:
+            indice_vizinhos.invalidate()
+        if expiradas and componentes is not None:
+            componentes.invalidate()
+        return
 
     aresta = [origem, destino]
     if aresta not in arestas:
         arestas.append(aresta)
+        if indice_vizinhos is not None:
+            indice_vizinhos.invalidate()
 
     if nao_direcionado:
         aresta_inversa = [destino, origem]
         if aresta_inversa not in arestas:
             arestas.append(aresta_inversa)
+            if indice_vizinhos is not None:
+                indice_vizinhos.invalidate()
 
-def remove_edge(arestas, origem, destino, nao_direcionado=False):
+def remove_edge(arestas, origem, destino, nao_direcionado=False, indice_vizinhos=None, componentes=None):
     """
     Remove uma aresta entre dois vértices.
 
@@ -57,17 +624,28 @@ def remove_edge(arestas, origem, destino, nao_direcionado=False):
     1. Percorrer a lista de Arestas procurando [origem, destino]
     2. Se encontrar, remover
     3. Se nao_direcionado=True, também procurar por [destino, origem]
+    (Com um grafo indexado, busca e remoção custam O(1).)
+    4. Se houver índice de vizinhos ou union-find de componentes, invalidá-los
+       caso alguma aresta seja removida.
     """
     aresta = [origem, destino]
     if aresta in arestas:
         arestas.remove(aresta)
+        if indice_vizinhos is not None:
+            indice_vizinhos.invalidate()
+        if componentes is not None:
+            componentes.invalidate()
 
     if nao_direcionado:
         aresta_inversa = [destino, origem]
         if aresta_inversa in arestas:
             arestas.remove(aresta_inversa)
+            if indice_vizinhos is not None:
+                indice_vizinhos.invalidate()
+            if componentes is not None:
+                componentes.invalidate()
 
-def remove_vertex(vertices, arestas, vertice):
+def remove_vertex(vertices, arestas, vertice, indice_vizinhos=None, componentes=None):
     """
     Remove um vértice e todas as arestas conectadas a ele.
 
@@ -76,12 +654,23 @@ def remove_vertex(vertices, arestas, vertice):
     2. Caso encontrado, remover o vértice da lista 'vertices'.
     3. Percorrer a lista de 'arestas' e remover todas onde o vértice aparece
        como origem ou destino.
+       - em uma CompactEdgeList, apenas marcar essas arestas como removidas
+    4. Se houver índice de vizinhos ou union-find de componentes, invalidá-los.
     """
     if vertice in vertices:
         vertices.remove(vertice)
     else:
         return
 
+    if componentes is not None:
+        componentes.invalidate()
+
+    if isinstance(arestas, (CompactEdgeList, TemporalEdgeList)):
+        arestas.remove_vertex(vertice)
+        if indice_vizinhos is not None:
+            indice_vizinhos.invalidate()
+        return
+
     arestas_a_manter = []
     for aresta in arestas:
         origem, destino = aresta
@@ -91,6 +680,79 @@ def remove_vertex(vertices, arestas, vertice):
     arestas.clear()
     arestas.extend(arestas_a_manter)
 
+    if indice_vizinhos is not None:
+        indice_vizinhos.invalidate()
+
+def remove_edges(arestas, removidas, nao_direcionado=False, indice_vizinhos=None, componentes=None):
+    """
+    Remove várias arestas de uma vez.
+
+    Passos:
+    1. Juntar as arestas a remover em um conjunto de tuplas (origem, destino)
+       (e também (destino, origem), se nao_direcionado=True).
+    2. Em uma lista simples, filtrar 'arestas' uma única vez (O(E), em vez
+       de uma busca linear por aresta removida).
+       - em uma HashList ou CompactEdgeList, remover cada uma em O(1)
+    3. Se alguma aresta for removida, invalidar o índice de vizinhos e o
+       union-find de componentes, se houver.
+    """
+    conjunto = set()
+    for origem, destino in removidas:
+        conjunto.add((origem, destino))
+        if nao_direcionado:
+            conjunto.add((destino, origem))
+
+    tamanho = len(arestas)
+    if isinstance(arestas, list):
+        arestas[:] = [aresta for aresta in arestas if tuple(aresta) not in conjunto]
+    else:
+        for aresta in conjunto:
+            if aresta in arestas:
+                arestas.remove(aresta)
+
+    if len(arestas) != tamanho:
+        if indice_vizinhos is not None:
+            indice_vizinhos.invalidate()
+        if componentes is not None:
+            componentes.invalidate()
+
+def remove_vertices(vertices, arestas, removidos, indice_vizinhos=None, componentes=None):
+    """
+    Remove vários vértices e todas as arestas conectadas a eles, filtrando
+    a lista de arestas uma única vez (remove_vertex chamado k vezes refaz a
+    lista inteira k vezes).
+
+    Passos:
+    1. Separar os vértices que existem em 'vertices'; se nenhum, terminar.
+    2. Retirá-los de 'vertices' (uma passada em uma lista simples).
+    3. Manter apenas as arestas sem nenhuma ponta removida.
+       - em uma CompactEdgeList, marcá-las como removidas em uma passada
+    4. Invalidar o índice de vizinhos e o union-find de componentes, se houver.
+    """
+    presentes = [vertice for vertice in dict.fromkeys(removidos) if vertice in vertices]
+    if not presentes:
+        return
+    conjunto = set(presentes)
+
+    if isinstance(vertices, list):
+        vertices[:] = [vertice for vertice in vertices if vertice not in conjunto]
+    else:
+        for vertice in presentes:
+            vertices.remove(vertice)
+
+    if isinstance(arestas, (CompactEdgeList, TemporalEdgeList)):
+        arestas.remove_vertices(presentes)
+    else:
+        arestas_a_manter = [aresta for aresta in arestas
+                            if aresta[0] not in conjunto and aresta[1] not in conjunto]
+        arestas.clear()
+        arestas.extend(arestas_a_manter)
+
+    if indice_vizinhos is not None:
+        indice_vizinhos.invalidate()
+    if componentes is not None:
+        componentes.invalidate()
+
 def edge_exists(arestas, origem, destino):
     """
     Verifica se existe uma aresta entre origem e destino.
@@ -99,20 +761,33 @@ def edge_exists(arestas, origem, destino):
     1. Percorrer a lista de aresta procurando [origem, destino]
     2. Retornar True se encontrar
     3. Caso não encontre na lista, retornar False no final.
+    (Com um grafo indexado, a busca é uma consulta O(1) no dict.)
     """
     return [origem, destino] in arestas
 
 
-def neighbors(vertices, arestas, vertice):
+def neighbors(vertices, arestas, vertice, indice_vizinhos=None, janela=None):
     """
     Retorna a lista de vizinhos (vértices alcançáveis a partir de 'vertice').
+    Com um índice CSR ('indice_vizinhos'), a consulta custa O(grau de saída).
 
     Passos:
+    0. Em uma TemporalEdgeList, usar seu próprio índice de vizinhos
+       (O(grau de saída)), opcionalmente restrito aos últimos 'janela'.
+       Se houver índice de vizinhos, (re)construí-lo se necessário e
+       retornar a fatia de alvos do vértice.
     1. Criar uma lista vazia chamada 'vizinhos'.
     2. Percorrer todas as arestas [origem, destino].
     3. Se origem == vertice, adicionar destino na lista de vizinhos.
     4. Retornar a lista final.
     """
+    if isinstance(arestas, TemporalEdgeList):
+        return arestas.neighbors(vertice, janela)
+
+    if indice_vizinhos is not None:
+        _ensure_built(vertices, arestas, indice_vizinhos)
+        return indice_vizinhos.neighbors(vertice)
+
     lista_vizinhos = []
     for origem, destino in arestas:
         if origem == vertice:
@@ -121,6 +796,25 @@ def neighbors(vertices, arestas, vertice):
     return lista_vizinhos
 
 
+def edges_by_source(vertices, arestas, indice_vizinhos):
+    """
+    Percorre as arestas (origem, destino) agrupadas por origem, na ordem de
+    'vertices', lendo diretamente os arrays do índice CSR (sem copiá-los).
+
+    Passos:
+    1. (Re)construir o índice, se necessário.
+    2. Para cada posição p, gerar (nomes[p], nomes[q]) para cada alvo q
+       entre offsets[p] e offsets[p + 1].
+    """
+    _ensure_built(vertices, arestas, indice_vizinhos)
+    nomes = indice_vizinhos.nomes
+    offsets = indice_vizinhos.offsets
+    alvos = indice_vizinhos.alvos
+    for p, origem in enumerate(nomes):
+        for k in range(offsets[p], offsets[p + 1]):
+            yield origem, nomes[alvos[k]]
+
+
 def vertex_degrees(vertices, arestas):
     """
     Calcula o grau de entrada, saída e total de cada vértice.
@@ -133,9 +827,29 @@ def vertex_degrees(vertices, arestas):
        - Grau de entrada para o 'destino'.
        - Calcular o grau total (entrada + saída).
     4. Retornar o dicionário 'graus' para cada vértice.
+    (Em uma CompactEdgeList, as contagens são feitas de uma vez sobre os
+    arrays de ids, sem percorrer as arestas em Python; em uma
+    TemporalEdgeList, são lidas dos índices de vizinhos em O(V).)
     """
     graus = {}
 
+    if isinstance(arestas, TemporalEdgeList):
+        saida, entrada = arestas.degree_counts()
+        for v in vertices:
+            s = saida.get(v, 0)
+            e = entrada.get(v, 0)
+            graus[v] = {'entrada': e, 'saida': s, 'total': e + s}
+        return graus
+
+    if isinstance(arestas, CompactEdgeList):
+        saida, entrada = arestas.degree_counts()
+        for v in vertices:
+            i = arestas.ids.get(v)
+            s = saida.get(i, 0)
+            e = entrada.get(i, 0)
+            graus[v] = {'entrada': e, 'saida': s, 'total': e + s}
+        return graus
+
     for v in vertices:
         graus[v] = {'entrada': 0, 'saida': 0, 'total': 0}
 
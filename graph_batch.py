@@ -0,0 +1,189 @@
+import copy
+from typing import Dict, List, Tuple
+
+import graph_1
+import graph_2
+import graph_3
+import graph_protocol
+
+
+class GraphBatch:
+    """
+    Transação de mutações sobre um adaptador de graph_protocol.
+
+    As inserções e remoções são apenas registradas; commit() as aplica de
+    uma vez, por tipo de operação:
+    1. remoção de arestas (um único filtro da lista de arestas em graph_3);
+    2. remoção de vértices (uma única compactação da matriz em graph_2, um
+       único filtro das arestas em graph_3, uma passada pelas listas de
+       vizinhos em graph_1);
+    3. inserção de vértices, na ordem em que cada um apareceu pela primeira
+       vez (em insert_vertex ou como ponta de insert_edge);
+    4. inserção de arestas (graph_2.insert_edges cresce a matriz uma vez).
+
+    O resultado é o mesmo de aplicar as operações na ordem em que foram
+    registradas: uma remoção cancela as inserções anteriores do mesmo item,
+    e uma inserção posterior a uma remoção é aplicada depois dela. Esse
+    agrupamento só vale para representações em que uma aresta existe ou
+    não (matriz, listas de arestas, HashGraph sem multigrafo). Em um
+    multigrafo de graph_1 (listas simples, ou HashGraph com
+    multigrafo=True), arestas repetidas se acumulam e cada remoção tira
+    uma só cópia; ali as operações são reaplicadas uma a uma, na ordem,
+    assim como em qualquer outro Graph.
+
+    Se alguma etapa falhar, o estado do grafo (incluindo índices mantidos
+    pelo adaptador) é restaurado a partir de uma cópia feita no início do
+    commit, e a exceção é propagada. A cópia custa O(tamanho do grafo);
+    com reversivel=False ela não é feita.
+
+    Também pode ser usada como gerenciador de contexto: o commit acontece
+    na saída do bloco, e nada é aplicado se o bloco lançar uma exceção.
+    """
+
+    def __init__(self, grafo: graph_protocol.Graph, reversivel: bool = True):
+        self.grafo = grafo
+        self.reversivel = reversivel
+        self._limpar()
+
+    def _limpar(self):
+        self.operacoes: List[Tuple] = []
+        self.vertices_inseridos: Dict[str, None] = {}
+        self.arestas_inseridas: Dict[Tuple[str, str], None] = {}
+        self.vertices_removidos: Dict[str, None] = {}
+        self.arestas_removidas: Dict[Tuple[str, str], None] = {}
+
+    def insert_vertex(self, vertice: str) -> None:
+        self.operacoes.append(('insert_vertex', vertice))
+        self.vertices_inseridos[vertice] = None
+
+    def insert_edge(self, origem: str, destino: str, nao_direcionado: bool = False) -> None:
+        self.operacoes.append(('insert_edge', origem, destino, nao_direcionado))
+        # as pontas entram na ordem em que a inserção sequencial as criaria
+        self.vertices_inseridos.setdefault(origem)
+        self.vertices_inseridos.setdefault(destino)
+        self.arestas_inseridas[(origem, destino)] = None
+        if nao_direcionado:
+            self.arestas_inseridas[(destino, origem)] = None
+
+    def remove_edge(self, origem: str, destino: str, nao_direcionado: bool = False) -> None:
+        self.operacoes.append(('remove_edge', origem, destino, nao_direcionado))
+        pares = [(origem, destino), (destino, origem)] if nao_direcionado else [(origem, destino)]
+        for par in pares:
+            # a aresta cancelada ainda cria suas pontas (já registradas em vertices_inseridos)
+            self.arestas_inseridas.pop(par, None)
+            self.arestas_removidas[par] = None
+
+    def remove_vertex(self, vertice: str) -> None:
+        self.operacoes.append(('remove_vertex', vertice))
+        self.arestas_inseridas = {aresta: None for aresta in self.arestas_inseridas if vertice not in aresta}
+        self.vertices_inseridos.pop(vertice, None)
+        self.vertices_removidos[vertice] = None
+
+    def __len__(self) -> int:
+        """Número de operações registradas."""
+        return len(self.operacoes)
+
+    def _is_multigraph(self) -> bool:
+        """Função auxiliar: o adaptador guarda arestas repetidas (multigrafo de graph_1)?"""
+        grafo = self.grafo.grafo
+        return not isinstance(grafo, graph_1.HashGraph) or grafo.multigrafo
+
+    def discard(self) -> None:
+        """Descarta as operações registradas, sem aplicá-las."""
+        self._limpar()
+
+    def commit(self) -> None:
+        """Aplica as operações registradas (ou nenhuma, se alguma etapa falhar)."""
+        salvo = copy.deepcopy(vars(self.grafo)) if self.reversivel else None
+        try:
+            if isinstance(self.grafo, graph_protocol.AdjacencyListGraph) and not self._is_multigraph():
+                self._apply_adjacency_list()
+            elif isinstance(self.grafo, graph_protocol.AdjacencyMatrixGraph):
+                self._apply_matrix()
+            elif isinstance(self.grafo, graph_protocol.EdgeListGraph):
+                self._apply_edge_list()
+            else:
+                self._replay()
+        except BaseException:
+            if salvo is not None:
+                for nome, valor in salvo.items():
+                    _restore(self.grafo, nome, valor)
+            raise
+        self._limpar()
+
+    def _apply_adjacency_list(self):
+        g = self.grafo
+        for origem, destino in self.arestas_removidas:
+            graph_1.remove_edge(g.grafo, origem, destino, graus=g.graus, predecessores=g.predecessores)
+        graph_1.remove_vertices(g.grafo, list(self.vertices_removidos), g.graus, g.predecessores)
+        for vertice in self.vertices_inseridos:
+            if vertice not in g.grafo:
+                graph_1.insert_vertex(g.grafo, vertice, g.graus, g.predecessores)
+        for origem, destino in self.arestas_inseridas:
+            graph_1.insert_edge(g.grafo, origem, destino, graus=g.graus, predecessores=g.predecessores)
+
+    def _apply_matrix(self):
+        g = self.grafo
+        for origem, destino in self.arestas_removidas:
+            graph_2.remove_edge(g.matriz, g.lista_vertices, origem, destino, indice=g.indice, graus=g.graus)
+        graph_2.remove_vertices(g.matriz, g.lista_vertices, list(self.vertices_removidos), g.indice, g.graus)
+        for vertice in self.vertices_inseridos:
+            graph_2.insert_vertex(g.matriz, g.lista_vertices, vertice, g.indice, g.graus)
+        graph_2.insert_edges(g.matriz, g.lista_vertices, list(self.arestas_inseridas), indice=g.indice, graus=g.graus)
+
+    def _apply_edge_list(self):
+        g = self.grafo
+        graph_3.remove_edges(g.arestas, list(self.arestas_removidas), indice_vizinhos=g.indice_vizinhos)
+        graph_3.remove_vertices(g.lista_vertices, g.arestas, list(self.vertices_removidos), g.indice_vizinhos)
+        for vertice in self.vertices_inseridos:
+            graph_3.insert_vertex(g.lista_vertices, vertice)
+        for origem, destino in self.arestas_inseridas:
+            graph_3.insert_edge(g.lista_vertices, g.arestas, origem, destino, indice_vizinhos=g.indice_vizinhos)
+
+    def _replay(self):
+        """Função auxiliar: multigrafos e qualquer outro Graph, operação por operação, na ordem (sem ganho de lote)."""
+        for nome, *args in self.operacoes:
+            getattr(self.grafo, nome)(*args)
+
+    def __enter__(self) -> "GraphBatch":
+        return self
+
+    def __exit__(self, tipo, valor, rastreamento) -> bool:
+        if tipo is None:
+            self.commit()
+        else:
+            self.discard()
+        return False
+
+
+def _restore(grafo, nome: str, salvo):
+    """
+    Função auxiliar: restaura o atributo 'nome' do adaptador a partir da
+    cópia 'salvo', no próprio objeto sempre que possível (quem guardou uma
+    referência à lista/dict/matriz continua vendo o estado restaurado).
+    """
+    atual = getattr(grafo, nome)
+    if type(atual) is not type(salvo):
+        setattr(grafo, nome, salvo)
+    elif isinstance(atual, list):
+        atual[:] = salvo
+    elif isinstance(atual, dict):
+        atual.clear()
+        atual.update(salvo)
+    elif hasattr(atual, '__dict__'):
+        atual.__dict__.clear()
+        atual.__dict__.update(salvo.__dict__)
+    else:
+        setattr(grafo, nome, salvo)
+
+
+def apply_batch(grafo: graph_protocol.Graph, operacoes: List[Tuple], reversivel: bool = True) -> None:
+    """
+    Atalho: aplica uma lista de operações ("insert_vertex", "v"),
+    ("insert_edge", "a", "b"), ("remove_edge", "a", "b"),
+    ("remove_vertex", "v") ... como uma única transação.
+    """
+    lote = GraphBatch(grafo, reversivel)
+    for nome, *args in operacoes:
+        getattr(lote, nome)(*args)
+    lote.commit()
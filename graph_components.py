@@ -0,0 +1,113 @@
+from typing import Callable, Dict, Hashable, Iterable, Tuple
+
+import graph_2
+import graph_protocol
+
+
+class DisjointSet:
+    """
+    Componentes conexos mantidos por union-find (compressão de caminho e
+    união por rank), passados como 'componentes' para as funções de
+    inserção e remoção de graph_1, graph_2 e graph_3.
+
+    - Inserções chamam track_vertex()/track_edge() e mantêm a estrutura atualizada.
+    - Remoções não podem ser desfeitas em um union-find: elas apenas chamam
+      invalidate(), e a estrutura é reconstruída a partir do grafo (com a
+      função 'reconstruir') na próxima consulta.
+    - As arestas são tratadas como não-direcionadas (componentes fracamente
+      conexos, que são os componentes conexos de um grafo não-direcionado).
+    """
+
+    def __init__(self, reconstruir: Callable[[], Tuple[Iterable[Hashable], Iterable[Tuple[Hashable, Hashable]]]]):
+        self.reconstruir = reconstruir
+        self.pai: Dict[Hashable, Hashable] = {}
+        self.rank: Dict[Hashable, int] = {}
+        self.quantidade = 0
+        self.valido = False
+
+    def add(self, vertice):
+        if vertice not in self.pai:
+            self.pai[vertice] = vertice
+            self.rank[vertice] = 0
+            self.quantidade += 1
+
+    def find(self, vertice):
+        raiz = vertice
+        while self.pai[raiz] != raiz:
+            raiz = self.pai[raiz]
+        while self.pai[vertice] != raiz:
+            self.pai[vertice], vertice = raiz, self.pai[vertice]
+        return raiz
+
+    def union(self, a, b):
+        self.add(a)
+        self.add(b)
+        raiz_a = self.find(a)
+        raiz_b = self.find(b)
+        if raiz_a == raiz_b:
+            return
+        if self.rank[raiz_a] < self.rank[raiz_b]:
+            raiz_a, raiz_b = raiz_b, raiz_a
+        self.pai[raiz_b] = raiz_a
+        if self.rank[raiz_a] == self.rank[raiz_b]:
+            self.rank[raiz_a] += 1
+        self.quantidade -= 1
+
+    def track_vertex(self, vertice):
+        """Registra um vértice inserido (ignorado enquanto a estrutura estiver inválida)."""
+        if self.valido:
+            self.add(vertice)
+
+    def track_edge(self, origem, destino):
+        """Registra uma aresta inserida (ignorado enquanto a estrutura estiver inválida)."""
+        if self.valido:
+            self.union(origem, destino)
+
+    def invalidate(self):
+        self.valido = False
+
+    def _ensure_valid(self):
+        if self.valido:
+            return
+        self.pai = {}
+        self.rank = {}
+        self.quantidade = 0
+        vertices, arestas = self.reconstruir()
+        for vertice in vertices:
+            self.add(vertice)
+        for origem, destino in arestas:
+            self.union(origem, destino)
+        self.valido = True
+
+    def same_component(self, a, b) -> bool:
+        """Verifica se 'a' e 'b' estão no mesmo componente (quase O(1))."""
+        self._ensure_valid()
+        if a not in self.pai or b not in self.pai:
+            return False
+        return self.find(a) == self.find(b)
+
+    def count(self) -> int:
+        """Número de componentes conexos."""
+        self._ensure_valid()
+        return self.quantidade
+
+
+def create_components_adjacency_list(grafo: dict) -> DisjointSet:
+    """Cria o union-find de um grafo de graph_1 (construído na primeira consulta, O(V + E))."""
+    adaptador = graph_protocol.AdjacencyListGraph(grafo)
+    return DisjointSet(lambda: (adaptador.vertices(), adaptador.edges()))
+
+
+def create_components_matrix(matriz, vertices) -> DisjointSet:
+    """Cria o union-find de (matriz, vertices) de graph_2 (construído na primeira consulta)."""
+    def reconstruir():
+        indice = graph_2.create_index(vertices)
+        arestas = ((origem, destino) for origem in vertices
+                   for destino in graph_2.neighbors(matriz, vertices, origem, indice))
+        return list(vertices), arestas
+    return DisjointSet(reconstruir)
+
+
+def create_components_edge_list(vertices, arestas) -> DisjointSet:
+    """Cria o union-find de (vertices, arestas) de graph_3 (construído na primeira consulta, O(V + E))."""
+    return DisjointSet(lambda: (list(vertices), arestas))
@@ -0,0 +1,204 @@
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Tuple
+
+import graph_frozen
+import graph_protocol
+from graph_frozen import FrozenGraph
+
+
+class ReadWriteLock:
+    """
+    Trava leitores-escritor: vários leitores ao mesmo tempo, ou um único
+    escritor. Escritores esperando têm preferência, para que um fluxo
+    contínuo de leituras não impeça as mutações.
+    """
+
+    def __init__(self):
+        self.condicao = threading.Condition(threading.Lock())
+        self.leitores = 0
+        self.escrevendo = False
+        self.escritores_esperando = 0
+
+    def acquire_read(self):
+        with self.condicao:
+            while self.escrevendo or self.escritores_esperando:
+                self.condicao.wait()
+            self.leitores += 1
+
+    def release_read(self):
+        with self.condicao:
+            self.leitores -= 1
+            if self.leitores == 0:
+                self.condicao.notify_all()
+
+    def acquire_write(self):
+        with self.condicao:
+            self.escritores_esperando += 1
+            while self.escrevendo or self.leitores:
+                self.condicao.wait()
+            self.escritores_esperando -= 1
+            self.escrevendo = True
+
+    def release_write(self):
+        with self.condicao:
+            self.escrevendo = False
+            self.condicao.notify_all()
+
+    @contextmanager
+    def read(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+class ConcurrentGraph:
+    """
+    Fachada thread-safe sobre qualquer adaptador de graph_protocol.
+
+    Consultas (neighbors, edge_exists, valid_path, ...) rodam em paralelo
+    sob a trava de leitura; mutações rodam sozinhas sob a trava de escrita,
+    então nenhum leitor vê um estado intermediário (ex.: uma linha da matriz
+    já removida e as colunas ainda não).
+
+    O índice CSR de um EdgeListGraph é construído sob demanda por uma
+    leitura; essa construção é feita por um único leitor, sob uma trava
+    própria, e os demais esperam por ela.
+    """
+
+    def __init__(self, grafo: graph_protocol.Graph):
+        self.grafo = grafo
+        self.trava = ReadWriteLock()
+        self.trava_cache = threading.Lock()
+
+    def _prepare_read(self):
+        """Função auxiliar: constrói (uma vez) o índice CSR preguiçoso antes das leituras."""
+        indice = getattr(self.grafo, 'indice_vizinhos', None)
+        if indice is not None and not indice.valido:
+            with self.trava_cache:
+                if not indice.valido:
+                    indice.build(self.grafo.lista_vertices, self.grafo.arestas)
+
+    def insert_vertex(self, vertice: str) -> None:
+        with self.trava.write():
+            self.grafo.insert_vertex(vertice)
+
+    def insert_edge(self, origem: str, destino: str, nao_direcionado: bool = False) -> None:
+        with self.trava.write():
+            self.grafo.insert_edge(origem, destino, nao_direcionado)
+
+    def remove_edge(self, origem: str, destino: str, nao_direcionado: bool = False) -> None:
+        with self.trava.write():
+            self.grafo.remove_edge(origem, destino, nao_direcionado)
+
+    def remove_vertex(self, vertice: str) -> None:
+        with self.trava.write():
+            self.grafo.remove_vertex(vertice)
+
+    def neighbors(self, vertice: str) -> List[str]:
+        with self.trava.read():
+            self._prepare_read()
+            return list(self.grafo.neighbors(vertice))
+
+    def edge_exists(self, origem: str, destino: str) -> bool:
+        with self.trava.read():
+            return self.grafo.edge_exists(origem, destino)
+
+    def valid_path(self, caminho: List[str]) -> bool:
+        with self.trava.read():
+            return self.grafo.valid_path(caminho)
+
+    def vertex_degrees(self) -> Dict[str, Dict[str, int]]:
+        with self.trava.read():
+            return self.grafo.vertex_degrees()
+
+    def vertices(self) -> List[str]:
+        with self.trava.read():
+            return self.grafo.vertices()
+
+    def edges(self) -> List[Tuple[str, str]]:
+        with self.trava.read():
+            return list(self.grafo.edges())
+
+
+class VersionedGraph:
+    """
+    Grafo com snapshots copy-on-write numerados por época.
+
+    - Leitores consultam o FrozenGraph publicado mais recente; obter a
+      referência é uma única leitura de atributo, então eles nunca esperam
+      por travas nem por uma reconstrução.
+    - O escritor aplica as mutações no adaptador mutável e chama publish()
+      (ou usa auto_publicar=True) para congelar um novo snapshot, fora da
+      visão dos leitores, e trocá-lo atomicamente, incrementando a época.
+    - Um leitor que precisa de várias consultas consistentes entre si usa
+      snapshot(), que devolve (época, FrozenGraph) de uma vez.
+    """
+
+    def __init__(self, grafo: graph_protocol.Graph, auto_publicar: bool = False):
+        self.grafo = grafo
+        self.auto_publicar = auto_publicar
+        self.trava_escrita = threading.Lock()
+        self.atual: Tuple[int, FrozenGraph] = (0, graph_frozen.freeze(grafo))
+
+    def publish(self) -> int:
+        """Congela o estado atual do adaptador como uma nova época e a retorna."""
+        with self.trava_escrita:
+            return self._publish()
+
+    def _publish(self) -> int:
+        epoca = self.atual[0] + 1
+        self.atual = (epoca, graph_frozen.freeze(self.grafo))
+        return epoca
+
+    def _mutate(self, operacao: str, *args):
+        with self.trava_escrita:
+            getattr(self.grafo, operacao)(*args)
+            if self.auto_publicar:
+                self._publish()
+
+    def insert_vertex(self, vertice: str) -> None:
+        self._mutate('insert_vertex', vertice)
+
+    def insert_edge(self, origem: str, destino: str, nao_direcionado: bool = False) -> None:
+        self._mutate('insert_edge', origem, destino, nao_direcionado)
+
+    def remove_edge(self, origem: str, destino: str, nao_direcionado: bool = False) -> None:
+        self._mutate('remove_edge', origem, destino, nao_direcionado)
+
+    def remove_vertex(self, vertice: str) -> None:
+        self._mutate('remove_vertex', vertice)
+
+    def snapshot(self) -> Tuple[int, FrozenGraph]:
+        return self.atual
+
+    def epoch(self) -> int:
+        return self.atual[0]
+
+    def neighbors(self, vertice: str) -> List[str]:
+        return self.atual[1].neighbors(vertice)
+
+    def edge_exists(self, origem: str, destino: str) -> bool:
+        return self.atual[1].edge_exists(origem, destino)
+
+    def valid_path(self, caminho: List[str]) -> bool:
+        return self.atual[1].valid_path(caminho)
+
+    def vertex_degrees(self) -> Dict[str, Dict[str, int]]:
+        return self.atual[1].vertex_degrees()
+
+    def vertices(self) -> List[str]:
+        return self.atual[1].vertices()
+
+    def edges(self) -> List[Tuple[str, str]]:
+        return list(self.atual[1].edges())
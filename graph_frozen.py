@@ -0,0 +1,144 @@
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import graph_protocol
+
+
+def build_csr(vertices: Iterable[str], arestas: Iterable[Tuple[str, str]]):
+    """
+    Monta (nomes, offsets, alvos) no formato CSR a partir de vértices e arestas.
+
+    Passos:
+    1. Atribuir ids densos aos vértices, na ordem de 'vertices' (vértices que
+       só aparecem nas arestas entram no final).
+    2. Agrupar os ids dos destinos por origem.
+    3. Ordenar cada linha e remover repetições (permite busca binária).
+    4. offsets[i]..offsets[i + 1] delimita a linha i dentro de 'alvos'.
+    """
+    nomes: List[str] = []
+    ids = {}
+    for vertice in vertices:
+        if vertice not in ids:
+            ids[vertice] = len(nomes)
+            nomes.append(vertice)
+
+    linhas: List[List[int]] = [[] for _ in nomes]
+    for origem, destino in arestas:
+        for vertice in (origem, destino):
+            if vertice not in ids:
+                ids[vertice] = len(nomes)
+                nomes.append(vertice)
+                linhas.append([])
+        linhas[ids[origem]].append(ids[destino])
+
+    offsets = array('q', [0])
+    alvos = array('i')
+    for linha in linhas:
+        alvos.extend(sorted(set(linha)))
+        offsets.append(len(alvos))
+    return nomes, offsets, alvos
+
+
+class FrozenGraph:
+    """
+    Grafo imutável em CSR, para o padrão "construir uma vez, consultar muitas".
+
+    - Vértices viram ids inteiros densos; 'nomes' (tupla) e 'ids'
+      (mapeamento somente leitura) convertem entre nomes e ids.
+    - 'offsets', 'alvos', 'graus_saida' e 'graus_entrada' são memoryviews
+      somente leitura sobre arrays contíguos.
+    - Nenhum método altera o estado depois da construção, então o mesmo
+      objeto pode ser consultado por várias threads sem travas. A única
+      exceção é 'reverso', o grafo invertido guardado por
+      graph_traversal.reverse() na primeira vez em que é pedido (duas
+      threads podem construí-lo ao mesmo tempo; o resultado é o mesmo).
+    """
+
+    def __init__(self, nomes: List[str], offsets: array, alvos: array):
+        entrada = Counter(alvos)
+        self.nomes = tuple(nomes)
+        self.ids = MappingProxyType({nome: i for i, nome in enumerate(nomes)})
+        self.offsets = memoryview(offsets).toreadonly()
+        self.alvos = memoryview(alvos).toreadonly()
+        self.graus_saida = memoryview(array('q', (offsets[i + 1] - offsets[i] for i in range(len(nomes))))).toreadonly()
+        self.graus_entrada = memoryview(array('q', (entrada.get(i, 0) for i in range(len(nomes))))).toreadonly()
+        self.reverso: Optional["FrozenGraph"] = None
+
+    def __len__(self) -> int:
+        return len(self.nomes)
+
+    def vertices(self) -> List[str]:
+        return list(self.nomes)
+
+    def neighbor_ids(self, i: int) -> memoryview:
+        """Ids dos vizinhos do vértice de id i (fatia sem cópia, em ordem crescente)."""
+        return self.alvos[self.offsets[i]:self.offsets[i + 1]]
+
+    def neighbors(self, vertice: str) -> List[str]:
+        i = self.ids.get(vertice)
+        if i is None:
+            return []
+        return [self.nomes[j] for j in self.neighbor_ids(i)]
+
+    def edge_exists(self, origem: str, destino: str) -> bool:
+        """Busca binária do id do destino na linha ordenada da origem (O(log grau))."""
+        i = self.ids.get(origem)
+        j = self.ids.get(destino)
+        if i is None or j is None:
+            return False
+        inicio, fim = self.offsets[i], self.offsets[i + 1]
+        k = bisect_left(self.alvos, j, inicio, fim)
+        return k < fim and self.alvos[k] == j
+
+    def vertex_degree(self, vertice: str):
+        """Grau {'in', 'out', 'total'} de um vértice (O(1)), ou None se não existir."""
+        i = self.ids.get(vertice)
+        if i is None:
+            return None
+        return {'in': self.graus_entrada[i], 'out': self.graus_saida[i],
+                'total': self.graus_entrada[i] + self.graus_saida[i]}
+
+    def vertex_degrees(self) -> Dict[str, Dict[str, int]]:
+        return {nome: self.vertex_degree(nome) for nome in self.nomes}
+
+    def valid_path(self, caminho: List[str]) -> bool:
+        for i in range(len(caminho) - 1):
+            if not self.edge_exists(caminho[i], caminho[i + 1]):
+                return False
+        return True
+
+    def edges(self) -> Iterator[Tuple[str, str]]:
+        for i, origem in enumerate(self.nomes):
+            for j in self.neighbor_ids(i):
+                yield origem, self.nomes[j]
+
+
+def freeze(grafo) -> FrozenGraph:
+    """
+    Congela um grafo em um FrozenGraph, em O(V + E log grau).
+
+    Aceita um grafo de graph_1 (dict) ou qualquer objeto com vertices() e
+    edges() (os adaptadores de graph_protocol, um SnapshotGraph...).
+    Para as estruturas de graph_2 e graph_3, ver freeze_matrix e freeze_edge_list.
+    """
+    if isinstance(grafo, dict):
+        grafo = graph_protocol.AdjacencyListGraph(grafo)
+    return FrozenGraph(*build_csr(grafo.vertices(), grafo.edges()))
+
+
+def freeze_adjacency_list(grafo: dict) -> FrozenGraph:
+    """Congela um grafo de graph_1."""
+    return freeze(grafo)
+
+
+def freeze_matrix(matriz, vertices: List[str]) -> FrozenGraph:
+    """Congela (matriz, vertices) de graph_2."""
+    return freeze(graph_protocol.AdjacencyMatrixGraph(matriz, vertices))
+
+
+def freeze_edge_list(vertices, arestas) -> FrozenGraph:
+    """Congela (vertices, arestas) de graph_3."""
+    return FrozenGraph(*build_csr(vertices, arestas))
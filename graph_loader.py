@@ -0,0 +1,171 @@
+import mmap
+import os
+import time
+from itertools import islice
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+import graph_1
+import graph_2
+import graph_3
+
+
+TAMANHO_BLOCO = 1 << 22
+TAMANHO_LOTE = 100_000
+
+
+def _parse_line(linha: str) -> Optional[Tuple[str, str]]:
+    """Função auxiliar: (origem, destino) de uma linha, ou None se ela for vazia/comentário."""
+    linha = linha.strip()
+    if not linha or linha.startswith('#'):
+        return None
+    campos = linha.split(',') if ',' in linha else linha.split()
+    if len(campos) < 2:
+        return None
+    return campos[0].strip(), campos[1].strip()
+
+
+def iter_edge_file(caminho: str, tamanho_bloco: int = TAMANHO_BLOCO,
+                   progresso: Optional[Callable[[Dict[str, float]], None]] = None) -> Iterator[Tuple[str, str]]:
+    """
+    Lê um arquivo de arestas ("origem destino" ou "origem,destino" por linha)
+    em blocos, através de um mmap, e gera os pares (origem, destino).
+
+    Passos:
+    1. Mapear o arquivo em memória (arquivos vazios não geram nada).
+    2. Ler blocos de 'tamanho_bloco' bytes, cortando no último '\\n' e
+       guardando o resto para o bloco seguinte.
+    3. Ignorar linhas vazias, linhas com menos de dois campos e comentários ('#').
+    4. Após cada bloco, chamar progresso(estatisticas) se informado, com
+       bytes lidos, total de bytes, arestas lidas, segundos e arestas/s.
+    A memória usada fica limitada a um bloco, qualquer que seja o tamanho do arquivo.
+    """
+    total = os.path.getsize(caminho)
+    if total == 0:
+        return
+
+    inicio = time.perf_counter()
+    arestas = 0
+    with open(caminho, 'rb') as arquivo, mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+        posicao = 0
+        while posicao < total:
+            fim = min(posicao + tamanho_bloco, total)
+            if fim < total:
+                corte = mapa.rfind(b'\n', posicao, fim)
+                if corte != -1:
+                    fim = corte + 1
+                else:
+                    proxima = mapa.find(b'\n', fim)
+                    fim = total if proxima == -1 else proxima + 1
+
+            for linha in mapa[posicao:fim].decode('utf-8').splitlines():
+                aresta = _parse_line(linha)
+                if aresta is not None:
+                    arestas += 1
+                    yield aresta
+            posicao = fim
+
+            if progresso is not None:
+                segundos = time.perf_counter() - inicio
+                progresso({
+                    'bytes': posicao,
+                    'total_bytes': total,
+                    'arestas': arestas,
+                    'segundos': segundos,
+                    'arestas_por_segundo': arestas / segundos if segundos > 0 else 0.0,
+                })
+
+
+def print_progress(estatisticas: Dict[str, float]):
+    """Callback de progresso simples: imprime percentual lido e vazão."""
+    percentual = 100 * estatisticas['bytes'] / estatisticas['total_bytes']
+    print(f"{percentual:5.1f}% - {estatisticas['arestas']} arestas "
+          f"({estatisticas['arestas_por_segundo']:.0f} arestas/s)")
+
+
+def _batches(arestas: Iterator[Tuple[str, str]], tamanho_lote: int) -> Iterator[List[Tuple[str, str]]]:
+    """Função auxiliar: agrupa as arestas em listas de até 'tamanho_lote' elementos."""
+    while True:
+        lote = list(islice(arestas, tamanho_lote))
+        if not lote:
+            return
+        yield lote
+
+
+def load_adjacency_list(caminho: str, grafo: Optional[dict] = None, nao_direcionado=False,
+                        tamanho_bloco: int = TAMANHO_BLOCO, progresso=None) -> dict:
+    """
+    Carrega um arquivo de arestas em um grafo de graph_1 (novo ou existente).
+    Cada aresta é um append O(1) (ou uma operação O(1) no dict de um HashGraph),
+    sem varrer as listas de vizinhos.
+    """
+    if grafo is None:
+        grafo = graph_1.create_graph()
+    for origem, destino in iter_edge_file(caminho, tamanho_bloco, progresso):
+        graph_1.insert_edge(grafo, origem, destino, nao_direcionado)
+    return grafo
+
+
+def load_matrix(caminho: str, matriz=None, vertices: Optional[List[str]] = None, nao_direcionado=False,
+                formato: str = "lista", indice: Optional[Dict[str, int]] = None,
+                tamanho_bloco: int = TAMANHO_BLOCO, tamanho_lote: int = TAMANHO_LOTE, progresso=None):
+    """
+    Carrega um arquivo de arestas em (matriz, vertices) de graph_2.
+    As arestas são inseridas em lotes com graph_2.insert_edges, então a
+    matriz cresce uma vez por lote e não uma vez por vértice novo.
+    """
+    if matriz is None:
+        matriz, vertices = graph_2.create_graph(formato)
+    if indice is None:
+        indice = graph_2.create_index(vertices)
+    for lote in _batches(iter_edge_file(caminho, tamanho_bloco, progresso), tamanho_lote):
+        graph_2.insert_edges(matriz, vertices, lote, nao_direcionado, indice)
+    return (matriz, vertices)
+
+
+def load_edge_list(caminho: str, vertices=None, arestas=None, nao_direcionado=False,
+                   indexado: bool = True, compacto: bool = False,
+                   tamanho_bloco: int = TAMANHO_BLOCO, progresso=None):
+    """
+    Carrega um arquivo de arestas em (vertices, arestas) de graph_3.
+
+    Passos:
+    1. Criar a estrutura (indexada por padrão) se nenhuma for informada.
+    2. Se 'vertices'/'arestas' forem listas simples, montar conjuntos
+       auxiliares com o conteúdo atual para a verificação de repetição;
+       HashList e CompactEdgeList já respondem 'in' em O(1).
+    3. Acrescentar cada vértice e aresta nova, sem varrer as listas.
+       - em uma CompactEdgeList, acrescentar todas as arestas em bloco
+         (extend) e descartar as repetições de uma vez no final, sem
+         consultar o índice a cada aresta
+    """
+    if vertices is None:
+        vertices, arestas = graph_3.create_graph(indexado, compacto)
+
+    vistos = set(vertices) if isinstance(vertices, list) else vertices
+
+    def lidas():
+        for origem, destino in iter_edge_file(caminho, tamanho_bloco, progresso):
+            for vertice in (origem, destino):
+                if vertice not in vistos:
+                    vertices.append(vertice)
+                    if isinstance(vertices, list):
+                        vistos.add(vertice)
+            yield origem, destino
+            if nao_direcionado:
+                yield destino, origem
+
+    if isinstance(arestas, graph_3.CompactEdgeList):
+        arestas.extend(lidas())
+        arestas.deduplicate()
+        return vertices, arestas
+
+    vistas = set(map(tuple, arestas)) if isinstance(arestas, list) else arestas
+    for origem, destino in lidas():
+        if (origem, destino) not in vistas:
+            if isinstance(arestas, list):
+                arestas.append([origem, destino])
+                vistas.add((origem, destino))
+            else:
+                arestas.append((origem, destino))
+
+    return vertices, arestas
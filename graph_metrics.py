@@ -0,0 +1,193 @@
+import functools
+import inspect
+import time
+from typing import Any, Callable, Dict, List
+
+import graph_1
+import graph_2
+import graph_3
+
+
+MODULOS = (graph_1, graph_2, graph_3)
+IGNORADAS = {'main', 'show_graph', 'list_neighbors'}
+NUM_BALDES = 24
+
+
+class OperationStats:
+    """
+    Estatísticas de uma operação: chamadas, tempo acumulado, histograma de
+    latência e número estimado de elementos varridos linearmente.
+
+    O balde k do histograma conta as chamadas com latência < 2**k µs
+    (o último balde acumula todo o resto).
+    """
+
+    def __init__(self):
+        self.chamadas = 0
+        self.segundos = 0.0
+        self.varreduras = 0
+        self.histograma = [0] * NUM_BALDES
+
+    def record(self, segundos: float, varreduras: int):
+        self.chamadas += 1
+        self.segundos += segundos
+        self.varreduras += varreduras
+        balde = min(int(segundos * 1e6).bit_length(), NUM_BALDES - 1)
+        self.histograma[balde] += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            'chamadas': self.chamadas,
+            'segundos': self.segundos,
+            'varreduras': self.varreduras,
+            'histograma_us': {f"<{2 ** k}": n for k, n in enumerate(self.histograma) if n},
+        }
+
+
+_estatisticas: Dict[str, OperationStats] = {}
+_originais: Dict[Any, Dict[str, Callable]] = {}
+
+
+def _is_list(valor) -> bool:
+    return isinstance(valor, list)
+
+
+def _graph_2_lookups(quantidade: int) -> Callable[[Dict[str, Any]], int]:
+    """Estimador: 'quantidade' buscas lineares em 'vertices' quando não há índice."""
+    def estimar(args):
+        if args.get('indice') is None:
+            return quantidade * len(args['vertices'])
+        return 0
+    return estimar
+
+
+def _graph_3_edge_scans(quantidade: int) -> Callable[[Dict[str, Any]], int]:
+    """Estimador: 'quantidade' varreduras de 'arestas' quando ela é uma lista simples."""
+    def estimar(args):
+        if _is_list(args['arestas']):
+            return quantidade * len(args['arestas'])
+        return 0
+    return estimar
+
+
+def _edge_pass(arestas) -> int:
+    """
+    Estimador: elementos visitados por uma passada completa em 'arestas',
+    lidos sem efeitos colaterais (len() de uma TemporalEdgeList expira
+    arestas, e o de uma CompactEdgeList descarta repetições pendentes).
+    Uma TemporalEdgeList nunca faz essa passada: suas leituras usam os
+    próprios índices de vizinhos.
+    """
+    if isinstance(arestas, graph_3.TemporalEdgeList):
+        return 0
+    if isinstance(arestas, graph_3.CompactEdgeList):
+        return len(arestas.origens)
+    return len(arestas)
+
+
+# Varreduras lineares feitas pela própria função (sem contar as funções que
+# ela chama, que são medidas separadamente).
+ESTIMADORES: Dict[str, Callable[[Dict[str, Any]], int]] = {
+    'graph_1.remove_vertex': lambda a: len(a['grafo']) if a.get('predecessores') is None and a['vertice'] in a['grafo'] else 0,
+    'graph_1.predecessors': lambda a: sum(map(len, a['grafo'].values())) if a.get('predecessores') is None else 0,
+    'graph_1.vertex_degree': lambda a: len(a['grafo']) if a.get('graus') is None else 0,
+    'graph_1.vertex_degrees': lambda a: sum(map(len, a['grafo'].values())) * len(a['grafo']) if a.get('graus') is None else 0,
+    'graph_1.edge_exists': lambda a: len(a['grafo'].get(a['origem'], ())) if _is_list(a['grafo'].get(a['origem'])) else 0,
+    'graph_2.insert_vertex': _graph_2_lookups(1),
+    'graph_2.insert_edge': _graph_2_lookups(2),
+    'graph_2.remove_vertex': _graph_2_lookups(1),
+    'graph_2.remove_edge': _graph_2_lookups(2),
+    'graph_2.edge_exists': _graph_2_lookups(2),
+    'graph_2.neighbors': lambda a: _graph_2_lookups(1)(a) + (len(a['vertices']) if _is_list(a['matriz']) else 0),
+    'graph_2.vertex_degree': lambda a: 2 * len(a['vertices']) ** 2 if _is_list(a['matriz']) and a.get('graus') is None else 0,
+    'graph_3.insert_vertex': lambda a: len(a['vertices']) if _is_list(a['vertices']) else 0,
+    'graph_3.insert_edge': _graph_3_edge_scans(1),
+    'graph_3.remove_edge': _graph_3_edge_scans(1),
+    'graph_3.edge_exists': _graph_3_edge_scans(1),
+    'graph_3.remove_vertex': lambda a: _edge_pass(a['arestas']) if a['vertice'] in a['vertices'] else 0,
+    'graph_3.neighbors': lambda a: _edge_pass(a['arestas']) if a.get('indice_vizinhos') is None else 0,
+    'graph_3.vertex_degrees': lambda a: len(a['vertices']) if isinstance(a['arestas'], graph_3.TemporalEdgeList) else _edge_pass(a['arestas']),
+}
+
+
+def _wrap(nome: str, funcao: Callable) -> Callable:
+    """Função auxiliar: versão instrumentada de 'funcao'."""
+    assinatura = inspect.signature(funcao)
+    estimador = ESTIMADORES.get(nome)
+    estatisticas = _estatisticas.setdefault(nome, OperationStats())
+
+    @functools.wraps(funcao)
+    def instrumentada(*args, **kwargs):
+        varreduras = 0
+        if estimador is not None:
+            argumentos = assinatura.bind(*args, **kwargs)
+            argumentos.apply_defaults()
+            varreduras = estimador(argumentos.arguments)
+        inicio = time.perf_counter()
+        try:
+            return funcao(*args, **kwargs)
+        finally:
+            estatisticas.record(time.perf_counter() - inicio, varreduras)
+
+    return instrumentada
+
+
+def enable():
+    """
+    Liga a instrumentação: substitui as funções públicas de graph_1, graph_2
+    e graph_3 por versões que registram chamadas, tempo, latência e
+    varreduras. Como a troca é feita nos próprios módulos, chamadas
+    internas (ex.: insert_edge chamando insert_vertex) também são medidas.
+    Desligada (padrão, ou após disable()), não há custo algum: as funções
+    originais são restauradas.
+    """
+    for modulo in MODULOS:
+        if modulo in _originais:
+            continue
+        originais = {}
+        for nome, funcao in inspect.getmembers(modulo, inspect.isfunction):
+            if nome.startswith('_') or nome in IGNORADAS or funcao.__module__ != modulo.__name__:
+                continue
+            originais[nome] = funcao
+            setattr(modulo, nome, _wrap(f"{modulo.__name__}.{nome}", funcao))
+        _originais[modulo] = originais
+
+
+def disable():
+    """Desliga a instrumentação, restaurando as funções originais (as estatísticas são mantidas)."""
+    for modulo, originais in _originais.items():
+        for nome, funcao in originais.items():
+            setattr(modulo, nome, funcao)
+    _originais.clear()
+
+
+def is_enabled() -> bool:
+    return bool(_originais)
+
+
+def snapshot() -> Dict[str, Dict[str, Any]]:
+    """Cópia das estatísticas atuais, {"modulo.funcao": {...}}, apenas das operações chamadas."""
+    return {nome: estatisticas.as_dict() for nome, estatisticas in sorted(_estatisticas.items())
+            if estatisticas.chamadas}
+
+
+def reset():
+    """Zera todas as estatísticas (a instrumentação continua no estado atual)."""
+    for estatisticas in _estatisticas.values():
+        estatisticas.__init__()
+
+
+def export_lines(prefixo: str = "graph") -> List[str]:
+    """
+    Estatísticas no formato texto "nome valor" (uma métrica por linha),
+    fácil de enviar para um coletor de métricas.
+    """
+    linhas = []
+    for nome, dados in snapshot().items():
+        base = f"{prefixo}.{nome}"
+        linhas.append(f"{base}.chamadas {dados['chamadas']}")
+        linhas.append(f"{base}.segundos {dados['segundos']:.9f}")
+        linhas.append(f"{base}.varreduras {dados['varreduras']}")
+        for balde, n in dados['histograma_us'].items():
+            linhas.append(f"{base}.latencia_us{{le=\"{balde[1:]}\"}} {n}")
+    return linhas
@@ -0,0 +1,317 @@
+import os
+import sys
+from array import array
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from itertools import chain, compress, count, repeat
+from multiprocessing import Pool, resource_tracker
+from multiprocessing.pool import Pool as PoolType
+from multiprocessing.shared_memory import SharedMemory
+from operator import itemgetter, ne
+from typing import Dict, List, Optional, Tuple
+
+import graph_1
+import graph_3
+from graph_frozen import FrozenGraph
+
+
+REMOVIDA = graph_3.CompactEdgeList.REMOVIDA
+
+
+def _attach_untracked(nome: str) -> SharedMemory:
+    """
+    Função auxiliar: anexa um bloco existente sem registrá-lo no
+    resource_tracker. Só quem cria o bloco deve removê-lo; antes do
+    Python 3.13, anexar também registrava o bloco, e o tracker de um worker
+    o removia (e avisava de "vazamento") quando o worker terminava.
+    """
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=nome, track=False)
+    registrar = resource_tracker.register
+    resource_tracker.register = lambda *args, **kwargs: None
+    try:
+        return SharedMemory(name=nome)
+    finally:
+        resource_tracker.register = registrar
+
+
+@contextmanager
+def _attached(nome: str, tipo: str, inicio: int, fim: int):
+    """
+    Função auxiliar: anexa o bloco compartilhado 'nome' só durante a tarefa
+    e fornece uma memoryview tipada (sem cópia) dos itens [inicio, fim).
+    A visão e o bloco são liberados na saída, então nenhum worker mantém
+    mapeamentos de blocos que o processo principal já removeu.
+    """
+    bloco = _attach_untracked(nome)
+    try:
+        tipada = bloco.buf.cast(tipo)
+        try:
+            fatia = tipada[inicio:fim]
+            try:
+                yield fatia
+            finally:
+                fatia.release()
+        finally:
+            tipada.release()
+    finally:
+        bloco.close()
+
+
+def _count_shard(origens: str, destinos: str, inicio: int, fim: int):
+    """
+    Tarefa de um worker: contagens parciais (saída, entrada) por id das
+    arestas [inicio, fim), lidas direto da memória compartilhada. As
+    contagens são feitas pelo Counter em C; arestas removidas (origem
+    REMOVIDA) são ignoradas.
+    """
+    with _attached(origens, 'i', inicio, fim) as o, _attached(destinos, 'i', inicio, fim) as d:
+        saida = Counter(o)
+        if REMOVIDA in saida:
+            del saida[REMOVIDA]
+            entrada = Counter(compress(d, map(ne, o, repeat(REMOVIDA))))
+        else:
+            entrada = Counter(d)
+    return dict(saida), dict(entrada)
+
+
+def _sum_shard(origens: str, destinos: str, valores: str, num_valores: int, inicio: int, fim: int):
+    """Tarefa de um worker: somas parciais {origem: soma de valores[destino]} das arestas [inicio, fim)."""
+    parcial: Dict[int, float] = {}
+    with _attached(origens, 'i', inicio, fim) as o, _attached(destinos, 'i', inicio, fim) as d, \
+            _attached(valores, 'd', 0, num_valores) as v:
+        for i, j in zip(o, d):
+            if i != REMOVIDA:
+                parcial[i] = parcial.get(i, 0.0) + v[j]
+    return parcial
+
+
+def _share(dados: array) -> SharedMemory:
+    """
+    Função auxiliar: copia um array tipado para um novo bloco de memória
+    compartilhada (com pelo menos um item de espaço, já que blocos vazios
+    não são permitidos).
+    """
+    bloco = SharedMemory(create=True, size=max(1, len(dados)) * dados.itemsize)
+    try:
+        visao = bloco.buf.cast(dados.typecode)
+        visao[:len(dados)] = memoryview(dados)
+        visao.release()
+    except BaseException:
+        bloco.close()
+        bloco.unlink()
+        raise
+    return bloco
+
+
+def _release(blocos: List[SharedMemory]):
+    """Função auxiliar: fecha e remove blocos compartilhados."""
+    for bloco in blocos:
+        bloco.close()
+        bloco.unlink()
+
+
+class SharedEdges:
+    """
+    Arestas (origem, destino) como dois arrays de ids em memória
+    compartilhada, processadas por um pool de processos.
+
+    - Os arrays são copiados uma única vez para os blocos compartilhados;
+      as tarefas recebem apenas os nomes dos blocos e um intervalo de
+      arestas, e os workers leem os dados por memoryviews, sem cópias
+      serializadas (pickle) das arestas.
+    - Cada worker devolve contagens/somas parciais de um fragmento; o
+      processo principal apenas soma os parciais (O(V) por fragmento).
+    - Arestas marcadas como REMOVIDA (tombstones de uma CompactEdgeList)
+      são ignoradas.
+    - O mesmo objeto responde a várias consultas (degree_counts,
+      vertex_degrees, neighbor_sum) sem copiar as arestas de novo. Um
+      'pool' já existente pode ser informado e reaproveitado entre vários
+      SharedEdges; nesse caso close() não o encerra.
+
+    Use como gerenciador de contexto (ou chame close()) para encerrar o
+    pool próprio e liberar os blocos compartilhados.
+    """
+
+    def __init__(self, nomes: List[str], origens: array, destinos: array,
+                 processos: Optional[int] = None, fragmentos: Optional[int] = None,
+                 pool: Optional[PoolType] = None):
+        self.nomes = nomes
+        self.n = len(origens)
+        self.processos = processos or os.cpu_count() or 1
+        self.fragmentos = fragmentos or 4 * self.processos
+        self.blocos: List[SharedMemory] = []
+        self.pool = pool
+        self.pool_proprio = pool is None
+        try:
+            self.blocos.append(_share(origens))
+            self.blocos.append(_share(destinos))
+            if self.pool_proprio:
+                self.pool = Pool(self.processos)
+        except BaseException:
+            _release(self.blocos)
+            self.blocos = []
+            raise
+
+    def _ranges(self) -> List[Tuple[int, int]]:
+        passo = max(1, -(-self.n // self.fragmentos))
+        return [(inicio, min(inicio + passo, self.n)) for inicio in range(0, self.n, passo)]
+
+    def degree_counts(self) -> Tuple[Counter, Counter]:
+        """Contagens (saída, entrada) por id, somando os parciais dos fragmentos."""
+        origens, destinos = (bloco.name for bloco in self.blocos)
+        tarefas = [(origens, destinos, inicio, fim) for inicio, fim in self._ranges()]
+        saida, entrada = Counter(), Counter()
+        for parcial_saida, parcial_entrada in self.pool.starmap(_count_shard, tarefas):
+            saida.update(parcial_saida)
+            entrada.update(parcial_entrada)
+        return saida, entrada
+
+    def neighbor_sum(self, valores: List[float]) -> List[float]:
+        """
+        Agregado de vizinhos: para cada id i, a soma de valores[j] sobre as
+        arestas i -> j (um passo de propagação, como em PageRank).
+        """
+        bloco = _share(array('d', valores))
+        try:
+            origens, destinos = (b.name for b in self.blocos)
+            tarefas = [(origens, destinos, bloco.name, len(valores), inicio, fim)
+                       for inicio, fim in self._ranges()]
+            somas = [0.0] * len(self.nomes)
+            for parcial in self.pool.starmap(_sum_shard, tarefas):
+                for i, soma in parcial.items():
+                    somas[i] += soma
+            return somas
+        finally:
+            _release([bloco])
+
+    def vertex_degrees(self, vertices) -> Dict[str, Dict[str, int]]:
+        """Graus de 'vertices' no formato de graph_3.vertex_degrees ({'entrada', 'saida', 'total'})."""
+        saida, entrada = self.degree_counts()
+        ids = {nome: i for i, nome in enumerate(self.nomes)}
+        graus = {}
+        for v in vertices:
+            i = ids.get(v)
+            s = saida.get(i, 0)
+            e = entrada.get(i, 0)
+            graus[v] = {'entrada': e, 'saida': s, 'total': e + s}
+        return graus
+
+    def close(self):
+        if self.pool_proprio and self.pool is not None:
+            self.pool.terminate()
+            self.pool.join()
+        self.pool = None
+        _release(self.blocos)
+        self.blocos = []
+
+    def __enter__(self) -> "SharedEdges":
+        return self
+
+    def __exit__(self, tipo, valor, rastreamento):
+        self.close()
+
+
+def _dense_ids(vertices) -> Dict[str, int]:
+    """
+    Função auxiliar: dict nome -> id denso, já com 'vertices' nos ids
+    0..V-1. Um nome novo recebe o próximo id ao ser consultado
+    (defaultdict com itertools.count), de modo que map(ids.__getitem__, ...)
+    faz o interning inteiro em C, sem uma chamada Python por aresta.
+    """
+    ids = defaultdict(count().__next__)
+    for vertice in vertices:
+        ids[vertice]
+    return ids
+
+
+def share_edge_list(vertices, arestas, processos: Optional[int] = None, pool: Optional[PoolType] = None) -> SharedEdges:
+    """
+    Coloca as arestas de graph_3 em memória compartilhada.
+    Uma CompactEdgeList já guarda arrays de ids e é copiada diretamente.
+    As demais listas precisam ser convertidas em ids no processo principal
+    (O(E), em duas passadas feitas em C por map()); essa conversão custa
+    uma fração da contagem serial, mas é refeita a cada chamada. Para
+    consultar as mesmas arestas várias vezes, compartilhar uma vez e
+    reaproveitar o SharedEdges, ou usar uma CompactEdgeList/FrozenGraph.
+    """
+    if isinstance(arestas, graph_3.CompactEdgeList):
+        arestas.deduplicate()
+        return SharedEdges(arestas.nomes, arestas.origens, arestas.destinos, processos, pool=pool)
+
+    ids = _dense_ids(vertices)
+    # uma só leitura: uma TemporalEdgeList pode expirar arestas entre duas iterações
+    pares = arestas if isinstance(arestas, list) else list(arestas)
+    origens = array('i', map(ids.__getitem__, map(itemgetter(0), pares)))
+    destinos = array('i', map(ids.__getitem__, map(itemgetter(1), pares)))
+    return SharedEdges(list(ids), origens, destinos, processos, pool=pool)
+
+
+def share_adjacency_list(grafo: dict, processos: Optional[int] = None, pool: Optional[PoolType] = None) -> SharedEdges:
+    """
+    Coloca as arestas de um grafo de graph_1 (com multiplicidade) em memória
+    compartilhada. Os vértices do grafo recebem os ids 0..V-1, na ordem do
+    dict; os destinos são convertidos em ids em C (ver share_edge_list).
+    """
+    ids = _dense_ids(grafo)
+    listas = [graph_1._adjacency_list(grafo[vertice]) for vertice in grafo]
+    origens = array('i')
+    for i, vizinhos in enumerate(listas):
+        origens.extend(repeat(i, len(vizinhos)))
+    destinos = array('i', map(ids.__getitem__, chain.from_iterable(listas)))
+    return SharedEdges(list(ids), origens, destinos, processos, pool=pool)
+
+
+def share_frozen(frozen: FrozenGraph, processos: Optional[int] = None, pool: Optional[PoolType] = None) -> SharedEdges:
+    """Coloca as linhas CSR de um FrozenGraph em memória compartilhada (origens expandidas dos offsets)."""
+    origens = array('i')
+    for i, grau in enumerate(frozen.graus_saida):
+        origens.extend(repeat(i, grau))
+    return SharedEdges(list(frozen.nomes), origens, array('i', frozen.alvos), processos, pool=pool)
+
+
+def parallel_vertex_degrees(vertices, arestas, processos: Optional[int] = None,
+                            pool: Optional[PoolType] = None) -> Dict[str, Dict[str, int]]:
+    """
+    Versão paralela de graph_3.vertex_degrees (mesmo formato de resultado).
+
+    Passos:
+    1. Colocar as arestas em memória compartilhada (share_edge_list).
+    2. Dividir as arestas em fragmentos e contar saída/entrada de cada um
+       em um processo do pool ('pool', se informado, é reaproveitado;
+       senão um pool é criado e encerrado nesta chamada).
+    3. Somar as contagens parciais e montar {'entrada', 'saida', 'total'}
+       para cada vértice de 'vertices'.
+    Para consultar as mesmas arestas várias vezes, usar share_edge_list e
+    SharedEdges.vertex_degrees diretamente.
+
+    Só compensa com uma CompactEdgeList, cujos arrays são copiados sem
+    conversão. Com listas simples, HashList ou TemporalEdgeList, o passo 1
+    converte as arestas em ids no processo principal, e essa etapa serial
+    custa cerca de metade de graph_3.vertex_degrees: o ganho fica limitado
+    a menos de 2x, com qualquer número de processos.
+    """
+    with share_edge_list(vertices, arestas, processos, pool) as compartilhadas:
+        return compartilhadas.vertex_degrees(vertices)
+
+
+def parallel_vertex_degrees_adjacency_list(grafo: dict, processos: Optional[int] = None,
+                                           pool: Optional[PoolType] = None) -> Dict[str, Dict[str, int]]:
+    """
+    Versão paralela dos graus de um grafo de graph_1, no formato
+    {'in', 'out', 'total'} (arestas paralelas contadas com multiplicidade,
+    como em graph_1.create_degree_index).
+
+    Não é um atalho para graus avulsos: converter o dict em arrays de ids
+    (share_adjacency_list) é serial e custa quase o mesmo que
+    graph_1.create_degree_index. Para um grafo que não muda, freeze() +
+    share_frozen paga essa conversão uma vez só.
+    """
+    with share_adjacency_list(grafo, processos, pool) as compartilhadas:
+        saida, entrada = compartilhadas.degree_counts()
+
+    graus = {}
+    for i, vertice in enumerate(grafo):
+        graus[vertice] = {'in': entrada.get(i, 0), 'out': saida.get(i, 0),
+                          'total': entrada.get(i, 0) + saida.get(i, 0)}
+    return graus
@@ -0,0 +1,97 @@
+from bisect import bisect_left
+from typing import Callable, Hashable, List, Optional, Sequence, Tuple
+
+import graph_1
+import graph_2
+import graph_frozen
+
+
+def batch_valid_paths(caminhos: Sequence[Sequence[Hashable]], existe: Callable[[Hashable, Hashable], bool],
+                      preenchimento: Optional[Hashable] = None) -> Tuple[List[bool], List[int]]:
+    """
+    Valida muitos percursos de uma vez.
+
+    Passos:
+    1. Coletar todos os passos (u, v) de todos os caminhos; um caminho
+       termina no fim da sequência ou no primeiro valor 'preenchimento'
+       (para linhas de tamanho fixo completadas com um valor sentinela).
+    2. Consultar existe(u, v) uma única vez por passo distinto.
+    3. Para cada caminho, mascara[k] diz se ele é válido e falhas[k] é o
+       índice i do primeiro passo caminho[i] -> caminho[i + 1] inexistente
+       (ou -1, se o caminho for válido).
+    Caminhos com menos de dois vértices são válidos.
+    """
+    resultados = {}
+    mascara: List[bool] = []
+    falhas: List[int] = []
+
+    for caminho in caminhos:
+        falha = -1
+        for i in range(len(caminho) - 1):
+            u = caminho[i]
+            v = caminho[i + 1]
+            if preenchimento is not None and v == preenchimento:
+                break
+            passo = (u, v)
+            ok = resultados.get(passo)
+            if ok is None:
+                ok = resultados[passo] = existe(u, v)
+            if not ok:
+                falha = i
+                break
+        mascara.append(falha == -1)
+        falhas.append(falha)
+
+    return mascara, falhas
+
+
+def valid_paths_adjacency_list(grafo: dict, caminhos):
+    """Versão em lote de graph_1.valid_path; retorna (mascara, falhas)."""
+    return batch_valid_paths(caminhos, lambda u, v: graph_1.edge_exists(grafo, u, v))
+
+
+def valid_paths_matrix(matriz, vertices: List[str], caminhos, indice=None):
+    """
+    Versão em lote de graph_2.valid_path; retorna (mascara, falhas).
+    Monta o índice de posições uma vez (se não for informado), então cada
+    passo distinto custa uma leitura de célula.
+    """
+    if indice is None:
+        indice = graph_2.create_index(vertices)
+    return batch_valid_paths(caminhos, lambda u, v: graph_2.edge_exists(matriz, vertices, u, v, indice))
+
+
+def valid_paths_edge_list(arestas, caminhos):
+    """
+    Versão em lote de graph_3.valid_path; retorna (mascara, falhas).
+    Uma lista simples de arestas é convertida uma vez em um conjunto de
+    tuplas (O(E)); HashList e CompactEdgeList já respondem 'in' em O(1).
+    """
+    if isinstance(arestas, list):
+        conjunto = set(map(tuple, arestas))
+        return batch_valid_paths(caminhos, lambda u, v: (u, v) in conjunto)
+    return batch_valid_paths(caminhos, lambda u, v: (u, v) in arestas)
+
+
+def valid_paths_frozen(frozen: graph_frozen.FrozenGraph, caminhos, ids: bool = False, preenchimento: int = -1):
+    """
+    Versão em lote para um FrozenGraph; retorna (mascara, falhas).
+    Com ids=True, os caminhos são sequências de ids inteiros (por exemplo,
+    linhas de tamanho fixo completadas com 'preenchimento'), e cada passo é
+    uma busca binária na linha ordenada do CSR, sem converter nomes.
+    """
+    if not ids:
+        return batch_valid_paths(caminhos, frozen.edge_exists)
+
+    offsets = frozen.offsets
+    alvos = frozen.alvos
+    total = len(frozen)
+
+    def existe(i, j):
+        if not (0 <= i < total and 0 <= j < total):
+            return False
+        inicio, fim = offsets[i], offsets[i + 1]
+        k = bisect_left(alvos, j, inicio, fim)
+        return k < fim and alvos[k] == j
+
+    return batch_valid_paths(caminhos, existe, preenchimento)
@@ -0,0 +1,295 @@
+from typing import Protocol, List, Tuple, Dict, Any, Iterable, Optional
+
+import graph_1
+import graph_2
+import graph_3
+
+
+class Graph(Protocol):
+    """
+    Interface comum às três representações (graph_1, graph_2, graph_3).
+
+    Os graus são sempre devolvidos no formato {'in': x, 'out': y, 'total': z},
+    independentemente do formato nativo de cada módulo.
+    """
+
+    def insert_vertex(self, vertice: str) -> None: ...
+
+    def insert_edge(self, origem: str, destino: str, nao_direcionado: bool = False) -> None: ...
+
+    def remove_edge(self, origem: str, destino: str, nao_direcionado: bool = False) -> None: ...
+
+    def remove_vertex(self, vertice: str) -> None: ...
+
+    def neighbors(self, vertice: str) -> List[str]: ...
+
+    def edge_exists(self, origem: str, destino: str) -> bool: ...
+
+    def vertex_degrees(self) -> Dict[str, Dict[str, int]]: ...
+
+    def valid_path(self, caminho: List[str]) -> bool: ...
+
+    def vertices(self) -> List[str]: ...
+
+    def edges(self) -> Iterable[Tuple[str, str]]: ...
+
+
+class AdjacencyListGraph:
+    """
+    Adaptador de um grafo de graph_1 (dict de listas de adjacência) para
+    Graph. O índice de graus é criado na primeira chamada de vertex_degrees
+    e o de predecessores na primeira remoção de vértice; a partir daí, ambos
+    são mantidos por todas as mutações.
+    """
+
+    def __init__(self, grafo: Optional[dict] = None):
+        self.grafo = graph_1.create_graph() if grafo is None else grafo
+        self.graus: Optional[dict] = None
+        self.predecessores: Optional[dict] = None
+
+    def insert_vertex(self, vertice: str) -> None:
+        if vertice not in self.grafo:
+            graph_1.insert_vertex(self.grafo, vertice, self.graus, self.predecessores)
+
+    def insert_edge(self, origem: str, destino: str, nao_direcionado: bool = False) -> None:
+        graph_1.insert_edge(self.grafo, origem, destino, nao_direcionado, self.graus, self.predecessores)
+
+    def remove_edge(self, origem: str, destino: str, nao_direcionado: bool = False) -> None:
+        graph_1.remove_edge(self.grafo, origem, destino, nao_direcionado, self.graus, self.predecessores)
+
+    def remove_vertex(self, vertice: str) -> None:
+        if vertice in self.grafo:
+            if self.predecessores is None:
+                self.predecessores = graph_1.create_predecessor_index(self.grafo)
+            graph_1.remove_vertex(self.grafo, vertice, graus=self.graus, predecessores=self.predecessores)
+
+    def neighbors(self, vertice: str) -> List[str]:
+        return list(graph_1.neighbors(self.grafo, vertice))
+
+    def edge_exists(self, origem: str, destino: str) -> bool:
+        return graph_1.edge_exists(self.grafo, origem, destino)
+
+    def vertex_degrees(self) -> Dict[str, Dict[str, int]]:
+        if self.graus is None:
+            self.graus = graph_1.create_degree_index(self.grafo)
+        return graph_1.vertex_degrees(self.grafo, self.graus)
+
+    def valid_path(self, caminho: List[str]) -> bool:
+        return graph_1.valid_path(self.grafo, caminho)
+
+    def vertices(self) -> List[str]:
+        return list(self.grafo)
+
+    def edges(self) -> Iterable[Tuple[str, str]]:
+        for origem in self.grafo:
+            for destino in graph_1.neighbors(self.grafo, origem):
+                yield origem, destino
+
+
+class AdjacencyMatrixGraph:
+    """
+    Adaptador de um grafo de graph_2 (matriz, vertices) para Graph, sempre
+    com índice de posições. O cache de graus (DegreeCache) é criado na
+    primeira chamada de vertex_degrees e, a partir daí, mantido por todas
+    as mutações.
+    """
+
+    def __init__(self, matriz=None, vertices: Optional[List[str]] = None, formato: str = "lista"):
+        if matriz is None:
+            matriz, vertices = graph_2.create_graph(formato)
+        self.matriz = matriz
+        self.lista_vertices = vertices
+        self.indice = graph_2.create_index(vertices)
+        self.graus: Optional[graph_2.DegreeCache] = None
+
+    def insert_vertex(self, vertice: str) -> None:
+        graph_2.insert_vertex(self.matriz, self.lista_vertices, vertice, self.indice, self.graus)
+
+    def insert_edge(self, origem: str, destino: str, nao_direcionado: bool = False) -> None:
+        graph_2.insert_edge(self.matriz, self.lista_vertices, origem, destino, nao_direcionado, self.indice, self.graus)
+
+    def remove_edge(self, origem: str, destino: str, nao_direcionado: bool = False) -> None:
+        graph_2.remove_edge(self.matriz, self.lista_vertices, origem, destino, nao_direcionado, self.indice, self.graus)
+
+    def remove_vertex(self, vertice: str) -> None:
+        graph_2.remove_vertex(self.matriz, self.lista_vertices, vertice, self.indice, self.graus)
+
+    def neighbors(self, vertice: str) -> List[str]:
+        return graph_2.neighbors(self.matriz, self.lista_vertices, vertice, self.indice)
+
+    def edge_exists(self, origem: str, destino: str) -> bool:
+        return graph_2.edge_exists(self.matriz, self.lista_vertices, origem, destino, self.indice)
+
+    def vertex_degrees(self) -> Dict[str, Dict[str, int]]:
+        if self.graus is None:
+            self.graus = graph_2.create_degree_cache(self.matriz, self.lista_vertices)
+        graus = {}
+        for v, g in graph_2.vertex_degree(self.matriz, self.lista_vertices, self.graus).items():
+            if isinstance(g, dict):
+                graus[v] = {'in': g['entrada'], 'out': g['saida'], 'total': g['total']}
+            else:
+                graus[v] = {'in': g, 'out': g, 'total': 2 * g}
+        return graus
+
+    def valid_path(self, caminho: List[str]) -> bool:
+        return graph_2.valid_path(self.matriz, self.lista_vertices, caminho, self.indice)
+
+    def vertices(self) -> List[str]:
+        return list(self.lista_vertices)
+
+    def edges(self) -> Iterable[Tuple[str, str]]:
+        for origem in self.lista_vertices:
+            for destino in self.neighbors(origem):
+                yield origem, destino
+
+
+class EdgeListGraph:
+    """Adaptador de um grafo de graph_3 (vertices, arestas) para Graph, com índice CSR de vizinhos."""
+
+    def __init__(self, vertices=None, arestas=None, indexado: bool = True, compacto: bool = False):
+        if vertices is None:
+            vertices, arestas = graph_3.create_graph(indexado, compacto)
+        self.lista_vertices = vertices
+        self.arestas = arestas
+        self.indice_vizinhos = graph_3.create_neighbor_index()
+
+    def insert_vertex(self, vertice: str) -> None:
+        graph_3.insert_vertex(self.lista_vertices, vertice)
+
+    def insert_edge(self, origem: str, destino: str, nao_direcionado: bool = False) -> None:
+        graph_3.insert_edge(self.lista_vertices, self.arestas, origem, destino, nao_direcionado, self.indice_vizinhos)
+
+    def remove_edge(self, origem: str, destino: str, nao_direcionado: bool = False) -> None:
+        graph_3.remove_edge(self.arestas, origem, destino, nao_direcionado, self.indice_vizinhos)
+
+    def remove_vertex(self, vertice: str) -> None:
+        graph_3.remove_vertex(self.lista_vertices, self.arestas, vertice, self.indice_vizinhos)
+
+    def neighbors(self, vertice: str) -> List[str]:
+        return graph_3.neighbors(self.lista_vertices, self.arestas, vertice, self.indice_vizinhos)
+
+    def edge_exists(self, origem: str, destino: str) -> bool:
+        return graph_3.edge_exists(self.arestas, origem, destino)
+
+    def vertex_degrees(self) -> Dict[str, Dict[str, int]]:
+        graus = {}
+        for v, g in graph_3.vertex_degrees(self.lista_vertices, self.arestas).items():
+            graus[v] = {'in': g['entrada'], 'out': g['saida'], 'total': g['total']}
+        return graus
+
+    def valid_path(self, caminho: List[str]) -> bool:
+        return graph_3.valid_path(self.arestas, caminho)
+
+    def vertices(self) -> List[str]:
+        return list(self.lista_vertices)
+
+    def edges(self) -> Iterable[Tuple[str, str]]:
+        for origem, destino in self.arestas:
+            yield origem, destino
+
+
+def _unique_edges(grafo: dict) -> List[Tuple[str, str]]:
+    """Função auxiliar: arestas (origem, destino) de um grafo de graph_1, sem repetições."""
+    arestas = {}
+    for origem in grafo:
+        for destino in graph_1.neighbors(grafo, origem):
+            arestas[(origem, destino)] = None
+    return list(arestas)
+
+
+def list_to_matrix(grafo: dict, formato: str = "lista") -> Tuple[Any, List[str]]:
+    """
+    Converte um grafo de graph_1 em (matriz, vertices) de graph_2.
+
+    Passos:
+    1. Criar a matriz no formato pedido e inserir todos os vértices (com índice).
+    2. Marcar todas as arestas de uma vez com graph_2.insert_edges.
+    Custo: O(V + E) além da alocação da própria matriz (V²).
+    Multiplicidades de um multigrafo viram uma única célula 1.
+    """
+    matriz, vertices = graph_2.create_graph(formato)
+    indice = graph_2.create_index(vertices)
+    for vertice in grafo:
+        graph_2.insert_vertex(matriz, vertices, vertice, indice)
+    graph_2.insert_edges(matriz, vertices, _unique_edges(grafo), indice=indice)
+    return (matriz, vertices)
+
+
+def list_to_edges(grafo: dict, indexado: bool = False, compacto: bool = False):
+    """
+    Converte um grafo de graph_1 em (vertices, arestas) de graph_3, em O(V + E).
+
+    Passos:
+    1. Criar a estrutura de graph_3 pedida.
+    2. Copiar os vértices e as arestas (sem repetições) de uma vez.
+    """
+    vertices, arestas = graph_3.create_graph(indexado, compacto)
+    vertices.extend(grafo)
+    if isinstance(arestas, list):
+        arestas.extend([origem, destino] for origem, destino in _unique_edges(grafo))
+    else:
+        arestas.extend(_unique_edges(grafo))
+    return vertices, arestas
+
+
+def matrix_to_list(matriz, vertices: List[str], hash_adjacencia: bool = False, multigrafo: bool = False) -> dict:
+    """
+    Converte (matriz, vertices) de graph_2 em um grafo de graph_1.
+
+    Passos:
+    1. Criar o grafo e inserir todos os vértices, na ordem da matriz.
+    2. Para cada linha, inserir as arestas para os vizinhos (células == 1).
+    Custo: O(V²) para ler a matriz (O(V + E) nos formatos compacto e de bits,
+    que localizam os vizinhos sem percorrer célula a célula em Python).
+    """
+    grafo = graph_1.create_graph(hash_adjacencia, multigrafo)
+    indice = graph_2.create_index(vertices)
+    for vertice in vertices:
+        graph_1.insert_vertex(grafo, vertice)
+    for origem in vertices:
+        for destino in graph_2.neighbors(matriz, vertices, origem, indice):
+            graph_1.insert_edge(grafo, origem, destino)
+    return grafo
+
+
+def matrix_to_edges(matriz, vertices: List[str], indexado: bool = False, compacto: bool = False):
+    """
+    Converte (matriz, vertices) de graph_2 em (vertices, arestas) de graph_3.
+    Mesmo custo de leitura da matriz que matrix_to_list.
+    """
+    novos_vertices, arestas = graph_3.create_graph(indexado, compacto)
+    novos_vertices.extend(vertices)
+    indice = graph_2.create_index(vertices)
+    for origem in vertices:
+        for destino in graph_2.neighbors(matriz, vertices, origem, indice):
+            arestas.append([origem, destino] if isinstance(arestas, list) else (origem, destino))
+    return novos_vertices, arestas
+
+
+def edges_to_list(vertices, arestas, hash_adjacencia: bool = False, multigrafo: bool = False) -> dict:
+    """
+    Converte (vertices, arestas) de graph_3 em um grafo de graph_1, em O(V + E).
+
+    Passos:
+    1. Criar o grafo e inserir todos os vértices, na ordem de 'vertices'.
+    2. Inserir cada aresta (append O(1) na lista de adjacência).
+    """
+    grafo = graph_1.create_graph(hash_adjacencia, multigrafo)
+    for vertice in vertices:
+        graph_1.insert_vertex(grafo, vertice)
+    for origem, destino in arestas:
+        graph_1.insert_edge(grafo, origem, destino)
+    return grafo
+
+
+def edges_to_matrix(vertices, arestas, formato: str = "lista") -> Tuple[Any, List[str]]:
+    """
+    Converte (vertices, arestas) de graph_3 em (matriz, vertices) de graph_2.
+    Custo: O(V + E) além da alocação da própria matriz (V²).
+    """
+    matriz, novos_vertices = graph_2.create_graph(formato)
+    indice = graph_2.create_index(novos_vertices)
+    for vertice in vertices:
+        graph_2.insert_vertex(matriz, novos_vertices, vertice, indice)
+    graph_2.insert_edges(matriz, novos_vertices, [(origem, destino) for origem, destino in arestas], indice=indice)
+    return (matriz, novos_vertices)
@@ -0,0 +1,177 @@
+import mmap
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from typing import Iterable, Iterator, List, Tuple
+
+import graph_3
+import graph_frozen
+import graph_protocol
+
+
+MAGICO = b'PYGRAPH1'
+CABECALHO = struct.Struct('<8scxxxxxxxQQQ')
+ALINHAMENTO = 8
+
+
+def _padding(tamanho: int) -> int:
+    """Função auxiliar: bytes de preenchimento até o próximo múltiplo de ALINHAMENTO."""
+    return -tamanho % ALINHAMENTO
+
+
+def _write_snapshot(caminho: str, vertices: Iterable[str], arestas: Iterable[Tuple[str, str]]):
+    """
+    Função auxiliar: grava o snapshot binário.
+
+    Layout (cada seção começa alinhada em 8 bytes):
+    1. Cabeçalho: mágico, ordem dos bytes ('<' ou '>'), V, E e o tamanho da tabela de nomes.
+    2. Tabela de nomes: V + 1 offsets int64 seguidos dos nomes em UTF-8 concatenados.
+    3. offsets CSR: V + 1 valores int64.
+    4. alvos CSR: E valores int32.
+    """
+    nomes, offsets, alvos = graph_frozen.build_csr(vertices, arestas)
+
+    codificados = [nome.encode('utf-8') for nome in nomes]
+    posicoes_nomes = array('q', [0])
+    for nome in codificados:
+        posicoes_nomes.append(posicoes_nomes[-1] + len(nome))
+    blob = b''.join(codificados)
+
+    ordem = b'<' if sys.byteorder == 'little' else b'>'
+    with open(caminho, 'wb') as arquivo:
+        arquivo.write(CABECALHO.pack(MAGICO, ordem, len(nomes), len(alvos), len(blob)))
+        arquivo.write(posicoes_nomes.tobytes())
+        arquivo.write(blob)
+        arquivo.write(bytes(_padding(len(blob))))
+        arquivo.write(offsets.tobytes())
+        arquivo.write(alvos.tobytes())
+
+
+class SnapshotGraph:
+    """
+    Grafo somente leitura aberto a partir de um snapshot binário.
+
+    Os arrays CSR ('offsets' e 'alvos') são memoryviews sobre o mmap do
+    arquivo: nada é copiado na carga, e as páginas são lidas pelo sistema
+    operacional conforme as consultas as tocam. Apenas a tabela de nomes
+    é decodificada (O(V)) para montar o dicionário nome -> id.
+    """
+
+    def __init__(self, caminho: str):
+        self.arquivo = open(caminho, 'rb')
+        self.mapa = mmap.mmap(self.arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        magico, ordem, num_vertices, num_arestas, tamanho_blob = CABECALHO.unpack_from(self.mapa, 0)
+        if magico != MAGICO:
+            self.close()
+            raise ValueError(f"Arquivo '{caminho}' não é um snapshot de grafo.")
+
+        visao = memoryview(self.mapa)
+        inicio = CABECALHO.size
+        fim = inicio + 8 * (num_vertices + 1)
+        posicoes_nomes = self._array(visao[inicio:fim], 'q', ordem)
+        inicio = fim
+        blob = bytes(visao[inicio:inicio + tamanho_blob])
+        self.nomes = [blob[posicoes_nomes[k]:posicoes_nomes[k + 1]].decode('utf-8') for k in range(num_vertices)]
+        self.ids = {nome: k for k, nome in enumerate(self.nomes)}
+
+        inicio += tamanho_blob + _padding(tamanho_blob)
+        fim = inicio + 8 * (num_vertices + 1)
+        self.offsets = self._array(visao[inicio:fim], 'q', ordem)
+        self.alvos = self._array(visao[fim:fim + 4 * num_arestas], 'i', ordem)
+
+    @staticmethod
+    def _array(visao: memoryview, tipo: str, ordem: bytes):
+        """Visão tipada sem cópia; só copia (e inverte os bytes) se a ordem do arquivo for outra."""
+        if ordem == (b'<' if sys.byteorder == 'little' else b'>'):
+            return visao.cast(tipo)
+        copia = array(tipo, visao.tobytes())
+        copia.byteswap()
+        return copia
+
+    def close(self):
+        for atributo in ('offsets', 'alvos'):
+            valor = getattr(self, atributo, None)
+            if isinstance(valor, memoryview):
+                valor.release()
+        self.mapa.close()
+        self.arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def vertices(self) -> List[str]:
+        return list(self.nomes)
+
+    def _row(self, vertice: str):
+        i = self.ids.get(vertice)
+        if i is None:
+            return None
+        return self.alvos[self.offsets[i]:self.offsets[i + 1]]
+
+    def neighbors(self, vertice: str) -> List[str]:
+        linha = self._row(vertice)
+        if linha is None:
+            return []
+        return [self.nomes[j] for j in linha]
+
+    def edge_exists(self, origem: str, destino: str) -> bool:
+        """Busca binária do id do destino na linha (ordenada) da origem."""
+        linha = self._row(origem)
+        j = self.ids.get(destino)
+        if linha is None or j is None:
+            return False
+        k = bisect_left(linha, j)
+        return k < len(linha) and linha[k] == j
+
+    def edges(self) -> Iterator[Tuple[str, str]]:
+        for i, origem in enumerate(self.nomes):
+            for k in range(self.offsets[i], self.offsets[i + 1]):
+                yield origem, self.nomes[self.alvos[k]]
+
+
+def save_adjacency_list(grafo: dict, caminho: str):
+    """Grava um grafo de graph_1 como snapshot binário."""
+    _write_snapshot(caminho, grafo, graph_protocol.AdjacencyListGraph(grafo).edges())
+
+
+def save_matrix(matriz, vertices: List[str], caminho: str):
+    """Grava (matriz, vertices) de graph_2 como snapshot binário."""
+    _write_snapshot(caminho, vertices, graph_protocol.AdjacencyMatrixGraph(matriz, vertices).edges())
+
+
+def save_edge_list(vertices, arestas, caminho: str):
+    """Grava (vertices, arestas) de graph_3 como snapshot binário."""
+    _write_snapshot(caminho, vertices, arestas)
+
+
+def load_snapshot(caminho: str) -> SnapshotGraph:
+    """Abre um snapshot sem copiar os arrays (ver SnapshotGraph)."""
+    return SnapshotGraph(caminho)
+
+
+def load_adjacency_list(caminho: str, hash_adjacencia: bool = False) -> dict:
+    """Reconstrói um grafo de graph_1 a partir de um snapshot, em O(V + E)."""
+    with SnapshotGraph(caminho) as snapshot:
+        return graph_protocol.edges_to_list(snapshot.nomes, snapshot.edges(), hash_adjacencia)
+
+
+def load_matrix(caminho: str, formato: str = "lista"):
+    """Reconstrói (matriz, vertices) de graph_2 a partir de um snapshot."""
+    with SnapshotGraph(caminho) as snapshot:
+        return graph_protocol.edges_to_matrix(snapshot.nomes, snapshot.edges(), formato)
+
+
+def load_edge_list(caminho: str, indexado: bool = False, compacto: bool = False):
+    """Reconstrói (vertices, arestas) de graph_3 a partir de um snapshot, em O(V + E)."""
+    vertices, arestas = graph_3.create_graph(indexado, compacto)
+    with SnapshotGraph(caminho) as snapshot:
+        vertices.extend(snapshot.nomes)
+        if isinstance(arestas, list):
+            arestas.extend([origem, destino] for origem, destino in snapshot.edges())
+        else:
+            arestas.extend(snapshot.edges())
+    return vertices, arestas
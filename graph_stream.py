@@ -0,0 +1,229 @@
+import heapq
+import random
+import threading
+from array import array
+from collections import Counter
+from typing import Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+
+TIPOS = ('entrada', 'saida', 'total')
+
+
+class CountMinSketch:
+    """
+    Contador aproximado em memória fixa (largura x profundidade contadores).
+    Cada item incrementa um contador por linha, escolhido por um hash com
+    semente própria; a estimativa é o menor deles, que nunca fica abaixo
+    da contagem real e a excede em no máximo ~2N/largura (N = total somado)
+    com alta probabilidade.
+    """
+
+    def __init__(self, largura: int = 1 << 16, profundidade: int = 4, semente: int = 0):
+        aleatorio = random.Random(semente)
+        self.largura = largura
+        self.sementes = [aleatorio.getrandbits(64) for _ in range(profundidade)]
+        self.tabela = [array('q', bytes(8 * largura)) for _ in range(profundidade)]
+
+    def add(self, item: Hashable, quantidade: int = 1) -> int:
+        """Soma 'quantidade' ao item e retorna a nova estimativa."""
+        estimativa = None
+        for semente, linha in zip(self.sementes, self.tabela):
+            k = hash((semente, item)) % self.largura
+            linha[k] += quantidade
+            if estimativa is None or linha[k] < estimativa:
+                estimativa = linha[k]
+        return estimativa
+
+    def estimate(self, item: Hashable) -> int:
+        return min(linha[hash((semente, item)) % self.largura]
+                   for semente, linha in zip(self.sementes, self.tabela))
+
+
+class TopK:
+    """
+    Os k itens de maior contagem vistos até agora, com um heap de mínimo.
+
+    - 'membros' guarda a contagem atual de cada item do top-k; o heap pode
+      conter entradas antigas de um mesmo item, descartadas quando chegam
+      ao topo (e o heap é reconstruído quando elas acumulam).
+    - Um item de fora só entra se sua contagem superar a menor do top-k.
+    - As entradas do heap são (contagem, sequência, item): a sequência
+      desempata contagens iguais, então os itens nunca são comparados entre
+      si (ids de tipos diferentes, como int e str, podem conviver).
+    """
+
+    def __init__(self, k: int):
+        self.k = k
+        self.membros: Dict[Hashable, int] = {}
+        self.heap: List[Tuple[int, int, Hashable]] = []
+        self.sequencia = 0
+
+    def _push(self, contagem: int, item: Hashable):
+        self.sequencia += 1
+        heapq.heappush(self.heap, (contagem, self.sequencia, item))
+
+    def _clean_top(self):
+        while self.heap and self.membros.get(self.heap[0][2]) != self.heap[0][0]:
+            heapq.heappop(self.heap)
+
+    def update(self, item: Hashable, contagem: int):
+        if item in self.membros:
+            self.membros[item] = contagem
+            self._push(contagem, item)
+            if len(self.heap) > 4 * self.k:
+                self.heap = []
+                for i, c in self.membros.items():
+                    self._push(c, i)
+            return
+
+        if len(self.membros) < self.k:
+            self.membros[item] = contagem
+            self._push(contagem, item)
+            return
+
+        self._clean_top()
+        if contagem > self.heap[0][0]:
+            self.sequencia += 1
+            _, _, removido = heapq.heapreplace(self.heap, (contagem, self.sequencia, item))
+            del self.membros[removido]
+            self.membros[item] = contagem
+
+    def items(self) -> List[Tuple[Hashable, int]]:
+        """Itens do top-k, do maior para o menor."""
+        return sorted(self.membros.items(), key=lambda par: par[1], reverse=True)
+
+
+class DegreeStream:
+    """
+    Estatísticas de grau sobre um fluxo de arestas (origem, destino), sem
+    materializar 'vertices' e 'arestas'.
+
+    - Modo exato (enquanto houver no máximo 'limite_vertices' vértices
+      distintos): contadores de entrada e saída por vértice, memória O(V).
+    - Ao passar do limite, muda para o modo aproximado: as contagens atuais
+      são transferidas para count-min sketches (memória fixa) e um top-k
+      por tipo de grau ('entrada', 'saida', 'total') acompanha os vértices
+      de maior grau estimado.
+    - process() é um estágio de pipeline: consome um iterador de arestas e
+      as repassa adiante, atualizando as estatísticas.
+    - snapshot(), degree() e top() podem ser chamados a qualquer momento,
+      inclusive de outra thread enquanto o fluxo está sendo consumido.
+    """
+
+    def __init__(self, limite_vertices: int = 1_000_000, k: int = 100,
+                 largura: int = 1 << 16, profundidade: int = 4, semente: int = 0):
+        self.limite_vertices = limite_vertices
+        self.k = k
+        self.largura = largura
+        self.profundidade = profundidade
+        self.semente = semente
+        self.arestas = 0
+        self.entrada: Optional[Counter] = Counter()
+        self.saida: Optional[Counter] = Counter()
+        self.vistos = set()
+        self.esbocos: Optional[Dict[str, CountMinSketch]] = None
+        self.tops: Optional[Dict[str, TopK]] = None
+        self.trava = threading.Lock()
+
+    @property
+    def exato(self) -> bool:
+        return self.esbocos is None
+
+    def _switch_to_sketch(self):
+        """Função auxiliar: passa as contagens exatas para os sketches e monta os top-k."""
+        self.esbocos = {tipo: CountMinSketch(self.largura, self.profundidade, self.semente + n)
+                        for n, tipo in enumerate(('entrada', 'saida'))}
+        self.tops = {tipo: TopK(self.k) for tipo in TIPOS}
+        for vertice in self.vistos:
+            e = self.esbocos['entrada'].add(vertice, self.entrada[vertice]) if self.entrada[vertice] else 0
+            s = self.esbocos['saida'].add(vertice, self.saida[vertice]) if self.saida[vertice] else 0
+            self._update_tops(vertice, e, s)
+        self.entrada = self.saida = None
+        self.vistos = set()
+
+    def _update_tops(self, vertice: Hashable, entrada: int, saida: int):
+        self.tops['entrada'].update(vertice, entrada)
+        self.tops['saida'].update(vertice, saida)
+        self.tops['total'].update(vertice, entrada + saida)
+
+    def observe(self, origem: Hashable, destino: Hashable):
+        """Registra uma aresta."""
+        with self.trava:
+            self.arestas += 1
+            if self.esbocos is None:
+                self.saida[origem] += 1
+                self.entrada[destino] += 1
+                self.vistos.add(origem)
+                self.vistos.add(destino)
+                if len(self.vistos) > self.limite_vertices:
+                    self._switch_to_sketch()
+                return
+
+            s = self.esbocos['saida'].add(origem)
+            self._update_tops(origem, self.esbocos['entrada'].estimate(origem), s)
+            e = self.esbocos['entrada'].add(destino)
+            self._update_tops(destino, e, self.esbocos['saida'].estimate(destino))
+
+    def process(self, arestas: Iterable[Tuple[Hashable, Hashable]]) -> Iterator[Tuple[Hashable, Hashable]]:
+        """
+        Estágio de pipeline: repassa cada aresta de 'arestas' depois de
+        registrá-la, ex.: load_edge_list sobre stream.process(iter_edge_file(...)).
+        """
+        for origem, destino in arestas:
+            self.observe(origem, destino)
+            yield origem, destino
+
+    def consume(self, arestas: Iterable[Tuple[Hashable, Hashable]]) -> "DegreeStream":
+        """Consome o fluxo inteiro (quando não há estágio seguinte)."""
+        for origem, destino in arestas:
+            self.observe(origem, destino)
+        return self
+
+    def degree(self, vertice: Hashable) -> Dict[str, int]:
+        """Grau {'entrada', 'saida', 'total'} do vértice (estimado no modo aproximado)."""
+        with self.trava:
+            if self.esbocos is None:
+                e, s = self.entrada[vertice], self.saida[vertice]
+            else:
+                e = self.esbocos['entrada'].estimate(vertice)
+                s = self.esbocos['saida'].estimate(vertice)
+        return {'entrada': e, 'saida': s, 'total': e + s}
+
+    def top(self, tipo: str = 'total', k: Optional[int] = None) -> List[Tuple[Hashable, int]]:
+        """Os k vértices de maior grau do tipo pedido, do maior para o menor."""
+        if tipo not in TIPOS:
+            raise ValueError(f"Tipo de grau desconhecido: {tipo} (use um de {', '.join(TIPOS)})")
+        k = self.k if k is None else k
+        with self.trava:
+            if self.esbocos is not None:
+                return self.tops[tipo].items()[:k]
+            if tipo == 'total':
+                contagens = self.entrada + self.saida
+            else:
+                contagens = getattr(self, tipo)
+            return contagens.most_common(k)
+
+    def snapshot(self) -> Dict[str, object]:
+        """
+        Cópia consistente das estatísticas atuais.
+        - modo exato: 'graus' traz todos os vértices no formato de
+          graph_3.vertex_degrees;
+        - modo aproximado: 'graus' traz apenas os vértices do top-k (por
+          grau total), com graus estimados, e 'top' os top-k de cada tipo.
+        """
+        with self.trava:
+            resumo: Dict[str, object] = {'arestas': self.arestas, 'exato': self.esbocos is None}
+            if self.esbocos is None:
+                resumo['vertices'] = len(self.vistos)
+                resumo['graus'] = {v: {'entrada': self.entrada[v], 'saida': self.saida[v],
+                                       'total': self.entrada[v] + self.saida[v]} for v in self.vistos}
+                return resumo
+
+            graus = {}
+            for v, _ in self.tops['total'].items():
+                e = self.esbocos['entrada'].estimate(v)
+                s = self.esbocos['saida'].estimate(v)
+                graus[v] = {'entrada': e, 'saida': s, 'total': e + s}
+            resumo['graus'] = graus
+            resumo['top'] = {tipo: self.tops[tipo].items() for tipo in TIPOS}
+            return resumo
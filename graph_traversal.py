@@ -0,0 +1,163 @@
+from collections import deque
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import graph_frozen
+from graph_frozen import FrozenGraph
+
+
+class BitSet:
+    """
+    Conjunto de ids inteiros em [0, tamanho) guardado em um bytearray de
+    bits: 1 bit por vértice, ou seja, 10M vértices cabem em ~1.2 MB.
+    """
+
+    def __init__(self, tamanho: int):
+        self.bits = bytearray((tamanho + 7) >> 3)
+
+    def add(self, i: int):
+        self.bits[i >> 3] |= 1 << (i & 7)
+
+    def __contains__(self, i: int) -> bool:
+        return bool(self.bits[i >> 3] & (1 << (i & 7)))
+
+
+def as_traversable(grafo) -> FrozenGraph:
+    """
+    Prepara um grafo para as buscas deste módulo.
+
+    As buscas trabalham com ids inteiros (visitados em BitSet) sobre um
+    FrozenGraph. Um FrozenGraph é usado como está; um grafo de graph_1 ou um
+    adaptador de graph_protocol é congelado com freeze(). Para graph_2 e
+    graph_3, usar graph_frozen.freeze_matrix / freeze_edge_list.
+    O custo é O(V + E) uma vez; depois, o mesmo objeto serve a quantas
+    consultas forem necessárias (recriar após mutações).
+    """
+    if isinstance(grafo, FrozenGraph):
+        return grafo
+    return graph_frozen.freeze(grafo)
+
+
+def reverse(frozen: FrozenGraph) -> FrozenGraph:
+    """
+    Grafo com todas as arestas invertidas e os mesmos ids (para buscas para trás).
+    É construído uma vez (O(V + E log grau)) e guardado em frozen.reverso.
+    """
+    if frozen.reverso is None:
+        reverso = FrozenGraph(*graph_frozen.build_csr(frozen.nomes, ((destino, origem) for origem, destino in frozen.edges())))
+        reverso.reverso = frozen
+        frozen.reverso = reverso
+    return frozen.reverso
+
+
+def bfs(frozen: FrozenGraph, inicio: str) -> Iterator[Tuple[str, int]]:
+    """
+    Busca em largura iterativa a partir de 'inicio'.
+    Gera (vertice, distancia) na ordem de descoberta; a fila guarda ids e os
+    visitados ficam em um BitSet.
+    """
+    s = frozen.ids.get(inicio)
+    if s is None:
+        return
+    visitados = BitSet(len(frozen))
+    visitados.add(s)
+    fila = deque([(s, 0)])
+    while fila:
+        i, distancia = fila.popleft()
+        yield frozen.nomes[i], distancia
+        for j in frozen.neighbor_ids(i):
+            if j not in visitados:
+                visitados.add(j)
+                fila.append((j, distancia + 1))
+
+
+def dfs(frozen: FrozenGraph, inicio: str) -> Iterator[str]:
+    """
+    Busca em profundidade iterativa (pré-ordem) a partir de 'inicio'.
+    Usa uma pilha explícita de (id, próximo índice na linha CSR), então
+    não há recursão nem limite de profundidade.
+    """
+    s = frozen.ids.get(inicio)
+    if s is None:
+        return
+    offsets = frozen.offsets
+    alvos = frozen.alvos
+    visitados = BitSet(len(frozen))
+    visitados.add(s)
+    yield frozen.nomes[s]
+    pilha = [(s, offsets[s])]
+    while pilha:
+        i, k = pilha[-1]
+        fim = offsets[i + 1]
+        while k < fim and alvos[k] in visitados:
+            k += 1
+        if k == fim:
+            pilha.pop()
+            continue
+        j = alvos[k]
+        pilha[-1] = (i, k + 1)
+        visitados.add(j)
+        yield frozen.nomes[j]
+        pilha.append((j, offsets[j]))
+
+
+def k_hop(frozen: FrozenGraph, inicio: str, k: int) -> Dict[str, int]:
+    """Vértices a no máximo 'k' arestas de 'inicio' (excluindo ele), com suas distâncias."""
+    vizinhanca = {}
+    for vertice, distancia in bfs(frozen, inicio):
+        if distancia > k:
+            break
+        if distancia > 0:
+            vizinhanca[vertice] = distancia
+    return vizinhanca
+
+
+def _expand(grafo: FrozenGraph, fronteira: List[int], visitados: BitSet, outros: BitSet) -> Tuple[List[int], bool]:
+    """Função auxiliar: avança uma camada da BFS; indica se encontrou um id visitado pelo outro lado."""
+    proxima = []
+    for i in fronteira:
+        for j in grafo.neighbor_ids(i):
+            if j not in visitados:
+                if j in outros:
+                    return proxima, True
+                visitados.add(j)
+                proxima.append(j)
+    return proxima, False
+
+
+def is_reachable(frozen: FrozenGraph, origem: str, destino: str, reverso: Optional[FrozenGraph] = None) -> bool:
+    """
+    Verifica se 'destino' é alcançável a partir de 'origem'.
+
+    Passos:
+    1. Se algum dos vértices não existir, retornar False; se forem iguais, True.
+    2. Obter o grafo invertido: 'reverso', se informado, ou reverse(frozen),
+       construído na primeira consulta e reaproveitado nas seguintes.
+    3. Fazer uma BFS bidirecional: expandir sempre a menor fronteira (para
+       frente em 'frozen', para trás no invertido) e parar quando as duas
+       buscas se encontram.
+    """
+    s = frozen.ids.get(origem)
+    t = frozen.ids.get(destino)
+    if s is None or t is None:
+        return False
+    if s == t:
+        return True
+
+    frente = BitSet(len(frozen))
+    frente.add(s)
+    tras = BitSet(len(frozen))
+    tras.add(t)
+    fronteira_frente = [s]
+    fronteira_tras = [t]
+
+    if reverso is None:
+        reverso = reverse(frozen)
+
+    while fronteira_frente and fronteira_tras:
+        if len(fronteira_frente) <= len(fronteira_tras):
+            fronteira_frente, achou = _expand(frozen, fronteira_frente, frente, tras)
+        else:
+            fronteira_tras, achou = _expand(reverso, fronteira_tras, tras, frente)
+        if achou:
+            return True
+    return False
@@ -0,0 +1,87 @@
+import os
+import random
+import sys
+from collections import Counter
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import graph_1  # noqa: E402
+import graph_2  # noqa: E402
+import graph_3  # noqa: E402
+
+
+def random_operations(semente, quantidade=300, num_vertices=25, nao_direcionado=0.2,
+                      simples=False, remover_vertices=True):
+    """
+    Sequência aleatória de mutações ("insert_vertex", v), ("remove_vertex", v),
+    ("insert_edge", a, b, nao_direcionado) e ("remove_edge", a, b, nao_direcionado).
+
+    - 'semente' pode ser um int ou um random.Random já em uso.
+    - 'nao_direcionado' é a fração das arestas marcadas como não direcionadas.
+    - simples=True nunca insere uma aresta que já existe (para comparar
+      multigrafos de graph_1 com representações sem arestas repetidas).
+    - remover_vertices=False troca as remoções de vértices por inserções.
+    """
+    aleatorio = semente if isinstance(semente, random.Random) else random.Random(semente)
+    arestas = set()
+    operacoes = []
+    for _ in range(quantidade):
+        sorteio = aleatorio.random()
+        a, b = f"v{aleatorio.randrange(num_vertices)}", f"v{aleatorio.randrange(num_vertices)}"
+        if sorteio < 0.55:
+            # um laço não direcionado é inserido duas vezes em graph_1
+            nd = aleatorio.random() < nao_direcionado and not (simples and a == b)
+            pares = {(a, b), (b, a)} if nd else {(a, b)}
+            if simples and pares & arestas:
+                continue
+            arestas |= pares
+            operacoes.append(('insert_edge', a, b, nd))
+        elif sorteio < 0.8:
+            nd = aleatorio.random() < nao_direcionado
+            arestas -= {(a, b), (b, a)} if nd else {(a, b)}
+            operacoes.append(('remove_edge', a, b, nd))
+        elif sorteio < 0.93 or not remover_vertices:
+            operacoes.append(('insert_vertex', a))
+        else:
+            arestas = {aresta for aresta in arestas if a not in aresta}
+            operacoes.append(('remove_vertex', a))
+    return operacoes
+
+
+def apply_operations(grafo, operacoes):
+    """Aplica as operações a um objeto com a interface graph_protocol.Graph."""
+    for nome, *args in operacoes:
+        getattr(grafo, nome)(*args)
+
+
+def apply_graph_1(grafo, operacoes, **indices):
+    """Aplica as operações com as funções de graph_1 (índices opcionais por nome: graus=..., componentes=...)."""
+    for nome, *args in operacoes:
+        getattr(graph_1, nome)(grafo, *args, **indices)
+
+
+def apply_graph_2(matriz, vertices, operacoes, **indices):
+    """Aplica as operações com as funções de graph_2 (indice=..., graus=..., componentes=...)."""
+    for nome, *args in operacoes:
+        getattr(graph_2, nome)(matriz, vertices, *args, **indices)
+
+
+def apply_graph_3(vertices, arestas, operacoes, **indices):
+    """Aplica as operações com as funções de graph_3 (indice_vizinhos=..., componentes=...)."""
+    for nome, *args in operacoes:
+        if nome == 'insert_vertex':
+            graph_3.insert_vertex(vertices, *args, componentes=indices.get('componentes'))
+        elif nome == 'remove_edge':
+            graph_3.remove_edge(arestas, *args, **indices)
+        else:
+            getattr(graph_3, nome)(vertices, arestas, *args, **indices)
+
+
+def adjacency_edges(grafo: dict) -> Counter:
+    """Arestas de um grafo de graph_1, com multiplicidade."""
+    return Counter((v, vizinho) for v in grafo for vizinho in graph_1._adjacency_list(grafo[v]))
+
+
+def edge_tuples(arestas) -> list:
+    """Arestas de graph_3 (listas ou tuplas) como tuplas ordenadas."""
+    return sorted(tuple(aresta) for aresta in arestas)
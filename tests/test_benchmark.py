@@ -0,0 +1,55 @@
+import pytest
+
+import benchmark
+
+
+@pytest.mark.parametrize('gerador', list(benchmark.GERADORES))
+def test_generators_are_deterministic_and_near_expected_size(gerador):
+    arestas = benchmark.GERADORES[gerador](200, 7)
+    assert arestas == benchmark.GERADORES[gerador](200, 7)
+    esperadas = benchmark.ARESTAS_ESPERADAS[gerador](200)
+    assert 0.5 * esperadas <= len(arestas) <= 1.5 * esperadas
+    assert all(0 <= int(v[1:]) < 200 for aresta in arestas for v in aresta)
+
+
+def test_run_case_measures_every_operation():
+    caso = benchmark.run_case('lista_arestas_compacta', 'esparso', 50, consultas=20)
+    assert 'pulado' not in caso
+    assert caso['pico_memoria_bytes'] > 0
+    assert set(benchmark.OPERACOES) | {'construcao'} == set(caso['operacoes'])
+
+
+def test_oversized_case_is_skipped_before_generating(monkeypatch):
+    def falhar(*args):
+        raise AssertionError("não deveria gerar arestas")
+
+    monkeypatch.setitem(benchmark.GERADORES, 'denso', falhar)
+    caso = benchmark.run_case('matriz_lista', 'denso', 5000)
+    assert 'pulado' in caso
+    assert 'arestas' not in caso
+
+
+def test_run_suite_generates_once_per_size(monkeypatch):
+    chamadas = []
+    original = benchmark.GERADORES['esparso']
+
+    def contar(n, semente):
+        chamadas.append(n)
+        return original(n, semente)
+
+    monkeypatch.setitem(benchmark.GERADORES, 'esparso', contar)
+    relatorio = benchmark.run_suite([30], ['lista_adjacencia', 'matriz_bits'], ['esparso'], consultas=10, progresso=False)
+    assert chamadas == [30]
+    assert [caso['representacao'] for caso in relatorio['casos']] == ['lista_adjacencia', 'matriz_bits']
+    assert relatorio['casos'][0]['arestas'] == relatorio['casos'][1]['arestas']
+
+
+def test_compare_reports_regressions():
+    base = {'casos': [{'representacao': 'r', 'gerador': 'g', 'vertices': 10, 'pico_memoria_bytes': 100,
+                       'operacoes': {'neighbors': {'us_por_op': 1.0}, 'edge_exists': {'us_por_op': 1.0}}}]}
+    atual = {'casos': [{'representacao': 'r', 'gerador': 'g', 'vertices': 10, 'pico_memoria_bytes': 200,
+                        'operacoes': {'neighbors': {'us_por_op': 2.0}, 'edge_exists': {'us_por_op': 1.1}}}]}
+    regressoes = benchmark.compare(atual, base)
+    assert len(regressoes) == 2
+    assert regressoes[0].startswith("r/g/10 neighbors")
+    assert regressoes[1].startswith("r/g/10 memoria")
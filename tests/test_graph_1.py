@@ -0,0 +1,107 @@
+import random
+from collections import Counter
+
+import pytest
+
+import graph_1
+from conftest import adjacency_edges, apply_graph_1, random_operations
+
+
+def _predecessor_counts(predecessores):
+    return {v: Counter(graph_1._adjacency_list(p)) for v, p in predecessores.items()}
+
+
+@pytest.mark.parametrize('hash_adjacencia', [False, True])
+@pytest.mark.parametrize('semente', range(20))
+def test_indexes_match_full_scans(semente, hash_adjacencia, capsys):
+    operacoes = random_operations(semente)
+    grafo = graph_1.create_graph(hash_adjacencia, multigrafo=True)
+    graus = graph_1.create_degree_index(grafo)
+    predecessores = graph_1.create_predecessor_index(grafo)
+    apply_graph_1(grafo, operacoes, graus=graus, predecessores=predecessores)
+
+    assert graus == graph_1.create_degree_index(grafo)
+    assert graph_1.vertex_degrees(grafo, graus) == graph_1.vertex_degrees(grafo)
+    for vertice in grafo:
+        assert graph_1.vertex_degree(grafo, vertice, graus) == graph_1.vertex_degree(grafo, vertice)
+        assert sorted(graph_1.predecessors(grafo, vertice, predecessores)) == \
+            sorted(graph_1.predecessors(grafo, vertice))
+    assert _predecessor_counts(predecessores) == _predecessor_counts(graph_1.create_predecessor_index(grafo))
+
+
+def test_parallel_edges_count_the_same_with_or_without_index():
+    grafo = graph_1.create_graph()
+    graus = graph_1.create_degree_index(grafo)
+    graph_1.insert_edge(grafo, 'a', 'b', graus=graus)
+    graph_1.insert_edge(grafo, 'a', 'b', graus=graus)
+    esperado = {'in': 2, 'out': 0, 'total': 2}
+    assert graph_1.vertex_degrees(grafo)['b'] == graph_1.vertex_degrees(grafo, graus)['b'] == esperado
+    assert graph_1.vertex_degree(grafo, 'b') == graph_1.vertex_degree(grafo, 'b', graus) == esperado
+
+    graph_1.remove_vertex(grafo, 'b', graus=graus)
+    graph_1.insert_vertex(grafo, 'b', graus=graus)
+    assert graph_1.neighbors(grafo, 'a') == []
+    assert graph_1.vertex_degrees(grafo) == graph_1.vertex_degrees(grafo, graus)
+
+
+@pytest.mark.parametrize('semente', range(20))
+def test_hash_graph_matches_list_graph(semente, capsys):
+    operacoes = random_operations(semente, simples=True)
+    lista = graph_1.create_graph()
+    simples = graph_1.create_graph(hash_adjacencia=True)
+    apply_graph_1(lista, operacoes)
+    apply_graph_1(simples, operacoes)
+
+    assert list(simples) == list(lista)
+    assert adjacency_edges(simples) == adjacency_edges(lista)
+    for vertice in lista:
+        assert graph_1.neighbors(simples, vertice) == graph_1.neighbors(lista, vertice)
+        assert sorted(graph_1.predecessors(simples, vertice)) == sorted(graph_1.predecessors(lista, vertice))
+        for outro in list(lista)[:5]:
+            assert graph_1.edge_exists(simples, vertice, outro) == graph_1.edge_exists(lista, vertice, outro)
+    assert graph_1.vertex_degrees(simples) == graph_1.vertex_degrees(lista)
+
+
+@pytest.mark.parametrize('semente', range(10))
+def test_multigraph_counts_parallel_edges(semente, capsys):
+    operacoes = random_operations(semente)
+    lista = graph_1.create_graph()
+    multigrafo = graph_1.create_graph(hash_adjacencia=True, multigrafo=True)
+    apply_graph_1(lista, operacoes)
+    apply_graph_1(multigrafo, operacoes)
+
+    assert adjacency_edges(multigrafo) == adjacency_edges(lista)
+    assert graph_1.vertex_degrees(multigrafo) == graph_1.vertex_degrees(lista)
+
+
+def test_simple_hash_graph_ignores_repeated_edges():
+    grafo = graph_1.create_graph(hash_adjacencia=True)
+    graph_1.insert_edge(grafo, 'a', 'b')
+    graph_1.insert_edge(grafo, 'a', 'b')
+    assert graph_1.neighbors(grafo, 'a') == ['b']
+    assert graph_1.vertex_degree(grafo, 'b') == {'in': 1, 'out': 0, 'total': 1}
+
+
+@pytest.mark.parametrize('hash_adjacencia', [False, True])
+@pytest.mark.parametrize('semente', range(10))
+def test_remove_vertices_matches_repeated_remove_vertex(semente, hash_adjacencia, capsys):
+    operacoes = random_operations(semente, remover_vertices=False)
+    aleatorio = random.Random(semente)
+    removidos = [f"v{aleatorio.randrange(30)}" for _ in range(6)]
+
+    um_a_um = graph_1.create_graph(hash_adjacencia)
+    apply_graph_1(um_a_um, operacoes)
+    for vertice in removidos:
+        if vertice in um_a_um:
+            graph_1.remove_vertex(um_a_um, vertice)
+
+    em_lote = graph_1.create_graph(hash_adjacencia)
+    graus = graph_1.create_degree_index(em_lote)
+    predecessores = graph_1.create_predecessor_index(em_lote)
+    apply_graph_1(em_lote, operacoes, graus=graus, predecessores=predecessores)
+    graph_1.remove_vertices(em_lote, removidos, graus, predecessores)
+
+    assert list(em_lote) == list(um_a_um)
+    assert adjacency_edges(em_lote) == adjacency_edges(um_a_um)
+    assert graus == graph_1.create_degree_index(em_lote)
+    assert _predecessor_counts(predecessores) == _predecessor_counts(graph_1.create_predecessor_index(em_lote))
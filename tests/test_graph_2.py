@@ -0,0 +1,174 @@
+import random
+
+import pytest
+
+import graph_2
+from conftest import apply_graph_2, random_operations
+
+
+FORMATOS = ['lista', 'compacta', 'bits']
+
+
+def _rows(matriz):
+    return [list(matriz[i]) for i in range(len(matriz))]
+
+
+@pytest.mark.parametrize('semente', range(15))
+def test_index_matches_linear_search(semente, capsys):
+    operacoes = random_operations(semente, quantidade=250, num_vertices=20)
+    matriz_base, vertices_base = graph_2.create_graph()
+    apply_graph_2(matriz_base, vertices_base, operacoes)
+
+    matriz, vertices = graph_2.create_graph()
+    indice = graph_2.create_index(vertices)
+    apply_graph_2(matriz, vertices, operacoes, indice=indice)
+
+    assert vertices == vertices_base
+    assert indice == graph_2.create_index(vertices)
+    assert matriz == matriz_base
+    for vertice in vertices:
+        assert graph_2.neighbors(matriz, vertices, vertice, indice) == graph_2.neighbors(matriz_base, vertices_base, vertice)
+    assert not graph_2.edge_exists(matriz, vertices, 'inexistente', vertices[0], indice)
+
+
+@pytest.mark.parametrize('formato', FORMATOS)
+@pytest.mark.parametrize('semente', range(15))
+def test_backends_match_list(semente, formato, capsys):
+    operacoes = random_operations(semente, quantidade=250, num_vertices=20)
+    matriz_base, vertices_base = graph_2.create_graph()
+    apply_graph_2(matriz_base, vertices_base, operacoes)
+
+    matriz, vertices = graph_2.create_graph(formato)
+    indice = graph_2.create_index(vertices)
+    apply_graph_2(matriz, vertices, operacoes, indice=indice)
+
+    assert vertices == vertices_base
+    assert _rows(matriz) == matriz_base
+    for vertice in vertices:
+        assert graph_2.neighbors(matriz, vertices, vertice, indice) == graph_2.neighbors(matriz_base, vertices_base, vertice)
+    assert graph_2.vertex_degree(matriz, vertices) == graph_2.vertex_degree(matriz_base, vertices_base)
+    assert graph_2.valid_path(matriz, vertices, vertices[:3], indice) == graph_2.valid_path(matriz_base, vertices_base, vertices[:3])
+
+
+@pytest.mark.parametrize('formato', FORMATOS)
+@pytest.mark.parametrize('semente', range(15))
+def test_degree_cache_matches_full_scan(semente, formato, capsys):
+    operacoes = random_operations(semente, quantidade=250, num_vertices=20)
+    matriz, vertices = graph_2.create_graph(formato)
+    indice = graph_2.create_index(vertices)
+    graus = graph_2.create_degree_cache(matriz, vertices)
+    apply_graph_2(matriz, vertices, operacoes, indice=indice, graus=graus)
+
+    assert graph_2.vertex_degree(matriz, vertices, graus) == graph_2.vertex_degree(matriz, vertices)
+    recalculado = graph_2.create_degree_cache(matriz, vertices)
+    assert (graus.saida, graus.entrada, graus.assimetricas) == \
+        (recalculado.saida, recalculado.entrada, recalculado.assimetricas)
+
+
+def test_degree_cache_reuses_result_until_mutation():
+    matriz, vertices = graph_2.create_graph()
+    graus = graph_2.create_degree_cache(matriz, vertices)
+    graph_2.insert_edge(matriz, vertices, 'a', 'b', graus=graus)
+    primeiro = graph_2.vertex_degree(matriz, vertices, graus)
+    primeiro['a']['saida'] = 99
+    assert graph_2.vertex_degree(matriz, vertices, graus)['a']['saida'] == 1
+
+    graph_2.insert_edge(matriz, vertices, 'b', 'a', graus=graus)
+    assert graph_2.vertex_degree(matriz, vertices, graus) == {'a': 1, 'b': 1}
+
+
+def _reachable(matriz, vertices, origem, destino):
+    """Alcançabilidade por busca simples nas linhas da matriz (caminho de uma ou mais arestas)."""
+    i = vertices.index(origem)
+    visitados, pilha = set(), [j for j, valor in enumerate(matriz[i]) if valor]
+    while pilha:
+        j = pilha.pop()
+        if j not in visitados:
+            visitados.add(j)
+            pilha.extend(k for k, valor in enumerate(matriz[j]) if valor)
+    return vertices.index(destino) in visitados
+
+
+@pytest.mark.parametrize('formato', FORMATOS)
+@pytest.mark.parametrize('semente', range(5))
+def test_transitive_closure_matches_search(semente, formato, capsys):
+    operacoes = random_operations(semente, quantidade=80, num_vertices=20)
+    matriz, vertices = graph_2.create_graph(formato)
+    graus = graph_2.create_degree_cache(matriz, vertices)
+    apply_graph_2(matriz, vertices, operacoes, graus=graus)
+
+    fecho = graph_2.transitive_closure(matriz, vertices, graus)
+    assert graph_2.transitive_closure(matriz, vertices, graus) is fecho
+    linhas = _rows(matriz)
+    for origem in vertices:
+        for destino in vertices:
+            assert fecho.reachable(origem, destino) == _reachable(linhas, vertices, origem, destino)
+    assert not fecho.reachable('inexistente', vertices[0])
+
+    graph_2.insert_edge(matriz, vertices, vertices[0], vertices[-1], graus=graus)
+    assert graph_2.transitive_closure(matriz, vertices, graus) is not fecho
+
+
+@pytest.mark.parametrize('formato', FORMATOS)
+@pytest.mark.parametrize('semente', range(10))
+def test_remove_vertices_matches_repeated_remove_vertex(semente, formato, capsys):
+    operacoes = random_operations(semente, quantidade=250, num_vertices=20, remover_vertices=False)
+    aleatorio = random.Random(semente)
+    removidos = [f"v{aleatorio.randrange(25)}" for _ in range(5)]
+
+    matriz_base, vertices_base = graph_2.create_graph()
+    apply_graph_2(matriz_base, vertices_base, operacoes)
+    for vertice in removidos:
+        if vertice in vertices_base:
+            graph_2.remove_vertex(matriz_base, vertices_base, vertice)
+
+    matriz, vertices = graph_2.create_graph(formato)
+    indice = graph_2.create_index(vertices)
+    graus = graph_2.create_degree_cache(matriz, vertices)
+    apply_graph_2(matriz, vertices, operacoes, indice=indice, graus=graus)
+    graph_2.remove_vertices(matriz, vertices, removidos, indice, graus)
+
+    assert vertices == vertices_base
+    assert indice == graph_2.create_index(vertices)
+    assert _rows(matriz) == matriz_base
+    assert graph_2.vertex_degree(matriz, vertices, graus) == graph_2.vertex_degree(matriz_base, vertices_base)
+
+
+def test_unknown_format_raises():
+    with pytest.raises(ValueError):
+        graph_2.create_graph('esparsa')
+
+
+@pytest.mark.parametrize('formato', FORMATOS)
+@pytest.mark.parametrize('semente', range(10))
+def test_insert_edges_matches_repeated_insert_edge(semente, formato):
+    aleatorio = random.Random(semente)
+    arestas = [(f"v{aleatorio.randrange(30)}", f"v{aleatorio.randrange(30)}") for _ in range(120)]
+
+    matriz_base, vertices_base = graph_2.create_graph()
+    for origem, destino in arestas:
+        graph_2.insert_edge(matriz_base, vertices_base, origem, destino, nao_direcionado=True)
+
+    matriz, vertices = graph_2.create_graph(formato)
+    indice = graph_2.create_index(vertices)
+    graus = graph_2.create_degree_cache(matriz, vertices)
+    graph_2.insert_edges(matriz, vertices, arestas, nao_direcionado=True, indice=indice, graus=graus)
+
+    assert vertices == vertices_base
+    assert indice == graph_2.create_index(vertices)
+    assert _rows(matriz) == matriz_base
+    assert graph_2.vertex_degree(matriz, vertices, graus) == graph_2.vertex_degree(matriz_base, vertices_base)
+
+
+def test_bit_matrix_symmetry_and_column_sums():
+    matriz, vertices = graph_2.create_graph('bits')
+    graph_2.insert_edge(matriz, vertices, 'a', 'b', nao_direcionado=True)
+    graph_2.insert_edge(matriz, vertices, 'c', 'c')
+    assert matriz.is_symmetric()
+    assert [matriz.column_sum(i) for i in range(3)] == [1, 1, 1]
+
+    graph_2.insert_edge(matriz, vertices, 'a', 'c')
+    assert not matriz.is_symmetric()
+    assert [matriz.column_sum(i) for i in range(3)] == [1, 1, 2]
+    graph_2.remove_vertex(matriz, vertices, 'b')
+    assert [matriz.column_sum(i) for i in range(2)] == [0, 2]
@@ -0,0 +1,170 @@
+import random
+
+import pytest
+
+import graph_3
+from conftest import apply_graph_3, edge_tuples, random_operations
+
+
+class Relogio:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self):
+        return self.agora
+
+
+def test_temporal_rejects_non_positive_window():
+    with pytest.raises(ValueError):
+        graph_3.TemporalEdgeList(0)
+    with pytest.raises(ValueError):
+        graph_3.TemporalEdgeList(-5)
+    with pytest.raises(ValueError):
+        graph_3.TemporalEdgeList(10, tamanho_balde=0)
+    with pytest.raises(ValueError):
+        graph_3.create_graph(janela=0)
+
+
+def test_temporal_explicit_instants_expire_on_insert():
+    arestas = graph_3.TemporalEdgeList(10, tamanho_balde=1)
+    arestas.add('a', 'b', 0)
+    arestas.add('b', 'c', 5)
+    assert ('a', 'b') in arestas
+    assert arestas.add('c', 'd', 12) == 1
+    assert list(arestas) == [('b', 'c'), ('c', 'd')]
+    assert arestas.neighbors('b') == ['c']
+    assert arestas.neighbors('b', janela=5) == []
+
+
+def test_temporal_clock_queries_expire_without_inserts():
+    relogio = Relogio()
+    arestas = graph_3.TemporalEdgeList(10, tamanho_balde=1, relogio=relogio)
+    arestas.add('a', 'b')
+    relogio.agora = 4
+    arestas.add('b', 'c')
+    assert len(arestas) == 2
+
+    relogio.agora = 12
+    assert ('a', 'b') not in arestas
+    assert list(arestas) == [('b', 'c')]
+    assert arestas.degree_counts() == ({'b': 1}, {'c': 1})
+
+    relogio.agora = 20
+    assert arestas.neighbors('b') == []
+    assert len(arestas) == 0
+
+
+def test_temporal_repeated_edge_renews_and_remove_ignores_old_occurrences():
+    arestas = graph_3.TemporalEdgeList(10, tamanho_balde=1)
+    arestas.add('a', 'b', 0)
+    arestas.add('a', 'b', 8)
+    arestas.add('x', 'y', 15)
+    assert ('a', 'b') in arestas
+
+    arestas.remove(('a', 'b'))
+    arestas.add('a', 'b', 16)
+    arestas.expire(25)
+    assert ('a', 'b') in arestas
+    arestas.expire(30)
+    assert len(arestas) == 0
+
+
+def test_temporal_graph_functions():
+    vertices, arestas = graph_3.create_graph(janela=10, tamanho_balde=1)
+    graph_3.insert_edge(vertices, arestas, 'a', 'b', instante=0)
+    graph_3.insert_edge(vertices, arestas, 'a', 'c', instante=6)
+    assert sorted(graph_3.neighbors(vertices, arestas, 'a')) == ['b', 'c']
+    assert graph_3.neighbors(vertices, arestas, 'a', janela=3) == ['c']
+    graph_3.remove_vertex(vertices, arestas, 'c')
+    assert list(arestas) == [('a', 'b')]
+
+
+BACKENDS = [
+    pytest.param(lambda: graph_3.create_graph(indexado=True), id='hash'),
+    pytest.param(lambda: graph_3.create_graph(compacto=True), id='compacta'),
+    pytest.param(lambda: graph_3.create_graph(janela=float('inf')), id='temporal'),
+]
+
+
+@pytest.mark.parametrize('indexado_csr', [False, True])
+@pytest.mark.parametrize('criar', [pytest.param(graph_3.create_graph, id='lista')] + BACKENDS)
+@pytest.mark.parametrize('semente', range(15))
+def test_backends_match_list(semente, criar, indexado_csr, capsys):
+    operacoes = random_operations(semente)
+    vertices_base, arestas_base = graph_3.create_graph()
+    apply_graph_3(vertices_base, arestas_base, operacoes)
+
+    vertices, arestas = criar()
+    indice = graph_3.create_neighbor_index() if indexado_csr else None
+    apply_graph_3(vertices, arestas, operacoes, indice_vizinhos=indice)
+
+    assert list(vertices) == list(vertices_base)
+    assert edge_tuples(arestas) == edge_tuples(arestas_base)
+    assert graph_3.vertex_degrees(vertices, arestas) == graph_3.vertex_degrees(vertices_base, arestas_base)
+    for vertice in vertices_base:
+        assert sorted(graph_3.neighbors(vertices, arestas, vertice, indice)) == \
+            sorted(graph_3.neighbors(vertices_base, arestas_base, vertice))
+    for origem, destino in edge_tuples(arestas_base)[:20]:
+        assert graph_3.edge_exists(arestas, origem, destino)
+
+
+def test_compact_extend_drops_repeated_edges():
+    arestas = graph_3.CompactEdgeList([('a', 'b'), ('b', 'c'), ('a', 'b')])
+    arestas.extend([('b', 'c'), ('c', 'a'), ('a', 'b')])
+    assert len(arestas) == 3
+    assert list(arestas) == [('a', 'b'), ('b', 'c'), ('c', 'a')]
+    assert arestas.degree_counts() == ({0: 1, 1: 1, 2: 1}, {0: 1, 1: 1, 2: 1})
+
+    arestas.remove(('a', 'b'))
+    assert ('a', 'b') not in arestas
+    arestas.append(('a', 'b'))
+    arestas.append(('a', 'b'))
+    assert list(arestas) == [('b', 'c'), ('c', 'a'), ('a', 'b')]
+    with pytest.raises(KeyError):
+        arestas.remove(('c', 'b'))
+
+
+def test_compact_index_survives_many_appends_and_removals():
+    arestas = graph_3.CompactEdgeList()
+    esperadas = {}
+    for k in range(5000):
+        aresta = (k % 97, k % 89)
+        if k % 3 == 0 and esperadas:
+            removida = next(iter(esperadas))
+            arestas.remove(removida)
+            del esperadas[removida]
+        if aresta not in arestas:
+            arestas.append(aresta)
+            esperadas[aresta] = None
+    assert list(arestas) == list(esperadas)
+    assert all(aresta in arestas for aresta in esperadas)
+    assert arestas.chaves is None or len(arestas.pendentes) <= max(
+        arestas.LIMITE_PENDENTES, len(arestas.chaves) >> 3)
+
+
+@pytest.mark.parametrize('criar', [pytest.param(graph_3.create_graph, id='lista')] + BACKENDS)
+@pytest.mark.parametrize('semente', range(10))
+def test_bulk_removals_match_one_by_one(semente, criar, capsys):
+    operacoes = random_operations(semente, remover_vertices=False)
+    aleatorio = random.Random(semente)
+    removidas = [(f"v{aleatorio.randrange(25)}", f"v{aleatorio.randrange(25)}") for _ in range(40)]
+    removidos = [f"v{aleatorio.randrange(30)}" for _ in range(5)]
+
+    vertices_base, arestas_base = graph_3.create_graph()
+    apply_graph_3(vertices_base, arestas_base, operacoes)
+    for origem, destino in removidas:
+        graph_3.remove_edge(arestas_base, origem, destino)
+    for vertice in removidos:
+        graph_3.remove_vertex(vertices_base, arestas_base, vertice)
+
+    vertices, arestas = criar()
+    indice = graph_3.create_neighbor_index()
+    apply_graph_3(vertices, arestas, operacoes, indice_vizinhos=indice)
+    graph_3.remove_edges(arestas, removidas, indice_vizinhos=indice)
+    graph_3.remove_vertices(vertices, arestas, removidos, indice)
+
+    assert list(vertices) == list(vertices_base)
+    assert edge_tuples(arestas) == edge_tuples(arestas_base)
+    for vertice in vertices_base:
+        assert sorted(graph_3.neighbors(vertices, arestas, vertice, indice)) == \
+            sorted(graph_3.neighbors(vertices_base, arestas_base, vertice))
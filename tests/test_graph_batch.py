@@ -0,0 +1,109 @@
+import random
+
+import pytest
+
+import graph_1
+import graph_2
+import graph_batch
+import graph_protocol
+from conftest import apply_operations, random_operations
+
+
+FABRICAS = {
+    'lista_adjacencia': lambda: graph_protocol.AdjacencyListGraph(),
+    'lista_adjacencia_hash': lambda: graph_protocol.AdjacencyListGraph(graph_1.create_graph(hash_adjacencia=True)),
+    'lista_adjacencia_multigrafo': lambda: graph_protocol.AdjacencyListGraph(graph_1.create_graph(hash_adjacencia=True, multigrafo=True)),
+    'matriz_lista': lambda: graph_protocol.AdjacencyMatrixGraph(formato="lista"),
+    'matriz_compacta': lambda: graph_protocol.AdjacencyMatrixGraph(formato="compacta"),
+    'matriz_bits': lambda: graph_protocol.AdjacencyMatrixGraph(formato="bits"),
+    'lista_arestas': lambda: graph_protocol.EdgeListGraph(indexado=False),
+    'lista_arestas_hash': lambda: graph_protocol.EdgeListGraph(indexado=True),
+    'lista_arestas_compacta': lambda: graph_protocol.EdgeListGraph(compacto=True),
+}
+
+
+def _state(grafo):
+    # a ordem dos vértices faz parte do resultado; a das arestas varia entre lote e sequência
+    return grafo.vertices(), sorted(grafo.edges())
+
+
+@pytest.mark.parametrize('representacao', list(FABRICAS))
+@pytest.mark.parametrize('semente', range(40))
+def test_batch_matches_sequential(representacao, semente):
+    aleatorio = random.Random(semente)
+    iniciais = [op for op in random_operations(aleatorio, quantidade=30, num_vertices=12) if op[0] == 'insert_edge']
+    sequencial, em_lote = FABRICAS[representacao](), FABRICAS[representacao]()
+    apply_operations(sequencial, iniciais)
+    apply_operations(em_lote, iniciais)
+
+    operacoes = random_operations(aleatorio, quantidade=40, num_vertices=12)
+    apply_operations(sequencial, operacoes)
+    graph_batch.apply_batch(em_lote, operacoes)
+
+    assert _state(em_lote) == _state(sequencial)
+    assert em_lote.vertex_degrees() == sequencial.vertex_degrees()
+
+
+def test_repeated_inserts_keep_multiplicity():
+    sequencial = graph_protocol.AdjacencyListGraph()
+    em_lote = graph_protocol.AdjacencyListGraph()
+    operacoes = [('insert_edge', 'c', 'b'), ('insert_edge', 'c', 'b')]
+    apply_operations(sequencial, operacoes)
+    graph_batch.apply_batch(em_lote, operacoes)
+    assert list(em_lote.edges()) == list(sequencial.edges()) == [('c', 'b'), ('c', 'b')]
+
+
+def test_remove_after_insert_of_existing_edge():
+    for fabrica in FABRICAS.values():
+        sequencial, em_lote = fabrica(), fabrica()
+        for grafo in (sequencial, em_lote):
+            grafo.insert_edge('a', 'b')
+        operacoes = [('insert_edge', 'a', 'b'), ('remove_edge', 'a', 'b')]
+        apply_operations(sequencial, operacoes)
+        graph_batch.apply_batch(em_lote, operacoes)
+        assert _state(em_lote) == _state(sequencial)
+
+
+@pytest.mark.parametrize('representacao', list(FABRICAS))
+def test_new_vertices_keep_first_appearance_order(representacao):
+    operacoes = [('insert_edge', 'a', 'b'), ('insert_vertex', 'c'), ('insert_edge', 'd', 'a'),
+                 ('remove_vertex', 'b'), ('insert_vertex', 'b')]
+    sequencial, em_lote = FABRICAS[representacao](), FABRICAS[representacao]()
+    apply_operations(sequencial, operacoes)
+    graph_batch.apply_batch(em_lote, operacoes)
+    assert em_lote.vertices() == sequencial.vertices() == ['a', 'c', 'd', 'b']
+
+    em_lote = FABRICAS[representacao]()
+    graph_batch.apply_batch(em_lote, [('insert_edge', 'a', 'b'), ('insert_vertex', 'c')])
+    assert em_lote.vertices() == ['a', 'b', 'c']
+
+
+def test_context_manager_discards_on_error():
+    grafo = graph_protocol.AdjacencyMatrixGraph()
+    grafo.insert_edge('a', 'b')
+    with pytest.raises(RuntimeError):
+        with graph_batch.GraphBatch(grafo) as lote:
+            lote.remove_vertex('a')
+            raise RuntimeError
+    assert _state(grafo) == (['a', 'b'], [('a', 'b')])
+
+
+def test_commit_rolls_back_on_failure(monkeypatch):
+    grafo = graph_protocol.AdjacencyMatrixGraph(formato="bits")
+    grafo.insert_edge('a', 'b')
+    matriz = grafo.matriz
+    antes = _state(grafo)
+
+    def falha(*args, **kwargs):
+        raise ZeroDivisionError
+
+    lote = graph_batch.GraphBatch(grafo)
+    lote.remove_vertex('a')
+    lote.insert_edge('c', 'd')
+    monkeypatch.setattr(graph_2, 'insert_edges', falha)
+    with pytest.raises(ZeroDivisionError):
+        lote.commit()
+
+    assert _state(grafo) == antes
+    assert grafo.matriz is matriz
+    assert grafo.indice == {'a': 0, 'b': 1}
@@ -0,0 +1,69 @@
+import pytest
+
+import graph_1
+import graph_2
+import graph_3
+import graph_components
+from conftest import apply_graph_1, apply_graph_2, apply_graph_3, random_operations
+
+
+def _reference_components(vertices, arestas):
+    """Componentes fracamente conexos por busca simples (arestas tratadas como não-direcionadas)."""
+    vizinhos = {v: set() for v in vertices}
+    for origem, destino in arestas:
+        vizinhos[origem].add(destino)
+        vizinhos[destino].add(origem)
+    componente = {}
+    for inicio in vertices:
+        if inicio in componente:
+            continue
+        pilha = [inicio]
+        componente[inicio] = inicio
+        while pilha:
+            u = pilha.pop()
+            for v in vizinhos[u]:
+                if v not in componente:
+                    componente[v] = inicio
+                    pilha.append(v)
+    return componente
+
+
+def _chunks(semente, tamanho=25):
+    """Operações aleatórias em blocos de 'tamanho', para conferir os componentes entre um bloco e outro."""
+    operacoes = random_operations(semente, quantidade=150, num_vertices=30, nao_direcionado=0)
+    return [operacoes[k:k + tamanho] for k in range(0, len(operacoes), tamanho)]
+
+
+def _check(componentes, vertices, arestas):
+    referencia = _reference_components(vertices, arestas)
+    assert componentes.count() == len(set(referencia.values()))
+    for a in vertices:
+        for b in vertices:
+            assert componentes.same_component(a, b) == (referencia[a] == referencia[b])
+
+
+@pytest.mark.parametrize('semente', range(10))
+def test_adjacency_list_components(semente, capsys):
+    grafo = graph_1.create_graph(hash_adjacencia=True)
+    componentes = graph_components.create_components_adjacency_list(grafo)
+    for bloco in _chunks(semente):
+        apply_graph_1(grafo, bloco, componentes=componentes)
+        _check(componentes, list(grafo), [(o, d) for o in grafo for d in graph_1.neighbors(grafo, o)])
+
+
+@pytest.mark.parametrize('semente', range(10))
+def test_matrix_components(semente, capsys):
+    matriz, vertices = graph_2.create_graph("compacta")
+    componentes = graph_components.create_components_matrix(matriz, vertices)
+    for bloco in _chunks(semente):
+        apply_graph_2(matriz, vertices, bloco, componentes=componentes)
+        _check(componentes, vertices, [(o, d) for o in vertices for d in graph_2.neighbors(matriz, vertices, o)])
+
+
+@pytest.mark.parametrize('semente', range(10))
+def test_edge_list_components(semente, capsys):
+    vertices, arestas = graph_3.create_graph(indexado=True)
+    componentes = graph_components.create_components_edge_list(vertices, arestas)
+    for bloco in _chunks(semente):
+        apply_graph_3(vertices, arestas, bloco, componentes=componentes)
+        _check(componentes, list(vertices), list(arestas))
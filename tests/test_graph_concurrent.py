@@ -0,0 +1,91 @@
+import threading
+
+import pytest
+
+import graph_1
+import graph_concurrent
+import graph_protocol
+from conftest import apply_operations, random_operations
+
+
+FABRICAS = {
+    'lista_adjacencia_hash': lambda: graph_protocol.AdjacencyListGraph(graph_1.create_graph(hash_adjacencia=True)),
+    'matriz_bits': lambda: graph_protocol.AdjacencyMatrixGraph(formato="bits"),
+    'lista_arestas_hash': lambda: graph_protocol.EdgeListGraph(indexado=True),
+}
+
+
+def _state(grafo):
+    return sorted(grafo.vertices()), sorted(grafo.edges()), grafo.vertex_degrees()
+
+
+@pytest.mark.parametrize('representacao', list(FABRICAS))
+@pytest.mark.parametrize('semente', range(5))
+def test_concurrent_graph_matches_adapter(representacao, semente, capsys):
+    base, concorrente = FABRICAS[representacao](), graph_concurrent.ConcurrentGraph(FABRICAS[representacao]())
+    operacoes = random_operations(semente, quantidade=200, num_vertices=20)
+    apply_operations(base, operacoes)
+    apply_operations(concorrente, operacoes)
+    assert _state(concorrente) == _state(base)
+    for vertice in base.vertices():
+        assert sorted(concorrente.neighbors(vertice)) == sorted(base.neighbors(vertice))
+
+
+@pytest.mark.parametrize('representacao', list(FABRICAS))
+def test_readers_never_see_partial_mutations(representacao, capsys):
+    concorrente = graph_concurrent.ConcurrentGraph(FABRICAS[representacao]())
+    erros = []
+    parar = threading.Event()
+
+    def escritor():
+        try:
+            for k in range(300):
+                concorrente.insert_edge(f"v{k % 20}", f"v{(k * 7) % 20}", nao_direcionado=True)
+                if k % 5 == 0:
+                    concorrente.remove_vertex(f"v{k % 20}")
+        except Exception as erro:
+            erros.append(erro)
+        finally:
+            parar.set()
+
+    def leitor():
+        try:
+            while not parar.is_set():
+                vertices = set(concorrente.vertices())
+                arestas = concorrente.edges()
+                for vertice in list(vertices)[:3]:
+                    concorrente.neighbors(vertice)
+                concorrente.vertex_degrees()
+                # cada leitura isolada é consistente: arestas não direcionadas vêm aos pares
+                assert set(arestas) == {(d, o) for o, d in arestas}
+        except Exception as erro:
+            erros.append(erro)
+
+    threads = [threading.Thread(target=escritor)] + [threading.Thread(target=leitor) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert erros == []
+
+
+def test_versioned_graph_publishes_snapshots():
+    versionado = graph_concurrent.VersionedGraph(graph_protocol.EdgeListGraph(indexado=True))
+    assert versionado.epoch() == 0
+    versionado.insert_edge('a', 'b')
+    assert versionado.vertices() == []
+    epoca, antigo = versionado.snapshot()
+
+    assert versionado.publish() == 1
+    assert versionado.edges() == [('a', 'b')]
+    assert versionado.neighbors('a') == ['b']
+    assert versionado.edge_exists('a', 'b')
+    assert versionado.valid_path(['a', 'b'])
+    assert antigo.vertices() == [] and epoca == 0
+
+    automatico = graph_concurrent.VersionedGraph(graph_protocol.AdjacencyListGraph(), auto_publicar=True)
+    automatico.insert_edge('a', 'b')
+    automatico.remove_edge('a', 'b')
+    assert automatico.epoch() == 2
+    assert automatico.edges() == []
+    assert automatico.vertex_degrees() == {'a': {'in': 0, 'out': 0, 'total': 0}, 'b': {'in': 0, 'out': 0, 'total': 0}}
@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+import graph_1
+import graph_2
+import graph_3
+import graph_frozen
+import graph_protocol
+
+
+def _random_edges(semente, quantidade=120, num_vertices=30):
+    aleatorio = random.Random(semente)
+    return [(f"v{aleatorio.randrange(num_vertices)}", f"v{aleatorio.randrange(num_vertices)}") for _ in range(quantidade)]
+
+
+def _frozen_from_each_module(arestas):
+    grafo = graph_1.create_graph(hash_adjacencia=True)
+    matriz, vertices_matriz = graph_2.create_graph("bits")
+    vertices, lista = graph_3.create_graph()
+    for origem, destino in arestas:
+        graph_1.insert_edge(grafo, origem, destino)
+        graph_2.insert_edge(matriz, vertices_matriz, origem, destino)
+        graph_3.insert_edge(vertices, lista, origem, destino)
+    return (vertices, lista), {
+        'lista_adjacencia': graph_frozen.freeze_adjacency_list(grafo),
+        'matriz': graph_frozen.freeze_matrix(matriz, vertices_matriz),
+        'lista_arestas': graph_frozen.freeze_edge_list(vertices, lista),
+        'adaptador': graph_frozen.freeze(graph_protocol.EdgeListGraph(vertices, lista)),
+    }
+
+
+@pytest.mark.parametrize('semente', range(10))
+def test_frozen_matches_edge_list(semente, capsys):
+    (vertices, arestas), congelados = _frozen_from_each_module(_random_edges(semente))
+    graus = {v: {'in': g['entrada'], 'out': g['saida'], 'total': g['total']}
+             for v, g in graph_3.vertex_degrees(vertices, arestas).items()}
+
+    for frozen in congelados.values():
+        assert frozen.vertices() == vertices
+        assert sorted(frozen.edges()) == sorted(map(tuple, arestas))
+        assert frozen.vertex_degrees() == graus
+        for origem in vertices:
+            assert sorted(frozen.neighbors(origem)) == sorted(graph_3.neighbors(vertices, arestas, origem))
+            for destino in vertices[:10]:
+                assert frozen.edge_exists(origem, destino) == graph_3.edge_exists(arestas, origem, destino)
+        for origem, destino in arestas[:10]:
+            assert frozen.valid_path([origem, destino]) == graph_3.valid_path(arestas, [origem, destino])
+
+
+def test_frozen_is_read_only():
+    frozen = graph_frozen.freeze_edge_list(['a', 'b'], [['a', 'b']])
+    with pytest.raises(TypeError):
+        frozen.alvos[0] = 1
+    with pytest.raises(TypeError):
+        frozen.ids['c'] = 2
+    assert frozen.neighbors('c') == []
+    assert frozen.vertex_degree('c') is None
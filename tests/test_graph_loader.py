@@ -0,0 +1,68 @@
+import random
+
+import pytest
+
+import graph_1
+import graph_2
+import graph_3
+import graph_loader
+
+
+@pytest.fixture
+def arquivo(tmp_path):
+    aleatorio = random.Random(0)
+    arestas = [(f"v{aleatorio.randrange(40)}", f"v{aleatorio.randrange(40)}") for _ in range(300)]
+    linhas = ["# comentário", ""]
+    for k, (origem, destino) in enumerate(arestas):
+        linhas.append(f"{origem},{destino}" if k % 2 else f"{origem} {destino}")
+    linhas.append("incompleta")
+    caminho = tmp_path / "arestas.txt"
+    caminho.write_text("\n".join(linhas))
+    return str(caminho), arestas
+
+
+@pytest.mark.parametrize('tamanho_bloco', [7, 64, graph_loader.TAMANHO_BLOCO])
+def test_iter_edge_file_reads_every_edge(arquivo, tamanho_bloco):
+    caminho, arestas = arquivo
+    progresso = []
+    assert list(graph_loader.iter_edge_file(caminho, tamanho_bloco, progresso.append)) == arestas
+    assert progresso[-1]['arestas'] == len(arestas)
+    assert progresso[-1]['bytes'] == progresso[-1]['total_bytes']
+
+
+def test_empty_file(tmp_path):
+    caminho = tmp_path / "vazio.txt"
+    caminho.write_text("")
+    assert list(graph_loader.iter_edge_file(str(caminho))) == []
+
+
+@pytest.mark.parametrize('hash_adjacencia', [False, True])
+def test_load_adjacency_list_matches_inserts(arquivo, hash_adjacencia):
+    caminho, arestas = arquivo
+    esperado = graph_1.create_graph(hash_adjacencia)
+    for origem, destino in arestas:
+        graph_1.insert_edge(esperado, origem, destino)
+    carregado = graph_loader.load_adjacency_list(caminho, graph_1.create_graph(hash_adjacencia), tamanho_bloco=50)
+    assert carregado == esperado
+
+
+@pytest.mark.parametrize('formato', ['lista', 'compacta', 'bits'])
+def test_load_matrix_matches_inserts(arquivo, formato):
+    caminho, arestas = arquivo
+    matriz_base, vertices_base = graph_2.create_graph()
+    for origem, destino in arestas:
+        graph_2.insert_edge(matriz_base, vertices_base, origem, destino, nao_direcionado=True)
+    matriz, vertices = graph_loader.load_matrix(caminho, nao_direcionado=True, formato=formato, tamanho_lote=32)
+    assert vertices == vertices_base
+    assert [list(matriz[i]) for i in range(len(matriz))] == matriz_base
+
+
+@pytest.mark.parametrize('indexado, compacto', [(False, False), (True, False), (False, True)])
+def test_load_edge_list_matches_inserts(arquivo, indexado, compacto, capsys):
+    caminho, arestas = arquivo
+    vertices_base, arestas_base = graph_3.create_graph()
+    for origem, destino in arestas:
+        graph_3.insert_edge(vertices_base, arestas_base, origem, destino)
+    vertices, carregadas = graph_loader.load_edge_list(caminho, indexado=indexado, compacto=compacto)
+    assert list(vertices) == vertices_base
+    assert [tuple(aresta) for aresta in carregadas] == [tuple(aresta) for aresta in arestas_base]
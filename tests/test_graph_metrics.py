@@ -0,0 +1,73 @@
+import pytest
+
+import graph_1
+import graph_3
+import graph_metrics
+
+
+@pytest.fixture
+def instrumentado():
+    graph_metrics.reset()
+    graph_metrics.enable()
+    try:
+        yield
+    finally:
+        graph_metrics.disable()
+        graph_metrics.reset()
+
+
+def test_enable_records_calls_and_results_do_not_change(instrumentado):
+    original = graph_metrics._originais[graph_1]['insert_edge']
+    assert graph_metrics.is_enabled()
+    grafo = graph_1.create_graph()
+    graph_1.insert_edge(grafo, 'a', 'b')
+    graph_1.insert_edge(grafo, 'b', 'c')
+    assert graph_1.neighbors(grafo, 'a') == ['b']
+
+    estatisticas = graph_metrics.snapshot()
+    assert estatisticas['graph_1.insert_edge']['chamadas'] == 2
+    # chamadas internas também são medidas
+    assert estatisticas['graph_1.insert_vertex']['chamadas'] == 3
+    assert sum(estatisticas['graph_1.insert_edge']['histograma_us'].values()) == 2
+    assert any(linha.startswith("graph.graph_1.insert_edge.chamadas 2") for linha in graph_metrics.export_lines())
+
+    graph_metrics.disable()
+    assert not graph_metrics.is_enabled()
+    assert graph_1.insert_edge is original
+    graph_1.insert_edge(grafo, 'c', 'd')
+    assert graph_metrics.snapshot()['graph_1.insert_edge']['chamadas'] == 2
+
+
+def test_edge_list_scans_are_estimated(instrumentado):
+    vertices, arestas = graph_3.create_graph()
+    for k in range(10):
+        graph_3.insert_edge(vertices, arestas, f"v{k}", f"v{k + 1}")
+    graph_metrics.reset()
+    graph_3.edge_exists(arestas, 'v0', 'v1')
+    assert graph_metrics.snapshot()['graph_3.edge_exists']['varreduras'] > 0
+
+
+def test_reset_clears_statistics(instrumentado):
+    graph_1.insert_vertex(graph_1.create_graph(), 'a')
+    assert graph_metrics.snapshot()
+    graph_metrics.reset()
+    assert graph_metrics.snapshot() == {}
+
+
+def test_edge_list_estimates_follow_the_container(instrumentado):
+    vertices, arestas = graph_3.create_graph(compacto=True)
+    for k in range(10):
+        graph_3.insert_edge(vertices, arestas, f"v{k}", f"v{k + 1}")
+    graph_3.remove_vertex(vertices, arestas, 'v0')
+    graph_3.remove_vertex(vertices, arestas, 'inexistente')
+    assert graph_metrics.snapshot()['graph_3.remove_vertex']['varreduras'] == 10
+
+    graph_metrics.reset()
+    vertices, arestas = graph_3.create_graph(janela=10, tamanho_balde=1)
+    for k in range(10):
+        graph_3.insert_edge(vertices, arestas, f"v{k}", f"v{k + 1}", instante=k)
+    graph_3.neighbors(vertices, arestas, 'v3')
+    graph_3.vertex_degrees(vertices, arestas)
+    estatisticas = graph_metrics.snapshot()
+    assert estatisticas['graph_3.neighbors']['varreduras'] == 0
+    assert estatisticas['graph_3.vertex_degrees']['varreduras'] == len(vertices)
@@ -0,0 +1,80 @@
+import os
+import random
+from multiprocessing import Pool
+
+import pytest
+
+import graph_1
+import graph_3
+import graph_frozen
+import graph_parallel
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with Pool(2) as compartilhado:
+        yield compartilhado
+
+
+def _random_edge_list(semente, indexado=False, compacto=False):
+    aleatorio = random.Random(semente)
+    vertices, arestas = graph_3.create_graph(indexado, compacto)
+    for _ in range(500):
+        graph_3.insert_edge(vertices, arestas, f"v{aleatorio.randrange(60)}", f"v{aleatorio.randrange(60)}")
+    graph_3.insert_vertex(vertices, "isolado")
+    for _ in range(100):
+        graph_3.remove_edge(arestas, f"v{aleatorio.randrange(60)}", f"v{aleatorio.randrange(60)}")
+    graph_3.remove_vertex(vertices, arestas, "v3")
+    return vertices, arestas
+
+
+@pytest.mark.parametrize('indexado, compacto', [(False, False), (True, False), (False, True)])
+def test_degrees_match_edge_list(pool, indexado, compacto):
+    vertices, arestas = _random_edge_list(1, indexado, compacto)
+    assert graph_parallel.parallel_vertex_degrees(vertices, arestas, pool=pool) == graph_3.vertex_degrees(vertices, arestas)
+
+
+@pytest.mark.parametrize('hash_adjacencia', [False, True])
+def test_degrees_match_adjacency_list(pool, hash_adjacencia):
+    aleatorio = random.Random(2)
+    grafo = graph_1.create_graph(hash_adjacencia, multigrafo=True)
+    for _ in range(400):
+        graph_1.insert_edge(grafo, f"v{aleatorio.randrange(50)}", f"v{aleatorio.randrange(50)}")
+    esperado = graph_1.vertex_degrees(grafo, graph_1.create_degree_index(grafo))
+    assert graph_parallel.parallel_vertex_degrees_adjacency_list(grafo, pool=pool) == esperado
+
+
+def test_neighbor_sum_matches_frozen(pool):
+    vertices, arestas = _random_edge_list(3)
+    frozen = graph_frozen.freeze_edge_list(vertices, arestas)
+    valores = [random.Random(4).random() for _ in frozen.nomes]
+    with graph_parallel.share_frozen(frozen, pool=pool) as compartilhadas:
+        for _ in range(3):
+            somas = compartilhadas.neighbor_sum(valores)
+            esperado = [sum(valores[j] for j in frozen.neighbor_ids(i)) for i in range(len(frozen))]
+            assert somas == pytest.approx(esperado)
+
+
+def test_shared_ids_start_with_the_vertex_list(pool):
+    arestas = graph_3.HashList([('c', 'a'), ('x', 'a'), ('a', 'c')])
+    with graph_parallel.share_edge_list(['a', 'b', 'c'], arestas, pool=pool) as compartilhadas:
+        assert compartilhadas.nomes == ['a', 'b', 'c', 'x']
+        saida, entrada = compartilhadas.degree_counts()
+    assert (saida, entrada) == ({2: 1, 3: 1, 0: 1}, {0: 2, 2: 1})
+
+
+def test_empty_edge_list():
+    assert graph_parallel.parallel_vertex_degrees(['a', 'b'], [], processos=1) == {
+        'a': {'entrada': 0, 'saida': 0, 'total': 0},
+        'b': {'entrada': 0, 'saida': 0, 'total': 0},
+    }
+
+
+def test_external_pool_is_not_closed_and_blocks_are_released(pool):
+    vertices, arestas = _random_edge_list(5)
+    antes = set(os.listdir('/dev/shm')) if os.path.isdir('/dev/shm') else set()
+    for _ in range(3):
+        graph_parallel.parallel_vertex_degrees(vertices, arestas, pool=pool)
+    assert pool.apply(sum, ([1, 2],)) == 3
+    if os.path.isdir('/dev/shm'):
+        assert set(os.listdir('/dev/shm')) <= antes
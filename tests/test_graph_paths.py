@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+import graph_1
+import graph_2
+import graph_3
+import graph_frozen
+import graph_paths
+
+
+def _random_case(semente, num_vertices=15):
+    aleatorio = random.Random(semente)
+    arestas = [(f"v{aleatorio.randrange(num_vertices)}", f"v{aleatorio.randrange(num_vertices)}") for _ in range(60)]
+    caminhos = [[f"v{aleatorio.randrange(num_vertices + 2)}" for _ in range(aleatorio.randrange(5))] for _ in range(200)]
+    return arestas, caminhos
+
+
+def _expected_failure(existe, caminho):
+    for i in range(len(caminho) - 1):
+        if not existe(caminho[i], caminho[i + 1]):
+            return i
+    return -1
+
+
+@pytest.mark.parametrize('semente', range(10))
+def test_batch_paths_match_valid_path(semente, capsys):
+    arestas, caminhos = _random_case(semente)
+    grafo = graph_1.create_graph()
+    matriz, vertices_matriz = graph_2.create_graph()
+    vertices, lista = graph_3.create_graph()
+    for origem, destino in arestas:
+        graph_1.insert_edge(grafo, origem, destino)
+        graph_2.insert_edge(matriz, vertices_matriz, origem, destino)
+        graph_3.insert_edge(vertices, lista, origem, destino)
+    frozen = graph_frozen.freeze_edge_list(vertices, lista)
+
+    mascara = [graph_1.valid_path(grafo, caminho) for caminho in caminhos]
+    falhas = [_expected_failure(lambda u, v: graph_1.edge_exists(grafo, u, v), caminho) for caminho in caminhos]
+
+    assert graph_paths.valid_paths_adjacency_list(grafo, caminhos) == (mascara, falhas)
+    assert graph_paths.valid_paths_matrix(matriz, vertices_matriz, caminhos) == (mascara, falhas)
+    assert graph_paths.valid_paths_edge_list(lista, caminhos) == (mascara, falhas)
+    assert graph_paths.valid_paths_frozen(frozen, caminhos) == (mascara, falhas)
+    assert mascara == [graph_2.valid_path(matriz, vertices_matriz, caminho) for caminho in caminhos]
+    assert mascara == [graph_3.valid_path(lista, caminho) for caminho in caminhos]
+
+
+@pytest.mark.parametrize('semente', range(5))
+def test_frozen_id_paths_with_padding(semente, capsys):
+    arestas, caminhos = _random_case(semente)
+    vertices, lista = graph_3.create_graph()
+    for origem, destino in arestas:
+        graph_3.insert_edge(vertices, lista, origem, destino)
+    frozen = graph_frozen.freeze_edge_list(vertices, lista)
+
+    conhecidos = [c for c in caminhos if all(v in frozen.ids for v in c)]
+    linhas = [[frozen.ids[v] for v in c] + [-1] * (4 - len(c)) for c in conhecidos]
+    assert graph_paths.valid_paths_frozen(frozen, linhas, ids=True) == graph_paths.valid_paths_frozen(frozen, conhecidos)
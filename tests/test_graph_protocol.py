@@ -0,0 +1,113 @@
+import random
+
+import pytest
+
+import graph_1
+import graph_2
+import graph_3
+import graph_protocol
+from conftest import apply_operations, random_operations
+
+
+# Representações sem arestas repetidas; a referência é a lista de arestas
+# simples de graph_3 (sem índices).
+FABRICAS = {
+    'lista_adjacencia_hash': lambda: graph_protocol.AdjacencyListGraph(graph_1.create_graph(hash_adjacencia=True)),
+    'matriz_lista': lambda: graph_protocol.AdjacencyMatrixGraph(formato="lista"),
+    'matriz_compacta': lambda: graph_protocol.AdjacencyMatrixGraph(formato="compacta"),
+    'matriz_bits': lambda: graph_protocol.AdjacencyMatrixGraph(formato="bits"),
+    'lista_arestas_hash': lambda: graph_protocol.EdgeListGraph(indexado=True),
+    'lista_arestas_compacta': lambda: graph_protocol.EdgeListGraph(compacto=True),
+}
+
+
+def _baseline():
+    return graph_protocol.EdgeListGraph(indexado=False)
+
+
+@pytest.mark.parametrize('representacao', list(FABRICAS))
+@pytest.mark.parametrize('semente', range(20))
+def test_adapters_match_edge_list(representacao, semente, capsys):
+    aleatorio = random.Random(semente)
+    operacoes = random_operations(aleatorio, quantidade=120, num_vertices=15)
+    base, grafo = _baseline(), FABRICAS[representacao]()
+    apply_operations(base, operacoes)
+    apply_operations(grafo, operacoes)
+
+    assert sorted(grafo.vertices()) == sorted(base.vertices())
+    assert sorted(grafo.edges()) == sorted(base.edges())
+    assert grafo.vertex_degrees() == base.vertex_degrees()
+    for vertice in base.vertices():
+        assert sorted(grafo.neighbors(vertice)) == sorted(base.neighbors(vertice))
+    for _ in range(30):
+        caminho = [f"v{aleatorio.randrange(15)}" for _ in range(3)]
+        assert grafo.valid_path(caminho) == base.valid_path(caminho)
+        assert grafo.edge_exists(caminho[0], caminho[1]) == base.edge_exists(caminho[0], caminho[1])
+
+
+@pytest.mark.parametrize('hash_adjacencia', [False, True])
+@pytest.mark.parametrize('semente', range(10))
+def test_adjacency_list_adapter_keeps_its_indexes(semente, hash_adjacencia, capsys):
+    grafo = graph_protocol.AdjacencyListGraph(graph_1.create_graph(hash_adjacencia, multigrafo=True))
+    operacoes = random_operations(semente, quantidade=200, num_vertices=15)
+    apply_operations(grafo, operacoes[:50])
+    grafo.vertex_degrees()
+    grafo.remove_vertex('v0')
+    apply_operations(grafo, operacoes[50:])
+
+    assert grafo.graus == graph_1.create_degree_index(grafo.grafo)
+    assert grafo.vertex_degrees() == graph_1.vertex_degrees(grafo.grafo)
+    for vertice in grafo.vertices():
+        assert sorted(graph_1.predecessors(grafo.grafo, vertice, grafo.predecessores)) == \
+            sorted(graph_1.predecessors(grafo.grafo, vertice))
+
+
+def _random_adjacency_list(semente, hash_adjacencia=False):
+    aleatorio = random.Random(semente)
+    grafo = graph_1.create_graph(hash_adjacencia)
+    for v in range(20):
+        graph_1.insert_vertex(grafo, f"v{v}")
+    for _ in range(60):
+        graph_1.insert_edge(grafo, f"v{aleatorio.randrange(20)}", f"v{aleatorio.randrange(20)}")
+    return grafo
+
+
+def _edge_set(grafo: dict):
+    return {(origem, destino) for origem in grafo for destino in graph_1.neighbors(grafo, origem)}
+
+
+@pytest.mark.parametrize('formato', ['lista', 'compacta', 'bits'])
+@pytest.mark.parametrize('semente', range(5))
+def test_list_matrix_round_trip(semente, formato, capsys):
+    grafo = _random_adjacency_list(semente)
+    matriz, vertices = graph_protocol.list_to_matrix(grafo, formato)
+    assert vertices == list(grafo)
+    for origem in grafo:
+        for destino in grafo:
+            assert graph_2.edge_exists(matriz, vertices, origem, destino) == graph_1.edge_exists(grafo, origem, destino)
+
+    de_volta = graph_protocol.matrix_to_list(matriz, vertices)
+    assert list(de_volta) == list(grafo)
+    assert _edge_set(de_volta) == _edge_set(grafo)
+
+    novos_vertices, arestas = graph_protocol.matrix_to_edges(matriz, vertices)
+    assert list(novos_vertices) == vertices
+    assert {tuple(aresta) for aresta in arestas} == _edge_set(grafo)
+
+
+@pytest.mark.parametrize('indexado, compacto', [(False, False), (True, False), (False, True)])
+@pytest.mark.parametrize('semente', range(5))
+def test_list_edges_round_trip(semente, indexado, compacto, capsys):
+    grafo = _random_adjacency_list(semente)
+    vertices, arestas = graph_protocol.list_to_edges(grafo, indexado, compacto)
+    assert list(vertices) == list(grafo)
+    assert sorted(tuple(aresta) for aresta in arestas) == sorted(_edge_set(grafo))
+    assert graph_3.vertex_degrees(vertices, arestas) == graph_3.vertex_degrees(list(grafo), [list(a) for a in _edge_set(grafo)])
+
+    de_volta = graph_protocol.edges_to_list(vertices, arestas, hash_adjacencia=True)
+    assert list(de_volta) == list(grafo)
+    assert _edge_set(de_volta) == _edge_set(grafo)
+
+    matriz, novos_vertices = graph_protocol.edges_to_matrix(vertices, arestas, "bits")
+    assert novos_vertices == list(grafo)
+    assert {(o, d) for o in novos_vertices for d in graph_2.neighbors(matriz, novos_vertices, o)} == _edge_set(grafo)
@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+import graph_1
+import graph_2
+import graph_3
+import graph_snapshot
+
+
+def _random_edge_list(semente):
+    aleatorio = random.Random(semente)
+    vertices, arestas = graph_3.create_graph()
+    for v in range(25):
+        graph_3.insert_vertex(vertices, f"vértice{v}")
+    for _ in range(80):
+        graph_3.insert_edge(vertices, arestas, f"vértice{aleatorio.randrange(25)}", f"vértice{aleatorio.randrange(25)}")
+    return vertices, arestas
+
+
+@pytest.mark.parametrize('semente', range(5))
+def test_snapshot_queries_match_edge_list(tmp_path, semente):
+    vertices, arestas = _random_edge_list(semente)
+    caminho = str(tmp_path / "grafo.bin")
+    graph_snapshot.save_edge_list(vertices, arestas, caminho)
+
+    with graph_snapshot.load_snapshot(caminho) as snapshot:
+        assert snapshot.vertices() == vertices
+        assert sorted(snapshot.edges()) == sorted(map(tuple, arestas))
+        for origem in vertices:
+            assert sorted(snapshot.neighbors(origem)) == sorted(graph_3.neighbors(vertices, arestas, origem))
+            for destino in vertices:
+                assert snapshot.edge_exists(origem, destino) == graph_3.edge_exists(arestas, origem, destino)
+        assert snapshot.neighbors('inexistente') == []
+        assert not snapshot.edge_exists('inexistente', vertices[0])
+
+
+def test_round_trip_all_modules(tmp_path, capsys):
+    vertices, arestas = _random_edge_list(1)
+    esperado = sorted(map(tuple, arestas))
+
+    caminho = str(tmp_path / "lista.bin")
+    graph_snapshot.save_edge_list(vertices, arestas, caminho)
+    grafo = graph_snapshot.load_adjacency_list(caminho, hash_adjacencia=True)
+    assert list(grafo) == vertices
+    assert sorted((o, d) for o in grafo for d in graph_1.neighbors(grafo, o)) == esperado
+
+    caminho = str(tmp_path / "adjacencia.bin")
+    graph_snapshot.save_adjacency_list(grafo, caminho)
+    matriz, novos_vertices = graph_snapshot.load_matrix(caminho, "compacta")
+    assert novos_vertices == vertices
+    assert sorted((o, d) for o in novos_vertices for d in graph_2.neighbors(matriz, novos_vertices, o)) == esperado
+
+    caminho = str(tmp_path / "matriz.bin")
+    graph_snapshot.save_matrix(matriz, novos_vertices, caminho)
+    for indexado, compacto in [(False, False), (True, False), (False, True)]:
+        lidos, lidas = graph_snapshot.load_edge_list(caminho, indexado, compacto)
+        assert list(lidos) == vertices
+        assert sorted(tuple(aresta) for aresta in lidas) == esperado
+
+
+def test_rejects_other_files(tmp_path):
+    caminho = tmp_path / "outro.bin"
+    caminho.write_bytes(b'x' * 64)
+    with pytest.raises(ValueError):
+        graph_snapshot.load_snapshot(str(caminho))
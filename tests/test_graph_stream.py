@@ -0,0 +1,80 @@
+import random
+from collections import Counter
+
+import pytest
+
+import graph_3
+import graph_stream
+
+
+def _random_edges(semente, quantidade=2000, vertices=80):
+    aleatorio = random.Random(semente)
+    return [(f"v{aleatorio.randrange(vertices)}", f"v{aleatorio.randrange(vertices)}") for _ in range(quantidade)]
+
+
+@pytest.mark.parametrize('semente', range(5))
+def test_exact_degrees_match_edge_list(semente):
+    arestas = _random_edges(semente)
+    fluxo = graph_stream.DegreeStream().consume(arestas)
+
+    # a lista de arestas de graph_3 ignora repetições; o fluxo conta todas
+    lista = [list(aresta) for aresta in arestas]
+    vertices = sorted({v for aresta in arestas for v in aresta})
+
+    resumo = fluxo.snapshot()
+    assert resumo['exato']
+    assert resumo['arestas'] == len(arestas)
+    assert resumo['graus'] == graph_3.vertex_degrees(vertices, lista)
+
+
+def test_exact_top_matches_counter():
+    arestas = _random_edges(7)
+    fluxo = graph_stream.DegreeStream(k=10).consume(arestas)
+    saida = Counter(o for o, _ in arestas)
+    entrada = Counter(d for _, d in arestas)
+    total = saida + entrada
+    assert [c for _, c in fluxo.top('saida')] == [c for _, c in saida.most_common(10)]
+    assert [c for _, c in fluxo.top('entrada')] == [c for _, c in entrada.most_common(10)]
+    assert [c for _, c in fluxo.top('total')] == [c for _, c in total.most_common(10)]
+
+
+def test_process_passes_edges_through():
+    arestas = _random_edges(3, quantidade=100)
+    fluxo = graph_stream.DegreeStream()
+    assert list(fluxo.process(iter(arestas))) == arestas
+    assert fluxo.arestas == len(arestas)
+
+
+def test_approximate_never_underestimates():
+    arestas = _random_edges(4, quantidade=3000, vertices=300)
+    fluxo = graph_stream.DegreeStream(limite_vertices=50, k=5, largura=1 << 10).consume(arestas)
+    assert not fluxo.exato
+    saida = Counter(o for o, _ in arestas)
+    entrada = Counter(d for _, d in arestas)
+    for v in {o for o, _ in arestas} | {d for _, d in arestas}:
+        grau = fluxo.degree(v)
+        assert grau['saida'] >= saida[v]
+        assert grau['entrada'] >= entrada[v]
+    assert len(fluxo.top('total')) == 5
+
+
+def test_mixed_vertex_types_in_top_k():
+    fluxo = graph_stream.DegreeStream(limite_vertices=2, k=2)
+    fluxo.consume([(1, 'x'), ('x', 1), (2, 'y'), ('y', 2), (3, 'z')])
+    assert not fluxo.exato
+    assert len(fluxo.top('total')) == 2
+
+
+def test_top_k_ties_do_not_compare_items():
+    top = graph_stream.TopK(2)
+    for item in (1, 'a', (2,), 'b', 3):
+        top.update(item, 1)
+    top.update('c', 2)
+    assert top.items()[0] == ('c', 2)
+    assert len(top.items()) == 2
+
+
+def test_top_rejects_unknown_type():
+    fluxo = graph_stream.DegreeStream().consume([('a', 'b')])
+    with pytest.raises(ValueError, match="entrada, saida, total"):
+        fluxo.top('grau')
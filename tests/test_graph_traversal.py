@@ -0,0 +1,73 @@
+import random
+from collections import deque
+
+import pytest
+
+import graph_1
+import graph_traversal
+
+
+def _random_adjacency_list(semente, num_vertices=40, quantidade=70):
+    aleatorio = random.Random(semente)
+    grafo = graph_1.create_graph()
+    for v in range(num_vertices):
+        graph_1.insert_vertex(grafo, f"v{v}")
+    for _ in range(quantidade):
+        graph_1.insert_edge(grafo, f"v{aleatorio.randrange(num_vertices)}", f"v{aleatorio.randrange(num_vertices)}")
+    return grafo
+
+
+def _distances(grafo, inicio):
+    """BFS de referência direto sobre as listas de vizinhos de graph_1."""
+    distancias = {inicio: 0}
+    fila = deque([inicio])
+    while fila:
+        u = fila.popleft()
+        for v in graph_1.neighbors(grafo, u):
+            if v not in distancias:
+                distancias[v] = distancias[u] + 1
+                fila.append(v)
+    return distancias
+
+
+@pytest.mark.parametrize('semente', range(10))
+def test_searches_match_reference_bfs(semente, capsys):
+    grafo = _random_adjacency_list(semente)
+    frozen = graph_traversal.as_traversable(grafo)
+    assert graph_traversal.as_traversable(frozen) is frozen
+
+    for inicio in list(grafo)[:10]:
+        esperado = _distances(grafo, inicio)
+        assert dict(graph_traversal.bfs(frozen, inicio)) == esperado
+        visitados = list(graph_traversal.dfs(frozen, inicio))
+        assert visitados[0] == inicio
+        assert sorted(visitados) == sorted(esperado)
+        assert graph_traversal.k_hop(frozen, inicio, 2) == {v: d for v, d in esperado.items() if 0 < d <= 2}
+        for destino in grafo:
+            assert graph_traversal.is_reachable(frozen, inicio, destino) == (destino in esperado)
+
+
+def test_reverse_is_cached_and_inverts_edges():
+    grafo = _random_adjacency_list(3)
+    frozen = graph_traversal.as_traversable(grafo)
+    reverso = graph_traversal.reverse(frozen)
+    assert graph_traversal.reverse(frozen) is reverso
+    assert reverso.reverso is frozen
+    assert sorted(reverso.edges()) == sorted((d, o) for o, d in frozen.edges())
+
+
+def test_unknown_vertices():
+    frozen = graph_traversal.as_traversable({'a': ['b'], 'b': []})
+    assert list(graph_traversal.bfs(frozen, 'x')) == []
+    assert list(graph_traversal.dfs(frozen, 'x')) == []
+    assert not graph_traversal.is_reachable(frozen, 'a', 'x')
+    assert graph_traversal.is_reachable(frozen, 'a', 'a')
+    assert not graph_traversal.is_reachable(frozen, 'b', 'a')
+
+
+def test_deep_path_does_not_recurse():
+    grafo = {f"v{i}": [f"v{i + 1}"] for i in range(5000)}
+    grafo["v5000"] = []
+    frozen = graph_traversal.as_traversable(grafo)
+    assert sum(1 for _ in graph_traversal.dfs(frozen, "v0")) == 5001
+    assert graph_traversal.is_reachable(frozen, "v0", "v5000")